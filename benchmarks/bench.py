@@ -0,0 +1,423 @@
+"""
+JeetLo Factory Benchmarks
+=========================
+
+Reproducible timings for the factory's hot paths, so every optimization
+can be measured against the commit before it.
+
+Fixtures are synthetic and generated fresh in a temp directory:
+- Large media files (seeded random bytes) for hashing
+- MP3/MP4 media from ffmpeg's lavfi sources (sine, testsrc2)
+- Reels with valid manifests, including deep (many-step) chains
+- Long audio scripts and reel.py files for the text validators
+
+Benchmarks:
+    hash.file               get_file_hash on one large file
+    hash.directory          get_directory_hash on a media directory
+    hash.directory_serial   the same with one worker (thread-pool speedup baseline)
+    validate.pronunciation  PronunciationValidator on a long script
+    validate.text           TextValidator on a long reel.py
+    validate.chain          ChainValidator on a deep manifest
+    ci.chain_only           ci.main --chain-only over N reels
+    ci.full                 ci.main over reels with real media (needs ffmpeg)
+    reel.combine            Reel.combine on generated A/V (needs ffmpeg)
+
+Usage:
+    python benchmarks/bench.py
+    python benchmarks/bench.py --quick --only hash
+    python benchmarks/bench.py --compare benchmarks/results/abc1234.json
+
+Results go to benchmarks/results/<commit>.json unless --output is given.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from jeetlo_factory import ci  # noqa: E402
+from jeetlo_factory.manifest import (  # noqa: E402
+    Manifest, MANIFEST_FILENAME, get_directory_hash, get_file_hash
+)
+from jeetlo_factory.reel import Reel  # noqa: E402
+from jeetlo_factory.validators import ChainValidator, PronunciationValidator  # noqa: E402
+from jeetlo_factory.validators.text_validator import TextValidator  # noqa: E402
+
+
+SEED = 20260103
+RESULTS_DIR = ROOT / "benchmarks" / "results"
+
+SCRIPT_SENTENCES = [
+    "Mitochondria cell ka powerhouse hai, yaad rakhiye.",
+    "A-T-P energy currency hai aur Krebs cycle matrix mein hoti hai.",
+    "D-N-A double helix right-handed hota hai, twenty base pairs per turn nahi.",
+    "N-E-E-T mein ye question har saal aata hai.",
+    "Photosynthesis chloroplast mein hota hai, respiration mitochondria mein.",
+]
+
+
+# ─── Fixtures ──────────────────────────────────────────────────────────────
+
+
+def have_ffmpeg() -> bool:
+    return shutil.which("ffmpeg") is not None and shutil.which("ffprobe") is not None
+
+
+def ffmpeg(*args: str):
+    subprocess.run(["ffmpeg", "-v", "error", "-y", *args], check=True)
+
+
+def write_random_file(path: Path, size_mb: int, seed: int = SEED):
+    """Seeded pseudo-random bytes (incompressible, like encoded media)."""
+    rng = random.Random(seed)
+    chunk = 1024 * 1024
+    with open(path, "wb") as f:
+        for _ in range(size_mb):
+            f.write(rng.getrandbits(chunk * 8).to_bytes(chunk, "little"))
+
+
+def make_audio(audio_dir: Path, segments: int, seconds: float) -> List[Dict[str, Any]]:
+    """One sine-tone MP3 per segment, combined_audio.mp3 and timings.json."""
+    audio_dir.mkdir(parents=True, exist_ok=True)
+    timings = []
+    start = 0.0
+    for i in range(segments):
+        seg_id = f"{i + 1:02d}_segment"
+        ffmpeg("-f", "lavfi", "-i", f"sine=frequency={220 + 40 * i}:duration={seconds}",
+               "-c:a", "libmp3lame", "-b:a", "128k", str(audio_dir / f"{seg_id}.mp3"))
+        timings.append({
+            "id": seg_id, "file": f"{seg_id}.mp3", "text": SCRIPT_SENTENCES[i % len(SCRIPT_SENTENCES)],
+            "duration": seconds, "startTime": start, "endTime": start + seconds
+        })
+        start += seconds
+
+    total = seconds * segments
+    ffmpeg("-f", "lavfi", "-i", f"sine=frequency=440:duration={total}",
+           "-c:a", "libmp3lame", "-b:a", "128k", str(audio_dir / "combined_audio.mp3"))
+    with open(audio_dir / "timings.json", "w") as f:
+        json.dump(timings, f, indent=2)
+    return timings
+
+
+def make_video(path: Path, seconds: float, size: str = "1080x1920"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    ffmpeg("-f", "lavfi", "-i", f"testsrc2=size={size}:rate=30:duration={seconds}",
+           "-c:v", "libx264", "-preset", "ultrafast", "-pix_fmt", "yuv420p", str(path))
+
+
+def write_manifest(reel_path: Path, reel_id: str, extra_steps: int = 0) -> Manifest:
+    """A manifest with the four required steps and ``extra_steps`` more, chained."""
+    reel_path.mkdir(parents=True, exist_ok=True)
+    manifest = Manifest(str(reel_path))
+    manifest.data = {
+        "version": "1.0.0",
+        "reel_id": reel_id,
+        "subject": "biology",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "steps": [],
+        "status": "in_progress"
+    }
+
+    audio_dir = reel_path / "audio"
+    video_files = sorted((reel_path / "media").rglob("*.mp4")) if (reel_path / "media").exists() else []
+    final = reel_path / "final.mp4"
+
+    hashes = {
+        "create": f"{random.Random(reel_id).getrandbits(256):064x}",
+        "audio": get_directory_hash(str(audio_dir), [".mp3", ".json"]) if audio_dir.exists() else "0" * 64,
+        "video": get_file_hash(str(video_files[0])) if video_files else "1" * 64,
+        "combine": get_file_hash(str(final)) if final.exists() else "2" * 64,
+    }
+    metadata = {
+        "video": {"class_name": "BenchReel", "video_path": str(video_files[0]) if video_files else "",
+                  "video_hash": hashes["video"]},
+    }
+
+    previous = None
+    names = ["create", "audio", "video"] + [f"extra_{i}" for i in range(extra_steps)] + ["combine"]
+    for name in names:
+        output = hashes.get(name, f"{random.Random(name + reel_id).getrandbits(256):064x}")
+        manifest.data["steps"].append({
+            "step_name": name,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "input_hash": previous,
+            "output_hash": output,
+            "git_commit": "0" * 40,
+            "git_has_uncommitted_changes": False,
+            "metadata": metadata.get(name, {})
+        })
+        previous = output
+
+    manifest.save()
+    return manifest
+
+
+def long_script(sentences: int) -> str:
+    return " ".join(SCRIPT_SENTENCES[i % len(SCRIPT_SENTENCES)] for i in range(sentences))
+
+
+def long_reel_code(segments: int) -> str:
+    lines = ["from manim import *", "", "class BenchReel(Scene):", "    def construct(self):"]
+    for i in range(segments):
+        lines += [
+            f"        title_{i} = Text(\"Segment {i}: Mitochondria\", font_size=48)",
+            f"        note_{i} = Text(\"याद रखो\", font_size=36).next_to(title_{i}, DOWN)",
+            f"        self.play(Write(title_{i}), FadeIn(note_{i}))",
+            "        self.wait(1)",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+# ─── Harness ───────────────────────────────────────────────────────────────
+
+
+def time_it(fn: Callable[[], Any], repeats: int, setup: Optional[Callable[[], Any]] = None) -> Dict[str, Any]:
+    """Run fn ``repeats`` times (after one warm-up) and summarise wall times."""
+    if setup:
+        setup()
+    fn()
+    times = []
+    for _ in range(repeats):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return {
+        "repeats": repeats,
+        "min": round(min(times), 6),
+        "median": round(statistics.median(times), 6),
+        "mean": round(statistics.fmean(times), 6),
+        "max": round(max(times), 6)
+    }
+
+
+def run_ci(args: List[str]):
+    """ci.main in-process, quietly, swallowing its sys.exit."""
+    argv = sys.argv
+    sys.argv = ["jeetlo-validate", *args]
+    try:
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            ci.main()
+    except SystemExit:
+        pass
+    finally:
+        sys.argv = argv
+
+
+def git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, cwd=ROOT)
+        return out.stdout.strip() or None
+    except OSError:
+        return None
+
+
+class Suite:
+    """Builds fixtures under ``workdir`` and runs the selected benchmarks."""
+
+    def __init__(self, workdir: Path, quick: bool = False, only: Optional[List[str]] = None):
+        self.workdir = workdir
+        self.quick = quick
+        self.only = only
+        self.repeats = 3 if quick else 7
+        self.params = {
+            "large_file_mb": 64 if quick else 512,
+            "directory_files": 20 if quick else 100,
+            "directory_file_mb": 1 if quick else 4,
+            "script_sentences": 500 if quick else 5000,
+            "reel_segments": 100 if quick else 1000,
+            "chain_steps": 200 if quick else 2000,
+            "ci_reels": 50 if quick else 500,
+            "media_reels": 2 if quick else 5,
+            "media_seconds": 5 if quick else 30,
+        }
+        self.results: Dict[str, Any] = {}
+
+    def selected(self, name: str) -> bool:
+        """True if ``name`` matches an --only prefix, or is a group containing one."""
+        return not self.only or any(
+            name.startswith(prefix) or prefix.startswith(name + ".") for prefix in self.only
+        )
+
+    def record(self, name: str, fn: Callable[[], Any], setup: Optional[Callable[[], Any]] = None, **extra):
+        if not self.selected(name):
+            return
+        print(f"  {name} ...", end="", flush=True)
+        result = time_it(fn, self.repeats, setup)
+        result.update(extra)
+        self.results[name] = result
+        print(f" median {result['median'] * 1000:.1f} ms")
+
+    def skip(self, name: str, reason: str):
+        if self.selected(name):
+            self.results[name] = {"skipped": reason}
+            print(f"  {name} ... skipped ({reason})")
+
+    def run(self) -> Dict[str, Any]:
+        p = self.params
+
+        if self.selected("hash"):
+            big = self.workdir / "large.bin"
+            write_random_file(big, p["large_file_mb"])
+            self.record("hash.file", lambda: get_file_hash(str(big)), size_mb=p["large_file_mb"])
+
+            media_dir = self.workdir / "media_dir"
+            media_dir.mkdir()
+            for i in range(p["directory_files"]):
+                write_random_file(media_dir / f"frame_{i:04d}.mp3", p["directory_file_mb"], seed=SEED + i)
+            self.record("hash.directory", lambda: get_directory_hash(str(media_dir)),
+                        files=p["directory_files"], size_mb=p["directory_files"] * p["directory_file_mb"])
+            self.record("hash.directory_serial", lambda: get_directory_hash(str(media_dir), workers=1),
+                        files=p["directory_files"], size_mb=p["directory_files"] * p["directory_file_mb"])
+
+        script = long_script(p["script_sentences"])
+        self.record("validate.pronunciation", lambda: PronunciationValidator(script).validate(),
+                    chars=len(script))
+
+        code = long_reel_code(p["reel_segments"])
+        self.record("validate.text", lambda: TextValidator(code).validate(), chars=len(code))
+
+        if self.selected("validate.chain"):
+            deep = self.workdir / "deep-reel"
+            write_manifest(deep, "bio-99-deep", extra_steps=p["chain_steps"])
+            self.record("validate.chain", lambda: ChainValidator(str(deep)).validate(),
+                        steps=p["chain_steps"] + 4)
+
+        if self.selected("ci.chain_only"):
+            reels_dir = self.workdir / "ci-reels"
+            for i in range(p["ci_reels"]):
+                write_manifest(reels_dir / f"bio-{i:03d}-bench", f"bio-{i:03d}-bench", extra_steps=4)
+            self.record("ci.chain_only", lambda: run_ci([str(reels_dir), "--chain-only"]), reels=p["ci_reels"])
+
+        if not have_ffmpeg():
+            for name in ("ci.full", "reel.combine"):
+                self.skip(name, "ffmpeg/ffprobe not found")
+            return self.results
+
+        if self.selected("ci.full") or self.selected("reel.combine"):
+            media_reels = self.workdir / "media-reels"
+            seconds = p["media_seconds"]
+            for i in range(p["media_reels"]):
+                reel_path = media_reels / f"bio-{i:03d}-media"
+                make_audio(reel_path / "audio", segments=5, seconds=seconds / 5)
+                make_video(reel_path / "media" / "videos" / "reel" / "1920p60" / "BenchReel.mp4", seconds)
+                make_video(reel_path / "final.mp4", seconds)
+                write_manifest(reel_path, reel_path.name)
+
+            self.record("ci.full", lambda: run_ci([str(media_reels)]),
+                        reels=p["media_reels"], media_seconds=seconds)
+
+            combine_reel = media_reels / "bio-000-media"
+            manifest_path = combine_reel / MANIFEST_FILENAME
+            pristine = manifest_path.read_text()
+
+            def reset_manifest():
+                manifest_path.write_text(pristine)
+                # combine() appends a step after "combine"; start from "video"
+                manifest = Manifest.load(str(combine_reel))
+                manifest.data["steps"] = [s for s in manifest.data["steps"] if s["step_name"] != "combine"]
+                manifest.save()
+
+            def combine():
+                with contextlib.redirect_stdout(io.StringIO()):
+                    Reel.load(str(combine_reel)).combine()
+
+            self.record("reel.combine", combine, setup=reset_manifest, media_seconds=seconds)
+
+        return self.results
+
+
+def compare(current: Dict[str, Any], previous: Dict[str, Any]):
+    print(f"\nCompared with {previous.get('commit') or 'previous run'}:")
+    for name, result in current["benchmarks"].items():
+        before = previous.get("benchmarks", {}).get(name, {})
+        if "median" not in result or "median" not in before:
+            continue
+        ratio = result["median"] / before["median"] if before["median"] else float("inf")
+        marker = "faster" if ratio < 0.95 else "slower" if ratio > 1.05 else "same"
+        print(f"  {name:<24} {before['median'] * 1000:>10.1f} ms -> {result['median'] * 1000:>10.1f} ms "
+              f"({ratio:.2f}x, {marker})")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="JeetLo Factory benchmarks"
+    )
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="Smaller fixtures and fewer repeats"
+    )
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        metavar="PREFIX",
+        help="Run only benchmarks whose names start with these prefixes (e.g. hash ci)"
+    )
+    parser.add_argument(
+        "--output",
+        help="Results JSON path (default: benchmarks/results/<commit>.json)"
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="PATH",
+        help="Previous results JSON to compare medians against"
+    )
+    parser.add_argument(
+        "--keep",
+        action="store_true",
+        help="Keep the fixture directory for inspection"
+    )
+
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="jeetlo-bench-"))
+    print(f"Fixtures: {workdir}")
+    try:
+        suite = Suite(workdir, quick=args.quick, only=args.only)
+        benchmarks = suite.run()
+    finally:
+        if not args.keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "quick": args.quick,
+        "params": suite.params,
+        "benchmarks": benchmarks
+    }
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{commit or 'unknown'}{'-quick' if args.quick else ''}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✓ Results: {output}")
+
+    if args.compare:
+        with open(args.compare, "r") as f:
+            compare(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
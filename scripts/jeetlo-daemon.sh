@@ -4,7 +4,8 @@
 # ═══════════════════════════════════════════════════════════════════════════
 #
 # This script runs continuously on your local machine and:
-# 1. Polls GitHub every 30 seconds for new pending requests
+# 1. Polls GitHub every 30 seconds for new pending requests (state kept in
+#    .jeetlo_requests.db; only changed request files are re-read)
 # 2. Automatically runs jeetlo.sh for each new request
 # 3. Pushes results back to GitHub
 #
@@ -20,7 +21,12 @@ set -e
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 REPO_DIR="$(dirname "$SCRIPT_DIR")"
 POLL_INTERVAL=30  # seconds
-PROCESSED_FILE="$REPO_DIR/.processed_requests"
+
+# Request state store (.jeetlo_requests.db): sync, claim, finish
+request_state() {
+    PYTHONPATH="$REPO_DIR/src${PYTHONPATH:+:$PYTHONPATH}" python3 -m jeetlo_factory.state \
+        --requests "$REPO_DIR/requests" "$@"
+}
 
 # Colors
 RED='\033[0;31m'
@@ -46,8 +52,8 @@ log_warning() {
     echo -e "${YELLOW}[$(date '+%H:%M:%S')] ⚠${NC} $1"
 }
 
-# Ensure processed file exists
-touch "$PROCESSED_FILE"
+# A request left running by a previous daemon that died goes back in the queue
+request_state requeue >/dev/null
 
 # Banner
 echo ""
@@ -74,70 +80,51 @@ while true; do
         continue
     }
 
-    # Find pending requests
-    NEW_REQUESTS=0
-    for request_file in requests/*.json; do
-        # Skip template and non-existent
-        [[ "$request_file" == "requests/_template.json" ]] && continue
-        [[ ! -f "$request_file" ]] && continue
+    # Re-read only request files that changed, then work through the queue
+    request_state sync >/dev/null || log_warning "Request sync failed"
 
-        # Get reel ID
-        REEL_ID=$(basename "$request_file" .json)
-
-        # Check if already processed
-        if grep -q "^${REEL_ID}$" "$PROCESSED_FILE" 2>/dev/null; then
-            continue
+    NEW_REQUESTS=0
+    while IFS=$'\t' read -r REEL_ID SUBJECT TOPIC < <(request_state claim --no-sync); do
+        [[ -z "$REEL_ID" ]] && break
+        request_file="requests/$REEL_ID.json"
+        NEW_REQUESTS=$((NEW_REQUESTS + 1))
+
+        echo ""
+        log_success "Found new request: ${BLUE}$REEL_ID${NC}"
+        echo -e "  Subject: ${CYAN}$SUBJECT${NC}"
+        echo -e "  Topic:   ${CYAN}$TOPIC${NC}"
+        echo ""
+
+        # Run jeetlo.sh
+        log "Starting execution..."
+        echo ""
+
+        if "$SCRIPT_DIR/jeetlo.sh" "$REEL_ID" < /dev/null; then
+            log_success "Completed: $REEL_ID"
+            request_state finish "$REEL_ID" completed >/dev/null || log_warning "Could not record completion of $REEL_ID"
+
+            # Update request status
+            [[ -f "$request_file" ]] && jq '.status = "completed"' "$request_file" > "$request_file.tmp" && mv "$request_file.tmp" "$request_file"
+
+            # Push results
+            log "Pushing results to GitHub..."
+            git add -A
+            git commit -m "Complete reel: $REEL_ID" --quiet 2>/dev/null || true
+            git push origin main --quiet 2>/dev/null || log_warning "Push failed, will retry"
+
+        else
+            log_error "Failed: $REEL_ID"
+            request_state finish "$REEL_ID" failed >/dev/null || log_warning "Could not record failure of $REEL_ID"
+
+            # Update request status to failed
+            [[ -f "$request_file" ]] && jq '.status = "failed"' "$request_file" > "$request_file.tmp" && mv "$request_file.tmp" "$request_file"
+
+            git add -A
+            git commit -m "Failed reel: $REEL_ID" --quiet 2>/dev/null || true
+            git push origin main --quiet 2>/dev/null || true
         fi
 
-        # Check status
-        STATUS=$(jq -r '.status // "pending"' "$request_file" 2>/dev/null)
-
-        if [[ "$STATUS" == "pending" ]]; then
-            NEW_REQUESTS=$((NEW_REQUESTS + 1))
-
-            echo ""
-            log_success "Found new request: ${BLUE}$REEL_ID${NC}"
-
-            # Extract info
-            SUBJECT=$(jq -r '.subject // "unknown"' "$request_file")
-            TOPIC=$(jq -r '.topic // "unknown"' "$request_file")
-
-            echo -e "  Subject: ${CYAN}$SUBJECT${NC}"
-            echo -e "  Topic:   ${CYAN}$TOPIC${NC}"
-            echo ""
-
-            # Run jeetlo.sh
-            log "Starting execution..."
-            echo ""
-
-            if "$SCRIPT_DIR/jeetlo.sh" "$REEL_ID"; then
-                log_success "Completed: $REEL_ID"
-
-                # Mark as processed
-                echo "$REEL_ID" >> "$PROCESSED_FILE"
-
-                # Update request status
-                jq '.status = "completed"' "$request_file" > "$request_file.tmp" && mv "$request_file.tmp" "$request_file"
-
-                # Push results
-                log "Pushing results to GitHub..."
-                git add -A
-                git commit -m "Complete reel: $REEL_ID" --quiet 2>/dev/null || true
-                git push origin main --quiet 2>/dev/null || log_warning "Push failed, will retry"
-
-            else
-                log_error "Failed: $REEL_ID"
-
-                # Update request status to failed
-                jq '.status = "failed"' "$request_file" > "$request_file.tmp" && mv "$request_file.tmp" "$request_file"
-
-                git add -A
-                git commit -m "Failed reel: $REEL_ID" --quiet 2>/dev/null || true
-                git push origin main --quiet 2>/dev/null || true
-            fi
-
-            echo ""
-        fi
+        echo ""
     done
 
     if [[ $NEW_REQUESTS -eq 0 ]]; then
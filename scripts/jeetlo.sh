@@ -147,6 +147,12 @@ print_header() {
 }
 
 print_step() {
+    STEP_STARTED_AT=$(date +%s)
+    # A step's perf file belongs to this run only - on --resume a step that
+    # isn't re-run under perf_run must not pick up the previous run's metrics
+    if [ -n "${WORK_DIR:-}" ]; then
+        rm -f "$WORK_DIR"/.perf/*.json
+    fi
     echo -e "${CYAN}┌─────────────────────────────────────────────────────────────────────────────┐${NC}"
     echo -e "${CYAN}│ STEP $1: $2${NC}"
     echo -e "${CYAN}└─────────────────────────────────────────────────────────────────────────────┘${NC}"
@@ -164,49 +170,40 @@ print_warning() {
     echo -e "${YELLOW}⚠ $1${NC}"
 }
 
-# Compute SHA256 hash of a file
-compute_hash() {
-    shasum -a 256 "$1" | cut -d' ' -f1
+# Run python3 with the in-repo jeetlo_factory package importable
+factory_python() {
+    PYTHONPATH="$FACTORY_DIR/src${PYTHONPATH:+:$PYTHONPATH}" python3 "$@"
+}
+
+# The background color reels of $SUBJECT are rendered with (SUBJECT_CONFIG)
+subject_background() {
+    echo "$SUBJECT_CONFIG" | jq -r --arg s "$SUBJECT" '.[$s].background'
+}
+
+# Run a command under jeetlo_factory.perf, recording wall/CPU time,
+# child RSS and IO to $WORK_DIR/.perf/<step>.json for add_chain_step
+perf_run() {
+    local step_name="$1"
+    shift
+    mkdir -p "$WORK_DIR/.perf"
+    factory_python -m jeetlo_factory.perf run --json "$WORK_DIR/.perf/$step_name.json" -- "$@"
 }
 
-# Add step to proof chain
+# Add step to proof chain: hashes the output (via the chain's hash cache),
+# links it to the previous step and appends it, in one process. Attaches
+# $WORK_DIR/.perf/<step>.json and the wall time since print_step.
 add_chain_step() {
     local step_name="$1"
     local output_file="$2"
-    local chain_file="$WORK_DIR/.proof_chain.json"
-
-    local prev_hash=$(jq -r '.steps[-1].output_hash // "genesis"' "$chain_file")
-    local output_hash=$(compute_hash "$output_file")
-    local timestamp=$(date -u +"%Y-%m-%dT%H:%M:%SZ")
-
-    jq --arg step "$step_name" \
-       --arg input "$prev_hash" \
-       --arg output "$output_hash" \
-       --arg time "$timestamp" \
-       '.steps += [{"step": $step, "input_hash": $input, "output_hash": $output, "timestamp": $time}]' \
-       "$chain_file" > "$chain_file.tmp" && mv "$chain_file.tmp" "$chain_file"
 
-    echo "$output_hash"
+    factory_python -m jeetlo_factory.chain add "$WORK_DIR/.proof_chain.json" "$step_name" "$output_file" \
+        --perf "$WORK_DIR/.perf/$step_name.json" \
+        ${STEP_STARTED_AT:+--started-at "$STEP_STARTED_AT"}
 }
 
 # Validate chain integrity
 validate_chain() {
-    local chain_file="$WORK_DIR/.proof_chain.json"
-
-    python3 << EOF
-import json
-with open('$chain_file') as f:
-    chain = json.load(f)
-
-prev_output = None
-for step in chain['steps']:
-    if prev_output and step['input_hash'] != prev_output:
-        print(f"CHAIN BROKEN at {step['step']}: expected {prev_output[:16]}..., got {step['input_hash'][:16]}...")
-        exit(1)
-    prev_output = step['output_hash']
-
-print(f"Chain valid: {len(chain['steps'])} steps")
-EOF
+    factory_python -m jeetlo_factory.chain verify "$WORK_DIR/.proof_chain.json"
 }
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -221,21 +218,8 @@ setup_and_auth() {
     mkdir -p "$WORK_DIR/audio"
 
     # Initialize proof chain if not resuming
-    if [ ! -f "$WORK_DIR/.proof_chain.json" ]; then
-        local genesis_hash=$(echo -n "jeetlo-$REEL_ID-$(date +%s)" | shasum -a 256 | cut -d' ' -f1)
-        cat > "$WORK_DIR/.proof_chain.json" << EOF
-{
-  "reel_id": "$REEL_ID",
-  "subject": "$SUBJECT",
-  "created_at": "$(date -u +"%Y-%m-%dT%H:%M:%SZ")",
-  "genesis_hash": "$genesis_hash",
-  "steps": []
-}
-EOF
-        print_success "Proof chain initialized: ${genesis_hash:0:16}..."
-    else
-        print_success "Resuming existing proof chain"
-    fi
+    factory_python -m jeetlo_factory.chain init "$WORK_DIR/.proof_chain.json" \
+        --reel-id "$REEL_ID" --subject "$SUBJECT"
 
     # Save embedded knowledge
     echo "$VOICE_SETTINGS" > "$WORK_DIR/voice_settings.json"
@@ -643,40 +627,20 @@ generate_audio() {
         sleep 0.3
     done
 
-    # Generate timings.json
+    # Generate timings.json and the concat list in audio_script order
+    # (exact cumulative times; replaces the per-file jq/bc loop)
     echo "Generating timings..."
-    local timings="[]"
-    local current_time=0
-
-    for mp3 in $(ls "$WORK_DIR/audio/"*.mp3 | sort); do
-        local id=$(basename "$mp3" .mp3)
-        local duration=$(ffprobe -i "$mp3" -show_entries format=duration -v quiet -of csv="p=0")
-        local text=$(jq -r --arg id "$id" '.[] | select(.id == $id) | .text' "$WORK_DIR/audio_script.json")
-
-        timings=$(echo "$timings" | jq \
-            --arg id "$id" \
-            --arg text "$text" \
-            --argjson dur "$duration" \
-            --argjson start "$current_time" \
-            --argjson end "$(echo "$current_time + $duration" | bc)" \
-            '. += [{id: $id, text: $text, duration: $dur, startTime: $start, endTime: $end}]')
-
-        current_time=$(echo "$current_time + $duration" | bc)
-    done
-
-    echo "$timings" | jq '.' > "$WORK_DIR/audio/timings.json"
+    rm -f "$WORK_DIR/audio/combined_audio.mp3"
+    if ! factory_python -m jeetlo_factory.timings "$WORK_DIR/audio_script.json" "$WORK_DIR/audio" \
+        --concat "$WORK_DIR/audio/concat.txt"; then
+        print_error "Failed to build timings.json"
+        exit 1
+    fi
 
     # Combine audio
     echo ""
     echo "Combining segments..."
-    # Remove old combined file first, then list segment files (exclude combined_audio.mp3)
-    rm -f "$WORK_DIR/audio/combined_audio.mp3"
-    # Use full paths in concat.txt so ffmpeg can find files from any working directory
-    ls "$WORK_DIR/audio/"*.mp3 | grep -v combined_audio | sort | while read f; do
-        echo "file '$f'"
-    done > "$WORK_DIR/audio/concat.txt"
-
-    ffmpeg -y -f concat -safe 0 -i "$WORK_DIR/audio/concat.txt" -c copy "$WORK_DIR/audio/combined_audio.mp3" 2>/dev/null
+    perf_run "generate_audio" ffmpeg -y -f concat -safe 0 -i "$WORK_DIR/audio/concat.txt" -c copy "$WORK_DIR/audio/combined_audio.mp3" 2>/dev/null
     rm "$WORK_DIR/audio/concat.txt"
 
     local total_duration=$(ffprobe -i "$WORK_DIR/audio/combined_audio.mp3" -show_entries format=duration -v quiet -of csv="p=0")
@@ -1806,49 +1770,44 @@ qa_frame_by_frame() {
         return 0
     fi
 
-    echo "Extracting frames for visual inspection (0.5 fps)..."
-    mkdir -p "$WORK_DIR/qa_frames"
-
-    # Extract at 0.5 fps (1 frame every 2 seconds)
-    ffmpeg -y -i "$video" -vf "fps=0.5" "$WORK_DIR/qa_frames/frame_%02d.png" 2>/dev/null
+    echo "Decoding frames in memory for visual QA (adaptive sampling, single pass)..."
 
-    local frame_count=$(ls "$WORK_DIR/qa_frames"/frame_*.png 2>/dev/null | wc -l)
-    echo "Extracted $frame_count frames"
+    local frame_qa_ok=true
+    factory_python -m jeetlo_factory.qa "$video" --subject "$SUBJECT" \
+        --background "$(subject_background)" \
+        --adaptive --timings "$WORK_DIR/audio/timings.json" --budget 60 \
+        --json "$WORK_DIR/qa_frame_checks.json" || frame_qa_ok=false
 
-    local issues=()
-
-    # CHECK 1: First frame (Hook) - should have engaging visual
-    if [ -f "$WORK_DIR/qa_frames/frame_01.png" ]; then
-        print_success "✅ Frame 1 (Hook) extracted"
-    fi
+    local frame_count=$(jq -r '.frame_count // 0' "$WORK_DIR/qa_frame_checks.json" 2>/dev/null || echo 0)
+    echo "Analysed $frame_count frames"
 
-    # CHECK 2: Last few frames - should show CTA
-    local last_frame=$(ls "$WORK_DIR/qa_frames"/frame_*.png 2>/dev/null | tail -1)
-    if [ -n "$last_frame" ]; then
-        echo "Last frame: $last_frame (should show CTA)"
-        print_success "✅ CTA frame extracted"
+    # CHECK 1 + 2: Hook/CTA blank frames, edges, safe zone, contrast, watermark
+    if [ "$frame_qa_ok" = true ]; then
+        print_success "✅ Pixel checks passed (hook, CTA, edges, watermark)"
+    else
+        print_warning "Frame checks reported issues (see $WORK_DIR/qa_frame_checks.json)"
     fi
 
-    # CHECK 3: Content within bounds (use Python for actual pixel analysis if needed)
+    # CHECK 3: Edges, safe zone, contrast and watermark are measured on
+    # the decoded pixels; only the judgement calls remain manual
     echo ""
     echo "Manual QA checklist:"
     echo "  [ ] Hook frame is visually engaging"
-    echo "  [ ] No text cut off at edges"
     echo "  [ ] No overlapping text"
     echo "  [ ] Colors are vibrant"
     echo "  [ ] CTA slide has flame + JeetLo + pricing"
-    echo "  [ ] Watermark visible in bottom-right"
 
     # Save QA result
     cat > "$WORK_DIR/qa_frames.json" << EOF
 {
   "frame_count": $frame_count,
-  "frames_dir": "$WORK_DIR/qa_frames",
+  "frame_checks": "$WORK_DIR/qa_frame_checks.json",
+  "automated_checks_passed": $frame_qa_ok,
   "manual_review_required": true
 }
 EOF
 
-    print_success "Frames ready for visual inspection at: $WORK_DIR/qa_frames/"
+    print_success "Frame QA report: $WORK_DIR/qa_frame_checks.json"
 }
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -1940,18 +1899,28 @@ police_frame_overlap() {
 
     local frames_dir="$WORK_DIR/frames"
     local threshold=95
+    local layout_log="$WORK_DIR/.layout_log.jsonl"
+    local result
+    local exit_code=0
+
+    if [ -f "$layout_log" ]; then
+        # Bounding boxes recorded by JeetLoReelMixin during render - no frames needed
+        echo "Checking text overlaps from the Manim layout log..."
+        result=$(factory_python -m jeetlo_factory.layout "$layout_log" \
+            --json "$WORK_DIR/police_frame_overlap.json" 2>&1) || exit_code=$?
+    else
+        if [ ! -d "$frames_dir" ]; then
+            print_warning "No layout log, extracting frames for the overlap agent..."
+            mkdir -p "$frames_dir"
+            ffmpeg -y -i "$WORK_DIR/final.mp4" -vf "fps=0.5" "$frames_dir/frame_%03d.png" 2>/dev/null
+        fi
 
-    if [ ! -d "$frames_dir" ]; then
-        print_warning "Frames not extracted yet, extracting now..."
-        mkdir -p "$frames_dir"
-        ffmpeg -y -i "$WORK_DIR/final.mp4" -vf "fps=0.5" "$frames_dir/frame_%03d.png" 2>/dev/null
-    fi
-
-    echo "Creating fresh POLICE-1 agent instance..."
+        echo "Creating fresh POLICE-1 agent instance..."
 
-    # Run STATELESS agent - fresh instance with unique ID
-    local result=$(python3 -c "
-import sys
+        # Run STATELESS agent ONCE - fresh instance with unique ID,
+        # the same run produces both the verdict and the saved JSON
+        result=$(python3 -c "
+import sys, json
 sys.path.insert(0, '/Users/pran/Projects/libraries/manim-edu')
 from manim_edu.qa import FrameOverlapAgent
 
@@ -1963,27 +1932,19 @@ print(f'Agent ID: {agent.agent_id}')
 result = agent.run(frames_dir='$frames_dir', threshold=$threshold)
 
 # Immutable result
+with open('$WORK_DIR/police_frame_overlap.json', 'w') as f:
+    json.dump(result.to_dict(), f, indent=2)
+
 print('PASSED' if result.passed else 'FAILED')
 print(f'Bounty: {result.bounty_earned} points')
 print(f'Issues: {result.issues_count}')
 print(f'Run ID: {result.run_id}')
 exit(0 if result.passed else 1)
-" 2>&1)
+" 2>&1) || exit_code=$?
+    fi
 
-    local exit_code=$?
     echo "$result"
 
-    # Save immutable result
-    python3 -c "
-import sys, json
-sys.path.insert(0, '/Users/pran/Projects/libraries/manim-edu')
-from manim_edu.qa import FrameOverlapAgent
-
-agent = FrameOverlapAgent()
-result = agent.run(frames_dir='$frames_dir', threshold=$threshold)
-print(json.dumps(result.to_dict(), indent=2))
-" > "$WORK_DIR/police_frame_overlap.json" 2>/dev/null
-
     if [ $exit_code -eq 0 ]; then
         print_success "🚨 POLICE-1 PASSED: No overlapping text detected"
         return 0
@@ -2344,11 +2305,28 @@ fi
 
 echo "Using Python: $PYTHON"
 echo "Scene: $SCENE_NAME"
-$PYTHON -m manim render -qh --fps 30 -r 1080,1920 reel.py "$SCENE_NAME" 2>&1
+
+# Cheap gate: run construct() with rendering disabled and check timing/layout
+if [ -n "$JEETLO_FACTORY_SRC" ]; then
+    echo "Dry run (no rendering)..."
+    PYTHONPATH="$JEETLO_FACTORY_SRC${PYTHONPATH:+:$PYTHONPATH}" \
+        $PYTHON -m jeetlo_factory.dryrun . --class "$SCENE_NAME" || exit 1
+fi
+
+if [ -n "$JEETLO_PROFILE" ] && [ -n "$JEETLO_FACTORY_SRC" ]; then
+    # Sampling profiler + per-play timings -> .render_profile.json/.folded
+    PYTHONPATH="$JEETLO_FACTORY_SRC${PYTHONPATH:+:$PYTHONPATH}" \
+        $PYTHON -m jeetlo_factory.profiling --output . -- render -qh --fps 30 -r 1080,1920 reel.py "$SCENE_NAME" 2>&1
+else
+    $PYTHON -m manim render -qh --fps 30 -r 1080,1920 reel.py "$SCENE_NAME" 2>&1
+fi
 RENDER_EOF
     chmod +x "$WORK_DIR/render.sh"
 
-    if bash "$WORK_DIR/render.sh" "$WORK_DIR"; then
+    # JeetLoReelMixin writes on-screen bounding boxes here for POLICE-1
+    rm -f "$WORK_DIR/.layout_log.jsonl"
+    if JEETLO_LAYOUT_LOG="$WORK_DIR/.layout_log.jsonl" JEETLO_FACTORY_SRC="$FACTORY_DIR/src" \
+        perf_run "render_video" bash "$WORK_DIR/render.sh" "$WORK_DIR"; then
         # Find the rendered video
         local video_file=$(find "$WORK_DIR/media/videos" -name "*.mp4" | head -1)
         if [ -n "$video_file" ]; then
@@ -2418,34 +2396,39 @@ validate_sync() {
 frame_qa() {
     print_step "8" "FRAME QA (Extract & Review)"
 
-    mkdir -p "$WORK_DIR/frames"
-
-    echo "Extracting frames at 0.5fps..."
-    ffmpeg -y -i "$WORK_DIR/video.mp4" -vf "fps=0.5" "$WORK_DIR/frames/frame_%03d.png" 2>/dev/null
+    echo "Decoding frames in memory (adaptive sampling around transitions, no PNGs)..."
+    factory_python -m jeetlo_factory.qa "$WORK_DIR/video.mp4" --subject "$SUBJECT" \
+        --background "$(subject_background)" \
+        --adaptive --timings "$WORK_DIR/audio/timings.json" --budget 60 \
+        --json "$WORK_DIR/frame_checks.json" || true
 
-    local frame_count=$(ls "$WORK_DIR/frames/"*.png 2>/dev/null | wc -l | tr -d ' ')
-    echo "Extracted: $frame_count frames"
+    local frame_count=$(jq -r '.frame_count // 0' "$WORK_DIR/frame_checks.json" 2>/dev/null || echo 0)
+    echo "Analysed: $frame_count frames"
     echo ""
 
-    # Do code-based QA checks (no Claude CLI needed)
-    echo "Running code-based QA checks..."
+    # Pixel checks come from frame_checks.json; the rest are code-based
+    echo "Running QA checks..."
 
     local issues=()
     local reel_code="$WORK_DIR/reel.py"
+    local checks_json="$WORK_DIR/frame_checks.json"
 
-    # Check 1: Safe zone - look for hardcoded positions near edges
-    if grep -q "\.to_edge\|LEFT\s*\*\s*[4-9]\|RIGHT\s*\*\s*[4-9]" "$reel_code" 2>/dev/null; then
-        print_warning "Possible edge positioning detected"
+    # Check 1: Safe zone + edges - measured on decoded pixels
+    if [ "$(jq -r '.checks.edges.passed' "$checks_json" 2>/dev/null)" != "true" ]; then
+        print_warning "Content touches frame edges: $(jq -r '.checks.edges.flagged_times | map(tostring + "s") | join(", ")' "$checks_json" 2>/dev/null)"
         issues+=("edge_positioning")
+    elif [ "$(jq -r '.checks.safe_zone.flagged_times | length' "$checks_json" 2>/dev/null)" != "0" ]; then
+        print_warning "Content inside platform UI margins: $(jq -r '.checks.safe_zone.flagged_times | map(tostring + "s") | join(", ")' "$checks_json" 2>/dev/null)"
+        issues+=("unsafe_margins")
     else
-        print_success "Safe zone: No obvious edge issues"
+        print_success "Safe zone: No content in edges or UI margins"
     fi
 
-    # Check 2: Watermark
-    if grep -q "create_brand_watermark\|watermark" "$reel_code" 2>/dev/null; then
-        print_success "Watermark: Present in code"
+    # Check 2: Watermark - flame pixels in the bottom-right box
+    if [ "$(jq -r '.checks.watermark.passed' "$checks_json" 2>/dev/null)" == "true" ]; then
+        print_success "Watermark: Visible in $(jq -r '.checks.watermark.coverage * 100 | floor' "$checks_json")% of frames"
     else
-        print_warning "Watermark: Not found in code"
+        print_warning "Watermark: Not visible in rendered frames"
         issues+=("missing_watermark")
     fi
 
@@ -2457,12 +2440,12 @@ frame_qa() {
         issues+=("missing_cta")
     fi
 
-    # Check 4: Color contrast - check if background color is dark
-    local bg_color=$(grep -o "background_color.*=.*['\"]#[^'\"]*['\"]" "$reel_code" 2>/dev/null | head -1)
-    if [ -n "$bg_color" ]; then
-        print_success "Background color defined: $bg_color"
+    # Check 4: Color contrast - foreground vs subject background
+    if [ "$(jq -r '.checks.contrast.flagged_times | length' "$checks_json" 2>/dev/null)" == "0" ]; then
+        print_success "Contrast: All content readable against background"
     else
-        print_warning "Background color not explicitly set"
+        print_warning "Contrast: Low-contrast content (worst $(jq -r '.checks.contrast.worst_ratio' "$checks_json" 2>/dev/null):1)"
+        issues+=("low_contrast")
     fi
 
     # Check 5: Self.clear() or cleanup between segments
@@ -2478,10 +2461,11 @@ frame_qa() {
     cat > "$WORK_DIR/frame_qa.json" << EOF
 {
   "frame_count": $frame_count,
-  "frames_dir": "$WORK_DIR/frames",
+  "frame_checks": "$WORK_DIR/frame_checks.json",
   "checks": {
-    "safe_zone": $([ ! "${issues[*]}" =~ "edge_positioning" ] && echo "true" || echo "false"),
-    "watermark": $(grep -q "watermark" "$reel_code" 2>/dev/null && echo "true" || echo "false"),
+    "safe_zone": $([[ ! "${issues[*]}" =~ edge_positioning|unsafe_margins ]] && echo "true" || echo "false"),
+    "watermark": $([[ ! "${issues[*]}" =~ missing_watermark ]] && echo "true" || echo "false"),
+    "contrast": $([[ ! "${issues[*]}" =~ low_contrast ]] && echo "true" || echo "false"),
     "cta_present": $(grep -q "cta" "$reel_code" 2>/dev/null && echo "true" || echo "false"),
     "cleanup": $(grep -q "clear\|FadeOut" "$reel_code" 2>/dev/null && echo "true" || echo "false")
   },
@@ -2500,8 +2484,7 @@ EOF
     fi
 
     echo ""
-    echo "Frames saved to: $WORK_DIR/frames/"
-    echo "Please visually inspect before proceeding."
+    echo "Pixel-level results: $WORK_DIR/frame_checks.json"
 
     add_chain_step "frame_qa" "$WORK_DIR/frame_qa.json"
 }
@@ -2515,7 +2498,7 @@ combine_av() {
 
     echo "Combining with ffmpeg..."
 
-    ffmpeg -y \
+    perf_run "combine_av" ffmpeg -y \
         -i "$WORK_DIR/video.mp4" \
         -i "$WORK_DIR/audio/combined_audio.mp3" \
         -c:v libx264 -preset fast -crf 18 \
@@ -2596,8 +2579,7 @@ final_qa() {
     add_chain_step "final_qa" "$WORK_DIR/final_qa.json"
 
     # Mark as ready for posting
-    jq '.status = "ready_to_post"' "$WORK_DIR/.proof_chain.json" > "$WORK_DIR/.proof_chain.json.tmp"
-    mv "$WORK_DIR/.proof_chain.json.tmp" "$WORK_DIR/.proof_chain.json"
+    factory_python -m jeetlo_factory.chain status "$WORK_DIR/.proof_chain.json" ready_to_post > /dev/null
 
     print_success "Final QA passed - ready for posting!"
 }
@@ -2616,20 +2598,20 @@ push_to_github() {
     mkdir -p "$reel_dir"
 
     cp "$WORK_DIR/.proof_chain.json" "$reel_dir/"
+    # The chain was written under /tmp, outside the catalogue: record the
+    # copy in reels/.jeetlo_merkle.json so the tree is committed with the reel
+    factory_python -m jeetlo_factory.chain record "$reel_dir/.proof_chain.json"
     cp "$WORK_DIR/creative_brief.json" "$reel_dir/"
     cp "$WORK_DIR/reel.py" "$reel_dir/"
     cp "$WORK_DIR/audio/timings.json" "$reel_dir/"
-
-    # Update db/reels.json
-    if [ -f "$FACTORY_DIR/db/reels.json" ]; then
-        jq --arg id "$REEL_ID" \
-           --arg subject "$SUBJECT" \
-           --arg topic "$TOPIC" \
-           --arg status "ready_to_post" \
-           '.reels += [{id: $id, subject: $subject, topic: $topic, status: $status, updated: now}]' \
-           "$FACTORY_DIR/db/reels.json" > "$FACTORY_DIR/db/reels.json.tmp"
-        mv "$FACTORY_DIR/db/reels.json.tmp" "$FACTORY_DIR/db/reels.json"
-    fi
+    [ -f "$WORK_DIR/.layout_log.jsonl" ] && cp "$WORK_DIR/.layout_log.jsonl" "$reel_dir/"
+    [ -f "$WORK_DIR/.render_profile.json" ] && cp "$WORK_DIR/.render_profile.json" "$reel_dir/"
+
+    # Record the reel in db/reels.db and refresh the dashboard exports
+    # (db/reels.json, db/feed/); re-runs update the existing row. db/feed/
+    # is gitignored - deploy-dashboard.yml rebuilds it from db/reels.db
+    factory_python -m jeetlo_factory.database --db "$FACTORY_DIR/db" upsert "$REEL_ID" \
+        --subject "$SUBJECT" --topic "$TOPIC" --status ready_to_post
 
     # Git commit and push
     cd "$FACTORY_DIR"
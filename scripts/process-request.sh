@@ -7,7 +7,8 @@
 # Usage:
 #   ./scripts/process-request.sh [reel_id]
 #
-# If no reel_id provided, fetches the latest pending request from GitHub.
+# If no reel_id provided, processes every pending request (validated,
+# deduplicated and in priority order by jeetlo_factory.intake).
 # ═══════════════════════════════════════════════════════════════════════════════
 
 set -e
@@ -33,20 +34,28 @@ if [ -n "$1" ]; then
     REEL_ID="$1"
     echo -e "${YELLOW}Processing specified reel: $REEL_ID${NC}"
 else
-    echo -e "${YELLOW}Fetching latest pending request from GitHub...${NC}"
+    echo -e "${YELLOW}Fetching pending requests from GitHub...${NC}"
+    git -C "$FACTORY_DIR" pull --quiet origin main 2>/dev/null || echo -e "${YELLOW}⚠ git pull failed, using local requests${NC}"
 
-    # List requests and find pending ones
-    REQUESTS=$(gh api "repos/$REPO/contents/requests" --jq '.[].name' 2>/dev/null | grep -v "template\|README" || true)
+    PYTHONPATH="$FACTORY_DIR/src" python3 -m jeetlo_factory.intake "$FACTORY_DIR/requests"
+    QUEUE=$(PYTHONPATH="$FACTORY_DIR/src" python3 -m jeetlo_factory.intake "$FACTORY_DIR/requests" --ids 2>/dev/null)
 
-    if [ -z "$REQUESTS" ]; then
+    if [ -z "$QUEUE" ]; then
         echo -e "${RED}No pending requests found.${NC}"
         exit 1
     fi
 
-    # Get the most recent request
-    LATEST=$(echo "$REQUESTS" | tail -1)
-    REEL_ID="${LATEST%.json}"
-    echo -e "${GREEN}Found: $REEL_ID${NC}"
+    # Process the whole queue; one failure doesn't stop the rest
+    FAILED=""
+    for QUEUED_ID in $QUEUE; do
+        "$0" "$QUEUED_ID" || FAILED="$FAILED $QUEUED_ID"
+    done
+
+    if [ -n "$FAILED" ]; then
+        echo -e "${RED}Failed:$FAILED${NC}"
+        exit 1
+    fi
+    exit 0
 fi
 
 # Create work directory
@@ -13,9 +13,19 @@ setup(
         # No external dependencies for core functionality
         # TTS and video tools are system dependencies
     ],
+    extras_require={
+        # Frame QA and per-segment audio sync decode media into NumPy arrays
+        "qa": ["numpy>=1.21"],
+        # Ed25519 step signatures (JEETLO_SIGNING_KEY, jeetlo-validate --signatures)
+        "signing": ["cryptography>=3.4"],
+    },
     entry_points={
         "console_scripts": [
             "jeetlo-validate=jeetlo_factory.ci:main",
+            "jeetlo-frame-qa=jeetlo_factory.qa.runner:main",
+            "jeetlo-audio-sync=jeetlo_factory.qa.audio:main",
+            "jeetlo-layout-check=jeetlo_factory.layout:main",
+            "jeetlo-perf=jeetlo_factory.perf:main",
         ],
     },
 )
@@ -0,0 +1,47 @@
+"""
+JeetLo.ai - Brand Constants
+===========================
+Frame geometry and brand colors, importable without Manim.
+
+style.py re-exports everything here for reels; frame QA and other
+tooling that must not pull in Manim import from this module directly.
+"""
+
+# ============================================
+# FRAME CONFIGURATION (9:16 Vertical)
+# ============================================
+FRAME_WIDTH = 8
+FRAME_HEIGHT = 14.22
+PIXEL_WIDTH = 1080
+PIXEL_HEIGHT = 1920
+
+# ============================================
+# BRAND COLORS
+# ============================================
+BG_COLOR = "#0D0D0D"  # Near black
+
+# Subject colors
+SUBJECT_COLORS = {
+    "physics": "#0066FF",      # Electric blue
+    "chemistry": "#00CC66",    # Emerald green
+    "biology": "#CC66FF",      # Violet purple
+    "mathematics": "#FF9900",  # Orange
+}
+
+# Subject backgrounds (darker versions)
+SUBJECT_BACKGROUNDS = {
+    "physics": "#0A1628",      # Dark blue
+    "chemistry": "#0A1F14",    # Dark green
+    "biology": "#1A0A2E",      # Dark purple
+    "mathematics": "#1F1408",  # Dark orange
+}
+
+# Common colors
+PRIMARY = "#FFFFFF"
+SECONDARY = "#B0B0B0"
+ACCENT = "#FFD700"       # Gold
+CORRECT = "#22C55E"      # Green
+WRONG = "#EF4444"        # Red
+CYAN = "#00FFFF"
+YELLOW = "#FCD34D"
+ORANGE = "#FF6B35"
@@ -0,0 +1,424 @@
+"""
+Proof Chain
+===========
+
+The ``.proof_chain.json`` written by jeetlo.sh, as a class next to
+Manifest, with a CLI so the script records a step in one process instead
+of jq (read last hash) + shasum + date + jq (rewrite file) per step.
+
+Format:
+    {
+      "schema_version": 2,
+      "reel_id": ..., "subject": ..., "created_at": ..., "genesis_hash": ...,
+      "status": ...,
+      "steps": [
+        {"step": ..., "input_hash": "genesis" | <previous output_hash>,
+         "output_hash": <sha256 of the step's output file>,
+         "timestamp": ..., "output": <file name>, "perf": {...}}
+      ]
+    }
+
+``steps`` is written last so a new step is appended in place - the tail
+``]}`` is overwritten - instead of rewriting the file. Output hashes go
+through a small (size, mtime)-keyed hash cache next to the chain, so
+``verify --outputs`` doesn't re-read unchanged media.
+
+Chains written before ``schema_version`` existed (version 1: no version,
+no status until the reel was ready) still validate; ``migrate`` stamps a
+directory of them up to the current schema in one pass.
+
+Usage (jeetlo.sh):
+    python -m jeetlo_factory.chain init .proof_chain.json --reel-id bio-05-x --subject biology
+    python -m jeetlo_factory.chain add .proof_chain.json render_video video.mp4 --perf .perf/render_video.json
+    python -m jeetlo_factory.chain verify .proof_chain.json
+    python -m jeetlo_factory.chain status .proof_chain.json ready_to_post
+    python -m jeetlo_factory.chain migrate reels/ --dry-run
+    python -m jeetlo_factory.chain record reels/bio-05-x/.proof_chain.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .exceptions import ChainBrokenError, ManifestError
+from .discovery import find_reels
+from .manifest import (
+    CHAIN_SCHEMA_VERSIONS, FORMAT_PROOF_CHAIN, MANIFEST_FILENAME, PROOF_CHAIN_FILENAME,
+    detect_chain_format, find_chain_file, get_file_hash, parse_chain
+)
+from .merkle import record_chain
+
+
+CHAIN_FILENAME = PROOF_CHAIN_FILENAME
+SCHEMA_VERSION = CHAIN_SCHEMA_VERSIONS[FORMAT_PROOF_CHAIN]
+HASH_CACHE_FILENAME = ".jeetlo_hash_cache.json"
+GENESIS_INPUT = "genesis"
+
+_EMPTY_TAIL = b'"steps": []\n}\n'
+_STEPS_TAIL = b"\n  ]\n}\n"
+
+
+def now_iso() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class HashCache:
+    """
+    SHA256 of files keyed by (size, mtime_ns), persisted as JSON.
+
+    A file rewritten with the same size within the filesystem's mtime
+    resolution would be missed, which is why the chain still records the
+    hash it computed at ``add`` time rather than trusting the cache later.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path) if path else None
+        self.entries: Dict[str, List[Any]] = {}
+        self.dirty = False
+        if self.path and self.path.exists():
+            try:
+                with open(self.path, "r") as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def hash(self, filepath: str) -> str:
+        key = str(Path(filepath).resolve())
+        st = os.stat(key)
+        cached = self.entries.get(key)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            return cached[2]
+        digest = get_file_hash(key)
+        self.entries[key] = [st.st_size, st.st_mtime_ns, digest]
+        self.dirty = True
+        return digest
+
+    def save(self):
+        if not (self.path and self.dirty):
+            return
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(self.entries, f)
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+
+class ProofChain:
+    """
+    The shell pipeline's proof chain.
+
+    Each step records:
+    - step: Name of the step (setup, creative_brief, ..., final_qa)
+    - input_hash: "genesis" for the first step, else the previous output_hash
+    - output_hash: SHA256 of the step's output file
+    - timestamp: UTC, second resolution
+    - output / perf: optional output file name and step cost
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.data: Dict[str, Any] = {}
+
+    @classmethod
+    def create(cls, path: str, reel_id: str, subject: str) -> "ProofChain":
+        """Start a chain with a genesis hash unique to this reel and moment."""
+        chain = cls(path)
+        seed = f"jeetlo-{reel_id}-{int(time.time())}"
+        chain.data = {
+            "schema_version": SCHEMA_VERSION,
+            "reel_id": reel_id,
+            "subject": subject,
+            "created_at": now_iso(),
+            "genesis_hash": hashlib.sha256(seed.encode()).hexdigest(),
+            "status": "in_progress",
+            "steps": []
+        }
+        chain.save()
+        return chain
+
+    @classmethod
+    def load(cls, path: str) -> "ProofChain":
+        chain = cls(path)
+        if not chain.path.exists():
+            raise ManifestError(f"No proof chain found at {chain.path}")
+        try:
+            with open(chain.path, "r") as f:
+                chain.data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ManifestError(f"Invalid proof chain JSON: {e}")
+        return chain
+
+    @property
+    def steps(self) -> List[Dict[str, Any]]:
+        return self.data.setdefault("steps", [])
+
+    def save(self):
+        """Write the whole chain (atomically), with ``steps`` as the last key."""
+        ordered = {k: v for k, v in self.data.items() if k != "steps"}
+        ordered["steps"] = self.steps
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(ordered, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        os.replace(tmp, self.path)
+        self.data = ordered
+        self._record()
+
+    def _record(self):
+        # The catalogue tree tracks the manifest when a reel has both
+        if not (self.path.parent / MANIFEST_FILENAME).exists():
+            record_chain(self.path)
+
+    def get_last_output_hash(self) -> Optional[str]:
+        return self.steps[-1].get("output_hash") if self.steps else None
+
+    def add_step(
+        self,
+        step_name: str,
+        output_hash: str,
+        output: Optional[str] = None,
+        perf: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Chain a step onto the last one and append it to the file."""
+        step: Dict[str, Any] = {
+            "step": step_name,
+            "input_hash": self.get_last_output_hash() or GENESIS_INPUT,
+            "output_hash": output_hash,
+            "timestamp": now_iso()
+        }
+        if output:
+            step["output"] = output
+        if perf:
+            step["perf"] = perf
+
+        if not self._append(step):
+            self.steps.append(step)
+            self.save()
+        else:
+            self.steps.append(step)
+            self._record()
+        return step
+
+    def _append(self, step: Dict[str, Any]) -> bool:
+        """Append ``step`` by rewriting only the file's tail; False if the layout doesn't allow it."""
+        body = json.dumps(step, indent=2, ensure_ascii=False)
+        body = "\n".join("    " + line for line in body.splitlines()).encode()
+        try:
+            with open(self.path, "r+b") as f:
+                f.seek(0, os.SEEK_END)
+                size = f.tell()
+                f.seek(max(0, size - len(_EMPTY_TAIL)))
+                tail = f.read()
+                if tail.endswith(_EMPTY_TAIL):
+                    f.seek(size - len(_EMPTY_TAIL))
+                    f.write(b'"steps": [\n' + body + _STEPS_TAIL)
+                elif tail.endswith(_STEPS_TAIL):
+                    f.seek(size - len(_STEPS_TAIL))
+                    f.write(b",\n" + body + _STEPS_TAIL)
+                else:
+                    return False
+                f.truncate()
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError:
+            return False
+        return True
+
+    def verify(self, hash_cache: Optional[HashCache] = None) -> bool:
+        """
+        Verify every link. With a hash cache, also re-hash each step's
+        recorded output file (when it still exists) against output_hash.
+
+        Returns True if valid, raises ChainBrokenError if not.
+        """
+        parsed = parse_chain(self.data, self.path.name)
+        for i, step in enumerate(parsed["steps"]):
+            name = step["name"] or f"#{i}"
+            expected = parsed["steps"][i - 1]["output_hash"] if i else GENESIS_INPUT
+            if step["input_hash"] != expected:
+                raise ChainBrokenError(
+                    f"CHAIN BROKEN at {name}: expected {str(expected)[:16]}..., "
+                    f"got {str(step['input_hash'])[:16]}..."
+                )
+            recorded = self.steps[i].get("output")
+            if hash_cache is not None and recorded:
+                output = self.path.parent / recorded
+                if output.exists() and hash_cache.hash(str(output)) != step["output_hash"]:
+                    raise ChainBrokenError(f"CHAIN BROKEN at {name}: {recorded} changed since it was recorded")
+        return True
+
+    def set_status(self, status: str):
+        self.data["status"] = status
+        self.save()
+
+
+def migrate_chain(path: str, dry_run: bool = False) -> bool:
+    """
+    Bring a proof chain up to the current schema: stamp schema_version,
+    default the status, and move ``steps`` last so ``add`` can append in
+    place. Step data is never touched.
+
+    Returns:
+        True if the file needed (or, with dry_run, would need) rewriting
+    """
+    chain = ProofChain.load(path)
+    if detect_chain_format(chain.data, chain.path.name) != FORMAT_PROOF_CHAIN:
+        raise ManifestError(f"{chain.path} is not a proof chain")
+    parse_chain(chain.data, chain.path.name)  # refuses newer schemas
+
+    original = list(chain.data.items())
+    migrated = {"schema_version": SCHEMA_VERSION}
+    migrated.update((k, v) for k, v in chain.data.items() if k not in ("schema_version", "steps"))
+    migrated.setdefault("status", "in_progress")
+    migrated["steps"] = chain.data.get("steps", [])
+    chain.data = migrated
+    changed = list(migrated.items()) != original
+    if changed and not dry_run:
+        chain.save()
+    return changed
+
+
+def _chain_files(targets: List[str]) -> List[Path]:
+    """Chain files named directly, plus every reel's proof chain under directories."""
+    files = []
+    for target in targets:
+        path = Path(target)
+        if path.is_dir():
+            files.extend(
+                reel / CHAIN_FILENAME for reel in find_reels(str(path), include_proof_chains=True)
+                if (reel / CHAIN_FILENAME).exists()
+            )
+        else:
+            files.append(path)
+    return files
+
+
+def _load_perf(perf_path: Optional[str], started_at: Optional[int]) -> Dict[str, Any]:
+    perf: Dict[str, Any] = {}
+    if perf_path and Path(perf_path).exists():
+        with open(perf_path, "r") as f:
+            perf = json.load(f)
+    if started_at:
+        perf["step_wall_seconds"] = int(time.time()) - started_at
+    return perf
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Create, extend and verify a .proof_chain.json"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    init = sub.add_parser("init", help="Create the chain unless it exists")
+    init.add_argument("chain")
+    init.add_argument("--reel-id", required=True)
+    init.add_argument("--subject", required=True)
+
+    add = sub.add_parser("add", help="Hash an output file and chain it as a step; prints the hash")
+    add.add_argument("chain")
+    add.add_argument("step")
+    add.add_argument("output", help="The step's output file")
+    add.add_argument("--perf", help="perf.json from `jeetlo_factory.perf run` to attach, if it exists")
+    add.add_argument("--started-at", type=int, help="Step start (epoch seconds) for step_wall_seconds")
+
+    verify = sub.add_parser("verify", help="Check every link in the chain")
+    verify.add_argument("chain")
+    verify.add_argument("--outputs", action="store_true", help="Also re-hash recorded output files")
+
+    status = sub.add_parser("status", help="Set the chain's status")
+    status.add_argument("chain")
+    status.add_argument("status")
+
+    migrate = sub.add_parser("migrate", help="Upgrade proof chains to the current schema")
+    migrate.add_argument("targets", nargs="+", help="Chain files, or directories of reels")
+    migrate.add_argument("--dry-run", action="store_true", help="Report what would change without writing")
+
+    record = sub.add_parser(
+        "record", help="Update the catalogue Merkle tree with a chain copied into the catalogue"
+    )
+    record.add_argument("chain")
+
+    args = parser.parse_args()
+
+    if args.command == "record":
+        # The reel's chain document - its manifest, if it has one (see _record)
+        path = find_chain_file(str(Path(args.chain).parent))
+        if path is None:
+            print(f"✗ No chain file found at {args.chain}")
+            sys.exit(1)
+        if record_chain(path):
+            print(f"✓ Recorded {path.parent.name} in the catalogue tree")
+        else:
+            print(f"⚠ No catalogue tree above {path.parent} - nothing recorded")
+        sys.exit(0)
+
+    if args.command == "migrate":
+        changed = failed = 0
+        files = _chain_files(args.targets)
+        for path in files:
+            try:
+                if migrate_chain(str(path), args.dry_run):
+                    changed += 1
+                    print(f"  {'Would migrate' if args.dry_run else '✓ Migrated'}: {path}")
+            except (ManifestError, FileNotFoundError) as e:
+                failed += 1
+                print(f"  ✗ {path}: {e}")
+        print(f"{len(files)} chain(s), {changed} {'to migrate' if args.dry_run else 'migrated'}, {failed} failed")
+        sys.exit(1 if failed else 0)
+
+    cache_path = str(Path(args.chain).parent / HASH_CACHE_FILENAME)
+
+    try:
+        if args.command == "init":
+            if Path(args.chain).exists():
+                chain = ProofChain.load(args.chain)
+                print(f"✓ Resuming existing proof chain ({len(chain.steps)} steps)")
+            else:
+                chain = ProofChain.create(args.chain, args.reel_id, args.subject)
+                print(f"✓ Proof chain initialized: {chain.data['genesis_hash'][:16]}...")
+
+        elif args.command == "add":
+            chain = ProofChain.load(args.chain)
+            cache = HashCache(cache_path)
+            output_hash = cache.hash(args.output)
+            cache.save()
+            output = os.path.relpath(args.output, chain.path.parent)
+            chain.add_step(
+                args.step,
+                output_hash,
+                output=None if output.startswith("..") else output,
+                perf=_load_perf(args.perf, args.started_at)
+            )
+            print(output_hash)
+
+        elif args.command == "verify":
+            chain = ProofChain.load(args.chain)
+            cache = HashCache(cache_path) if args.outputs else None
+            chain.verify(cache)
+            if cache:
+                cache.save()
+            print(f"Chain valid: {len(chain.steps)} steps")
+
+        elif args.command == "status":
+            chain = ProofChain.load(args.chain)
+            chain.set_status(args.status)
+            print(f"✓ Status: {args.status}")
+
+    except (ChainBrokenError, ManifestError) as e:
+        print(str(e))
+        sys.exit(1)
+    except FileNotFoundError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
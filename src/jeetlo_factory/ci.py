@@ -8,6 +8,11 @@ It runs on GitHub's servers, so it CANNOT be bypassed.
 Usage:
     python -m jeetlo_factory.ci /path/to/reels
     python -m jeetlo_factory.ci /path/to/reels --chain-only  # For GitHub CI
+    python -m jeetlo_factory.ci /path/to/reels --dry-run     # Pre-render gate
+    python -m jeetlo_factory.ci /path/to/reels --chain-only --changed-since origin/main
+    python -m jeetlo_factory.ci /path/to/reels --chain-only --merkle  # Only reels whose chain changed
+    python -m jeetlo_factory.ci /path/to/reels --format jsonl > results.jsonl
+    python -m jeetlo_factory.ci /path/to/reels --chain-only --signatures  # Ed25519 step signatures
 
 Exit codes:
     0 - All validations passed
@@ -17,78 +22,75 @@ Exit codes:
 import argparse
 import sys
 import os
-import json
+import time
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
+from . import __version__
 from .validators import ChainValidator, AudioValidator, VideoValidator
-from .manifest import MANIFEST_FILENAME
-
-
-def find_reels(base_path: str) -> List[Path]:
-    """Find all reel directories (those with manifests)."""
-    base = Path(base_path)
-    reels = []
-
-    for manifest in base.rglob(MANIFEST_FILENAME):
-        reels.append(manifest.parent)
-
-    return reels
-
-
-def validate_chain_only(reel_path: Path) -> Tuple[bool, List[str], List[str], dict]:
-    """Validate only the manifest chain (for GitHub CI where media files aren't pushed)."""
+from .exceptions import ManifestError
+from .manifest import FORMAT_MANIFEST, FORMAT_PROOF_CHAIN, find_chain_file, read_chain
+from .discovery import CATALOGUE_FILENAME, find_reels
+from .dryrun import validate_dry_run
+from .reporting import FORMATS, make_writer
+from .signing import TRUSTED_KEYS_FILENAME, SignatureVerifier, load_trusted_keys
+from .incremental import (
+    CACHE_FILENAME, ResultsCache, chain_leaves, changed_paths, reel_cache_keys, select_changed
+)
+from .merkle import MERKLE_FILENAME, MerkleTree, load_tree, save_tree
+
+
+# Steps a finished reel must have, per chain format
+REQUIRED_CHAIN_STEPS = {
+    FORMAT_MANIFEST: ("completed", ["create", "audio", "video", "combine"]),
+    FORMAT_PROOF_CHAIN: ("ready_to_post", ["generate_audio", "render_video", "combine_av", "final_qa"]),
+}
+
+
+def validate_chain_only(reel_path: Path, verifier=None) -> Tuple[bool, List[str], List[str], dict]:
+    """
+    Validate only the chain (for GitHub CI where media files aren't pushed).
+
+    Reads the library manifest or, for reels made by jeetlo.sh, the
+    .proof_chain.json. With a ``SignatureVerifier``, step signatures are
+    checked from the same parsed document.
+    """
     errors = []
     warnings = []
     metadata = {}
 
-    manifest_path = reel_path / MANIFEST_FILENAME
-    if not manifest_path.exists():
+    chain_path = find_chain_file(str(reel_path))
+    if chain_path is None:
         errors.append("No manifest found")
         return False, errors, warnings, metadata
 
     try:
-        with open(manifest_path, 'r') as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
-        errors.append(f"Invalid JSON: {e}")
+        chain = read_chain(str(chain_path))
+    except ManifestError as e:
+        errors.append(str(e))
         return False, errors, warnings, metadata
 
-    # Required fields
-    required = ["version", "reel_id", "subject", "steps"]
-    for field in required:
-        if field not in data:
-            errors.append(f"Missing field: {field}")
-
-    if errors:
-        return False, errors, warnings, metadata
+    metadata["format"] = chain["format"]
+    metadata["schema_version"] = chain["schema_version"]
+    missing = [e for e in chain["errors"] if e.startswith("Missing field")]
+    if missing:
+        return False, missing, warnings, metadata
 
-    steps = data.get("steps", [])
+    steps = chain["steps"]
     metadata["step_count"] = len(steps)
-    metadata["status"] = data.get("status", "unknown")
-    metadata["reel_id"] = data.get("reel_id", "unknown")
-
-    # Verify hash chain
-    if steps:
-        # First step should have null input_hash
-        if steps[0].get("input_hash") is not None:
-            errors.append("First step must have null input_hash")
-
-        # Each subsequent step's input must match previous output
-        for i in range(1, len(steps)):
-            prev_output = steps[i-1].get("output_hash")
-            curr_input = steps[i].get("input_hash")
-
-            if prev_output != curr_input:
-                errors.append(
-                    f"Chain broken at step '{steps[i].get('step_name')}': "
-                    f"input_hash doesn't match previous output_hash"
-                )
-
-    # Check required steps for completed reels
-    if data.get("status") == "completed":
-        required_steps = ["create", "audio", "video", "combine"]
-        step_names = [s.get("step_name") for s in steps]
+    metadata["status"] = chain["status"] or "unknown"
+    metadata["reel_id"] = chain["reel_id"] or "unknown"
+    errors.extend(chain["errors"])
+
+    if verifier is not None:
+        sig_errors, sig_warnings = verifier.verify_document(chain["document"])
+        errors.extend(sig_errors)
+        warnings.extend(sig_warnings)
+
+    # Check required steps for finished reels
+    finished_status, required_steps = REQUIRED_CHAIN_STEPS[chain["format"]]
+    if chain["status"] == finished_status:
+        step_names = [s["name"] for s in steps]
         for req in required_steps:
             if req not in step_names:
                 warnings.append(f"Missing step: {req}")
@@ -96,8 +98,16 @@ def validate_chain_only(reel_path: Path) -> Tuple[bool, List[str], List[str], di
     return len(errors) == 0, errors, warnings, metadata
 
 
-def validate_reel(reel_path: Path, chain_only: bool = False) -> Tuple[bool, List[str], List[str]]:
-    """Validate a single reel."""
+def validate_reel(
+    reel_path: Path,
+    chain_only: bool = False,
+    timings: Optional[Dict[str, float]] = None
+) -> Tuple[bool, List[str], List[str]]:
+    """
+    Validate a single reel.
+
+    If ``timings`` is given, it is filled with seconds spent per validator.
+    """
     if chain_only:
         valid, errors, warnings, _ = validate_chain_only(reel_path)
         return valid, errors, warnings
@@ -105,25 +115,47 @@ def validate_reel(reel_path: Path, chain_only: bool = False) -> Tuple[bool, List
     all_errors = []
     all_warnings = []
 
-    # Chain validation
-    chain_val = ChainValidator(str(reel_path))
-    _, errors, warnings = chain_val.validate()
-    all_errors.extend(errors)
-    all_warnings.extend(warnings)
+    for name, validator_cls in (
+        ("chain", ChainValidator),
+        ("audio", AudioValidator),
+        ("video", VideoValidator),
+    ):
+        start = time.perf_counter()
+        _, errors, warnings = validator_cls(str(reel_path)).validate()
+        if timings is not None:
+            timings[name] = round(time.perf_counter() - start, 4)
+        all_errors.extend(errors)
+        all_warnings.extend(warnings)
 
-    # Audio validation
-    audio_val = AudioValidator(str(reel_path))
-    _, errors, warnings = audio_val.validate()
-    all_errors.extend(errors)
-    all_warnings.extend(warnings)
+    return len(all_errors) == 0, all_errors, all_warnings
 
-    # Video validation
-    video_val = VideoValidator(str(reel_path))
-    _, errors, warnings = video_val.validate()
-    all_errors.extend(errors)
-    all_warnings.extend(warnings)
 
-    return len(all_errors) == 0, all_errors, all_warnings
+def run_validation(reel: Path, mode: str, verifier=None) -> dict:
+    """Validate one reel in the given mode ("chain", "dry-run" or "full")."""
+    timings: Dict[str, float] = {}
+    start = time.perf_counter()
+
+    if mode == "chain":
+        is_valid, errors, warnings, metadata = validate_chain_only(reel, verifier)
+        timings["chain"] = round(time.perf_counter() - start, 4)
+    elif mode == "dry-run":
+        is_valid, errors, warnings, metadata = validate_dry_run(str(reel))
+        timings["dry_run"] = round(time.perf_counter() - start, 4)
+    else:
+        is_valid, errors, warnings = validate_reel(reel, chain_only=False, timings=timings)
+        metadata = {}
+
+    return {
+        "reel_id": reel.name,
+        "path": str(reel),
+        "mode": mode,
+        "passed": is_valid,
+        "errors": errors,
+        "warnings": warnings,
+        "metadata": metadata,
+        "seconds": round(time.perf_counter() - start, 4),
+        "timings": timings
+    }
 
 
 def write_github_summary(results: List[dict]):
@@ -141,7 +173,7 @@ def write_github_summary(results: List[dict]):
 
         f.write("| Metric | Count |\n")
         f.write("|--------|-------|\n")
-        f.write(f"| Total Manifests | {total} |\n")
+        f.write(f"| Total Chains | {total} |\n")
         f.write(f"| ✅ Valid | {passed} |\n")
         f.write(f"| ❌ Invalid | {failed} |\n\n")
 
@@ -153,6 +185,8 @@ def write_github_summary(results: List[dict]):
                 status = r.get("metadata", {}).get("status", "?")
                 steps = r.get("metadata", {}).get("step_count", 0)
                 chain = "✅" if r["passed"] else "❌"
+                if r.get("cached"):
+                    chain += " (cached)"
                 f.write(f"| {r['reel_id']} | {steps} | {status} | {chain} |\n")
 
         f.write("\n")
@@ -184,88 +218,263 @@ def main():
         action="store_true",
         help="Only validate manifest chain (for GitHub CI without media files)"
     )
+    parser.add_argument(
+        "--signatures",
+        action="store_true",
+        help="With --chain-only, also verify Ed25519 step signatures (needs cryptography)"
+    )
+    parser.add_argument(
+        "--require-signatures",
+        action="store_true",
+        help="Like --signatures, and unsigned manifest steps are errors"
+    )
+    parser.add_argument(
+        "--trusted-keys",
+        metavar="PATH",
+        default=TRUSTED_KEYS_FILENAME,
+        help=f"Trusted public keys for --signatures (default: {TRUSTED_KEYS_FILENAME})"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Execute each reel.py with rendering disabled and validate timing and layout"
+    )
+    parser.add_argument(
+        "--index",
+        action="store_true",
+        help=f"Discover reels from the {CATALOGUE_FILENAME} index (created or rebuilt when stale)"
+    )
+    parser.add_argument(
+        "--changed-since",
+        metavar="REV",
+        help="Only validate reels with files changed since this git revision; "
+             "report the rest from the results cache"
+    )
+    parser.add_argument(
+        "--merkle",
+        action="store_true",
+        help=f"With --chain-only, compare the catalogue Merkle root ({MERKLE_FILENAME}) with "
+             f"the last validated one and only validate reels that differ"
+    )
+    parser.add_argument(
+        "--update-merkle",
+        action="store_true",
+        help=f"With --merkle, write {MERKLE_FILENAME} when it is missing or out of date "
+             f"(it is committed, so this is off by default)"
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="PATH",
+        help=f"Results cache file (default: {CACHE_FILENAME} in the validated path "
+             f"when --changed-since is used)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        default="text",
+        help="Result format. json/jsonl/junit stream one result per reel as it "
+             "completes; the human log then goes to stderr"
+    )
+    parser.add_argument(
+        "--output",
+        metavar="PATH",
+        help="Write the report (text log, or --format results) to this file instead of stdout"
+    )
 
     args = parser.parse_args()
 
-    print("=" * 60)
-    print("JeetLo Factory CI Validator")
     if args.chain_only:
-        print("Mode: Chain-only (manifest validation)")
+        mode = "chain"
+    elif args.dry_run:
+        mode = "dry-run"
+    else:
+        mode = "full"
+
+    verifier = None
+    if args.signatures or args.require_signatures:
+        if mode != "chain":
+            parser.error("--signatures requires --chain-only")
+        try:
+            verifier = SignatureVerifier(load_trusted_keys(args.trusted_keys), require=args.require_signatures)
+        except ManifestError as e:
+            print(f"✗ {e}", file=sys.stderr)
+            sys.exit(1)
+    if args.merkle and mode != "chain":
+        parser.error("--merkle requires --chain-only")
+    if args.update_merkle and not args.merkle:
+        parser.error("--update-merkle requires --merkle")
+
+    # Human-readable log: to --output in text format, to stderr when
+    # stdout carries results
+    out_file = open(args.output, "w") if args.output else None
+    if args.format == "text":
+        log = out_file or sys.stdout
     else:
-        print("Mode: Full validation (chain + media files)")
-    print("=" * 60)
+        log = sys.stdout if out_file else sys.stderr
+    writer = None
+    if args.format != "text":
+        writer = make_writer(args.format, out_file or sys.stdout)
+
+    print("=" * 60, file=log)
+    print("JeetLo Factory CI Validator", file=log)
+    if args.chain_only:
+        print("Mode: Chain-only (manifest validation)", file=log)
+        if verifier is not None:
+            print(f"Signatures: {len(verifier.trusted_keys)} trusted key(s) from {args.trusted_keys}", file=log)
+    elif args.dry_run:
+        print("Mode: Dry run (reel.py executed without rendering)", file=log)
+    else:
+        print("Mode: Full validation (chain + media files)", file=log)
+    print("=" * 60, file=log)
 
     # Find all reels
-    reels = find_reels(args.path)
+    # Shell-pipeline reels carry only a .proof_chain.json; only the chain check applies to them
+    reels = find_reels(args.path, use_index=args.index, include_proof_chains=(mode == "chain"))
 
     if not reels:
-        print(f"No reels found in {args.path}")
-        print("Reels must have a .jeetlo_manifest.json file")
+        print(f"No reels found in {args.path}", file=log)
+        print("Reels must have a .jeetlo_manifest.json file", file=log)
+        if writer is not None:
+            writer.close({"reels": 0})
+        if out_file is not None:
+            out_file.close()
         sys.exit(0)
 
-    print(f"\nFound {len(reels)} reel(s) to validate:\n")
+    cache: Optional[ResultsCache] = None
+    cache_keys = {}
+    # Signature checks change the result, so they get their own cache
+    # entries, invalidated when the trusted keys or --require change
+    cache_mode = mode
+    if verifier is not None:
+        cache_mode += "+signatures:" + ",".join(sorted(verifier.trusted_keys))
+        cache_mode += ":required" if verifier.require else ""
+    touched = set(reels)
+
+    if args.changed_since or args.cache or args.merkle:
+        cache = ResultsCache.load(args.cache or str(Path(args.path) / CACHE_FILENAME), __version__)
+        # Chain-only reads tracked files only, so git tree ids are valid keys;
+        # other modes read ignored media and must hash from disk
+        cache_keys = reel_cache_keys(reels, args.path, use_git=(mode == "chain"))
+
+    if args.changed_since:
+        paths = changed_paths(args.changed_since, args.path)
+        if paths is None:
+            print(f"WARNING: git diff against '{args.changed_since}' failed - validating all reels", file=log)
+        else:
+            touched = set(select_changed(reels, paths))
+            print(f"Changed since {args.changed_since}: {len(touched)} of {len(reels)} reel(s)", file=log)
+
+    tree = None
+    if args.merkle:
+        stored = load_tree(args.path)
+        tree = MerkleTree(chain_leaves(reels, args.path, stored))
+        if stored is None or stored.root != tree.root:
+            if args.update_merkle:
+                save_tree(args.path, tree)
+                print(f"{'Updated' if stored is not None else 'Created'} {MERKLE_FILENAME}", file=log)
+            elif stored is None:
+                print(f"WARNING: No {MERKLE_FILENAME} - create it with --update-merkle", file=log)
+            else:
+                stale = tree.diff(stored)
+                print(
+                    f"WARNING: {MERKLE_FILENAME} is out of date for {len(stale)} reel(s) - "
+                    f"update it with --update-merkle (or `chain record`) and commit it",
+                    file=log
+                )
+        validated_tree = MerkleTree(cache.trees.get(cache_mode, {}))
+        if tree.root == validated_tree.root:
+            print(f"Merkle root {tree.root[:12]}... unchanged since last validation", file=log)
+            touched = set()
+        else:
+            changed = set(tree.diff(validated_tree))
+            touched = {reel for reel in touched if reel.name in changed}
+            print(f"Merkle root {tree.root[:12]}... differs: {len(changed)} of {len(reels)} reel(s) changed", file=log)
+
+    print(f"\nFound {len(reels)} reel(s) to validate:\n", file=log)
 
     total_errors = 0
     total_warnings = 0
+    validated = 0
     results = []
 
     for reel in reels:
-        print(f"Validating: {reel.name}")
-        print("-" * 40)
-
-        if args.chain_only:
-            is_valid, errors, warnings, metadata = validate_chain_only(reel)
-            results.append({
-                "reel_id": reel.name,
-                "passed": is_valid,
-                "errors": errors,
-                "warnings": warnings,
-                "metadata": metadata
-            })
-        else:
-            is_valid, errors, warnings = validate_reel(reel, chain_only=False)
-            results.append({
-                "reel_id": reel.name,
-                "passed": is_valid,
-                "errors": errors,
-                "warnings": warnings,
-                "metadata": {}
-            })
+        print(f"Validating: {reel.name}", file=log)
+        print("-" * 40, file=log)
+
+        result = None
+        if cache is not None and reel not in touched:
+            result = cache.get(cache_mode, cache_keys[reel])
+            if result is not None:
+                result = {**result, "reel_id": reel.name, "cached": True}
+                print("  (cached)", file=log)
+
+        if result is None:
+            result = run_validation(reel, mode, verifier)
+            validated += 1
+            if cache is not None:
+                cache.put(cache_mode, cache_keys[reel], result)
+
+        results.append(result)
+        if writer is not None:
+            writer.write(result)
+        errors = result["errors"]
+        warnings = result["warnings"]
 
         if warnings:
             for w in warnings:
-                print(f"  ⚠ {w}")
+                print(f"  ⚠ {w}", file=log)
             total_warnings += len(warnings)
 
         if errors:
             for e in errors:
-                print(f"  ✗ {e}")
+                print(f"  ✗ {e}", file=log)
             total_errors += len(errors)
-            print(f"  FAILED: {len(errors)} error(s)\n")
+            print(f"  FAILED: {len(errors)} error(s)\n", file=log)
         else:
-            print(f"  ✓ PASSED\n")
+            print(f"  ✓ PASSED\n", file=log)
+
+    if cache is not None:
+        if tree is not None:
+            cache.trees[cache_mode] = tree.leaves
+        cache.save()
+
+    if writer is not None:
+        writer.close({
+            "reels": len(reels),
+            "validated": validated,
+            "cached": len(reels) - validated,
+            "passed": sum(1 for r in results if r["passed"]),
+            "failed": sum(1 for r in results if not r["passed"]),
+            "errors": total_errors,
+            "warnings": total_warnings
+        })
 
     # Write GitHub summary
     write_github_summary(results)
 
     # Summary
-    print("=" * 60)
-    print("Summary")
-    print("=" * 60)
-    print(f"Reels validated: {len(reels)}")
-    print(f"Total errors: {total_errors}")
-    print(f"Total warnings: {total_warnings}")
-
+    print("=" * 60, file=log)
+    print("Summary", file=log)
+    print("=" * 60, file=log)
+    print(f"Reels validated: {validated}", file=log)
+    if validated < len(reels):
+        print(f"Reels from cache: {len(reels) - validated}", file=log)
+    print(f"Total errors: {total_errors}", file=log)
+    print(f"Total warnings: {total_warnings}", file=log)
+    if verifier is not None:
+        print(f"Signatures verified: {verifier.verified}", file=log)
+
+    failed = total_errors > 0 or (args.fail_on_warnings and total_warnings > 0)
     if total_errors > 0:
-        print("\n✗ CI FAILED")
-        sys.exit(1)
-
-    if args.fail_on_warnings and total_warnings > 0:
-        print("\n✗ CI FAILED (warnings treated as errors)")
-        sys.exit(1)
+        print("\n✗ CI FAILED", file=log)
+    elif failed:
+        print("\n✗ CI FAILED (warnings treated as errors)", file=log)
+    else:
+        print("\n✓ CI PASSED", file=log)
 
-    print("\n✓ CI PASSED")
-    sys.exit(0)
+    if out_file is not None:
+        out_file.close()
+    sys.exit(1 if failed else 0)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,473 @@
+"""
+Reel Database
+=============
+
+SQLite-backed record of every reel (db/reels.db) - id, subject, topic,
+status, timestamps and platforms - plus the per-subject counters the
+dashboard uses to suggest the next reel id.
+
+db/reels.json used to be the store: one document every script read and
+rewrote whole. Now it is an export. Lookups and status updates go through
+the primary key and the indexes on subject, status and created_at, so they
+stay O(log n) however large the back catalogue gets.
+
+Exports for the static dashboard:
+    db/reels.json                         full legacy document (existing consumers)
+    db/feed/summary.json                  counts, counters, latest N, page counts
+    db/feed/pages/<n>.json                fixed-size pages of all reels, newest first
+    db/feed/subjects/<subject>/<n>.json   the same, per subject
+
+The dashboard fetches only summary.json on load and pulls page shards when
+they are shown, so its load time doesn't grow with the back catalogue.
+
+An empty database is seeded from db/reels.json on first open.
+
+Usage:
+    python -m jeetlo_factory.database upsert bio-06-topic --subject biology --topic "..." --status ready_to_post
+    python -m jeetlo_factory.database status bio-06-topic posted --platform instagram
+    python -m jeetlo_factory.database list --subject biology --status posted
+    python -m jeetlo_factory.database export
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .exceptions import ValidationError
+
+
+DATABASE_FILENAME = "reels.db"
+EXPORT_FILENAME = "reels.json"
+FEED_DIRNAME = "feed"
+EXPORT_VERSION = "1.0.0"
+SCHEMA_VERSION = 1
+PAGE_SIZE = 50
+LATEST_COUNT = 12
+
+SUBJECTS = ("biology", "chemistry", "physics", "mathematics")
+STATUSES = ("in_progress", "ready_to_post", "posted", "failed")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reels (
+    reel_id    TEXT PRIMARY KEY,
+    subject    TEXT NOT NULL,
+    topic      TEXT NOT NULL DEFAULT '',
+    status     TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    posted_at  TEXT,
+    platforms  TEXT NOT NULL DEFAULT '[]'
+);
+CREATE INDEX IF NOT EXISTS idx_reels_subject ON reels(subject);
+CREATE INDEX IF NOT EXISTS idx_reels_status ON reels(status);
+CREATE INDEX IF NOT EXISTS idx_reels_created_at ON reels(created_at);
+CREATE TABLE IF NOT EXISTS counters (
+    subject TEXT PRIMARY KEY,
+    value   INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+COLUMNS = ("reel_id", "subject", "topic", "status", "created_at", "updated_at", "posted_at", "platforms")
+
+
+def now_iso() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def reel_number(reel_id: str) -> Optional[int]:
+    """The sequence number in ``bio-05-topic`` (5), if present."""
+    match = re.match(r"^[a-z]+-(\d+)", reel_id)
+    return int(match.group(1)) if match else None
+
+
+def _write_json(path: Path, data: Any):
+    """Write via a temp file so the dashboard never fetches a half-written shard."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+class ReelDatabase:
+    """The reel catalogue in db/reels.db."""
+
+    def __init__(self, db_dir: str):
+        self.db_dir = Path(db_dir)
+        self.path = self.db_dir / DATABASE_FILENAME
+        self.db_dir.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+        self.conn.execute(
+            "INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+            (str(SCHEMA_VERSION),)
+        )
+        self.conn.commit()
+
+        legacy = self.db_dir / EXPORT_FILENAME
+        if legacy.exists() and self.count() == 0:
+            self.import_json(str(legacy))
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self) -> "ReelDatabase":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    # ---------------------------------------------------------------- rows
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        reel = {key: row[key] for key in COLUMNS}
+        reel["platforms"] = json.loads(reel["platforms"] or "[]")
+        return reel
+
+    def get(self, reel_id: str) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute("SELECT * FROM reels WHERE reel_id = ?", (reel_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def upsert(
+        self,
+        reel_id: str,
+        subject: str,
+        topic: str = "",
+        status: str = "in_progress",
+        created_at: Optional[str] = None,
+        posted_at: Optional[str] = None,
+        platforms: Optional[List[str]] = None,
+        commit: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Insert a reel or update an existing one, keeping its created_at
+        (and topic/platforms when not given). Advances the subject counter
+        past the reel's number.
+        """
+        if subject not in SUBJECTS:
+            raise ValidationError(f"Unknown subject: {subject}. Must be one of {list(SUBJECTS)}")
+        if status not in STATUSES:
+            raise ValidationError(f"Unknown status: {status}. Must be one of {list(STATUSES)}")
+
+        now = now_iso()
+        self.conn.execute(
+            """
+            INSERT INTO reels (reel_id, subject, topic, status, created_at, updated_at, posted_at, platforms)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(reel_id) DO UPDATE SET
+                subject = excluded.subject,
+                topic = CASE WHEN excluded.topic != '' THEN excluded.topic ELSE reels.topic END,
+                status = excluded.status,
+                updated_at = excluded.updated_at,
+                posted_at = COALESCE(excluded.posted_at, reels.posted_at),
+                platforms = CASE WHEN excluded.platforms != '[]' THEN excluded.platforms ELSE reels.platforms END
+            """,
+            (reel_id, subject, topic or "", status, created_at or now, now, posted_at,
+             json.dumps(platforms or []))
+        )
+
+        number = reel_number(reel_id)
+        if number is not None:
+            self.conn.execute(
+                """
+                INSERT INTO counters (subject, value) VALUES (?, ?)
+                ON CONFLICT(subject) DO UPDATE SET value = MAX(counters.value, excluded.value)
+                """,
+                (subject, number)
+            )
+        if commit:
+            self.conn.commit()
+        return self.get(reel_id)
+
+    def set_status(
+        self,
+        reel_id: str,
+        status: str,
+        platforms: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Change a reel's status; "posted" also stamps posted_at."""
+        if status not in STATUSES:
+            raise ValidationError(f"Unknown status: {status}. Must be one of {list(STATUSES)}")
+        reel = self.get(reel_id)
+        if reel is None:
+            raise ValidationError(f"Reel not in database: {reel_id}")
+
+        now = now_iso()
+        posted_at = reel["posted_at"] or (now if status == "posted" else None)
+        merged = sorted(set(reel["platforms"]) | set(platforms or []))
+        self.conn.execute(
+            "UPDATE reels SET status = ?, updated_at = ?, posted_at = ?, platforms = ? WHERE reel_id = ?",
+            (status, now, posted_at, json.dumps(merged), reel_id)
+        )
+        self.conn.commit()
+        return self.get(reel_id)
+
+    def query(
+        self,
+        subject: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Reels, newest first, optionally filtered by subject and status."""
+        sql, params = self._where(subject, status)
+        sql = "SELECT * FROM reels" + sql + " ORDER BY created_at DESC, reel_id DESC"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+        return [self._to_dict(row) for row in self.conn.execute(sql, params)]
+
+    def count(self, subject: Optional[str] = None, status: Optional[str] = None) -> int:
+        sql, params = self._where(subject, status)
+        return self.conn.execute("SELECT COUNT(*) FROM reels" + sql, params).fetchone()[0]
+
+    @staticmethod
+    def _where(subject: Optional[str], status: Optional[str]):
+        clauses, params = [], []
+        if subject:
+            clauses.append("subject = ?")
+            params.append(subject)
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def counters(self) -> Dict[str, int]:
+        values = {subject: 0 for subject in SUBJECTS}
+        values.update({row["subject"]: row["value"] for row in self.conn.execute("SELECT * FROM counters")})
+        return values
+
+    def last_updated(self) -> str:
+        row = self.conn.execute("SELECT MAX(updated_at) FROM reels").fetchone()
+        return row[0] or now_iso()
+
+    # -------------------------------------------------------- import/export
+
+    def import_json(self, path: str) -> int:
+        """
+        Load a reels.json document. Older script-appended entries used
+        ``id``/``updated`` instead of ``reel_id``/``created_at``.
+        """
+        with open(path, "r") as f:
+            data = json.load(f)
+
+        imported = 0
+        for entry in data.get("reels", []):
+            reel_id = entry.get("reel_id") or entry.get("id")
+            if not reel_id or entry.get("subject") not in SUBJECTS:
+                continue
+            created = entry.get("created_at") or entry.get("updated")
+            if isinstance(created, (int, float)):
+                created = datetime.fromtimestamp(created, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+            status = entry.get("status") if entry.get("status") in STATUSES else "in_progress"
+            self.upsert(
+                reel_id, entry["subject"], entry.get("topic", ""), status,
+                created_at=created, posted_at=entry.get("posted_at"),
+                platforms=entry.get("platforms"), commit=False
+            )
+            imported += 1
+
+        for subject, value in data.get("counters", {}).items():
+            self.conn.execute(
+                """
+                INSERT INTO counters (subject, value) VALUES (?, ?)
+                ON CONFLICT(subject) DO UPDATE SET value = MAX(counters.value, excluded.value)
+                """,
+                (subject, int(value))
+            )
+        self.conn.commit()
+        return imported
+
+    def _export_reel(self, reel: Dict[str, Any]) -> Dict[str, Any]:
+        exported = {key: reel[key] for key in ("reel_id", "subject", "topic", "status", "created_at")}
+        if reel["posted_at"]:
+            exported["posted_at"] = reel["posted_at"]
+        exported["platforms"] = reel["platforms"]
+        return exported
+
+    def iter_export(self, subject: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        sql, params = self._where(subject, None)
+        rows = self.conn.execute(
+            "SELECT * FROM reels" + sql + " ORDER BY created_at DESC, reel_id DESC", params
+        )
+        for row in rows:
+            yield self._export_reel(self._to_dict(row))
+
+    def export_json(self, path: Optional[str] = None) -> Path:
+        """Write the legacy reels.json document (oldest first, as before)."""
+        path = Path(path) if path else self.db_dir / EXPORT_FILENAME
+        reels = list(self.iter_export())
+        reels.reverse()
+        _write_json(path, {
+            "version": EXPORT_VERSION,
+            "last_updated": self.last_updated(),
+            "counters": self.counters(),
+            "reels": reels
+        })
+        return path
+
+    def export_pages(
+        self,
+        out_dir: str,
+        page_size: int = PAGE_SIZE,
+        subject: Optional[str] = None
+    ) -> List[Path]:
+        """
+        Write fixed-size pages, newest first, to ``<out_dir>/<n>.json``
+        (1-based) and drop pages left over from a larger catalogue.
+        """
+        out = Path(out_dir)
+        total = self.count(subject)
+        pages = max(1, -(-total // page_size))
+        written = []
+        reels = self.iter_export(subject)
+        for page in range(1, pages + 1):
+            chunk = [reel for _, reel in zip(range(page_size), reels)]
+            path = out / f"{page}.json"
+            _write_json(path, {
+                "subject": subject,
+                "page": page,
+                "pages": pages,
+                "page_size": page_size,
+                "total": total,
+                "reels": chunk
+            })
+            written.append(path)
+
+        for stale in out.glob("*.json"):
+            if stale.stem.isdigit() and int(stale.stem) > pages:
+                stale.unlink()
+        return written
+
+    def summary(self, page_size: int = PAGE_SIZE, latest: int = LATEST_COUNT) -> Dict[str, Any]:
+        """Everything the dashboard shows before any shard is fetched."""
+        by_subject: Dict[str, Dict[str, int]] = {subject: {} for subject in SUBJECTS}
+        by_status: Dict[str, int] = {}
+        for row in self.conn.execute("SELECT subject, status, COUNT(*) AS n FROM reels GROUP BY subject, status"):
+            by_subject.setdefault(row["subject"], {})[row["status"]] = row["n"]
+            by_status[row["status"]] = by_status.get(row["status"], 0) + row["n"]
+
+        total = sum(by_status.values())
+        subjects = {}
+        for subject, statuses in by_subject.items():
+            count = sum(statuses.values())
+            subjects[subject] = {
+                "total": count,
+                "statuses": statuses,
+                "pages": max(1, -(-count // page_size)),
+                "shard": f"subjects/{subject}/"
+            }
+
+        return {
+            "version": EXPORT_VERSION,
+            "last_updated": self.last_updated(),
+            "counters": self.counters(),
+            "total": total,
+            "statuses": by_status,
+            "subjects": subjects,
+            "page_size": page_size,
+            "pages": max(1, -(-total // page_size)),
+            "shard": "pages/",
+            "latest": [self._export_reel(reel) for reel in self.query(limit=latest)]
+        }
+
+    def export(self, page_size: int = PAGE_SIZE) -> Dict[str, Any]:
+        """All dashboard exports into the database directory."""
+        legacy = self.export_json()
+        feed = self.db_dir / FEED_DIRNAME
+        pages = self.export_pages(str(feed / "pages"), page_size)
+        for subject in SUBJECTS:
+            self.export_pages(str(feed / "subjects" / subject), page_size, subject)
+        # Summary last: its page counts must never point past shards that exist yet
+        _write_json(feed / "summary.json", self.summary(page_size))
+        return {"json": str(legacy), "pages": len(pages)}
+
+
+def default_db_dir() -> str:
+    """db/ of the factory checkout this package lives in."""
+    return str(Path(__file__).resolve().parents[2] / "db")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Reel database (db/reels.db) and dashboard exports"
+    )
+    parser.add_argument(
+        "--db",
+        default=default_db_dir(),
+        help="Database directory (default: the factory's db/)"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    upsert = sub.add_parser("upsert", help="Add or update a reel")
+    upsert.add_argument("reel_id")
+    upsert.add_argument("--subject", required=True, choices=SUBJECTS)
+    upsert.add_argument("--topic", default="")
+    upsert.add_argument("--status", default="in_progress", choices=STATUSES)
+    upsert.add_argument("--no-export", action="store_true", help="Don't refresh the JSON exports")
+
+    status = sub.add_parser("status", help="Change a reel's status")
+    status.add_argument("reel_id")
+    status.add_argument("status", choices=STATUSES)
+    status.add_argument("--platform", action="append", default=[], help="Platform posted to (repeatable)")
+    status.add_argument("--no-export", action="store_true", help="Don't refresh the JSON exports")
+
+    show = sub.add_parser("list", help="List reels, newest first")
+    show.add_argument("--subject", choices=SUBJECTS)
+    show.add_argument("--status", choices=STATUSES)
+    show.add_argument("--limit", type=int, default=20)
+    show.add_argument("--json", action="store_true", help="Print as JSON")
+
+    imp = sub.add_parser("import", help="Load a reels.json document")
+    imp.add_argument("path")
+
+    export = sub.add_parser("export", help="Write reels.json and the sharded feed")
+    export.add_argument("--page-size", type=int, default=PAGE_SIZE)
+
+    args = parser.parse_args()
+
+    with ReelDatabase(args.db) as db:
+        try:
+            if args.command == "upsert":
+                reel = db.upsert(args.reel_id, args.subject, args.topic, args.status)
+                print(f"✓ {reel['reel_id']}: {reel['status']}")
+            elif args.command == "status":
+                reel = db.set_status(args.reel_id, args.status, args.platform)
+                print(f"✓ {reel['reel_id']}: {reel['status']}")
+            elif args.command == "import":
+                print(f"✓ Imported {db.import_json(args.path)} reels")
+            elif args.command == "list":
+                reels = db.query(args.subject, args.status, limit=args.limit)
+                if args.json:
+                    print(json.dumps(reels, indent=2, ensure_ascii=False))
+                else:
+                    for reel in reels:
+                        print(f"  {reel['reel_id']:<40} {reel['subject']:<12} {reel['status']:<14} {reel['created_at']}")
+                    print(f"{len(reels)} of {db.count(args.subject, args.status)} reels")
+        except ValidationError as e:
+            print(f"  ✗ {e}")
+            sys.exit(1)
+
+        if args.command == "export" or (args.command in ("upsert", "status") and not args.no_export):
+            result = db.export(getattr(args, "page_size", PAGE_SIZE))
+            print(f"✓ Exported {result['json']} and {result['pages']} feed page(s)")
+
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
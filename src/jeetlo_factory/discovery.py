@@ -0,0 +1,207 @@
+"""
+Reel Discovery
+==============
+
+Finds reel directories (those with a manifest, or a .proof_chain.json
+from the shell pipeline) without walking the
+generated trees inside them. A reel holds media/, audio/, frame dumps and
+Manim partial movie files - thousands of entries that never contain a
+manifest. Discovery:
+
+1. Walks with os.scandir to a bounded depth
+2. Prunes known heavy/generated directories
+3. Stops descending once a directory has a chain file (reels don't nest)
+
+An optional catalogue index (``.jeetlo_catalogue.json`` in the base
+directory) records reel id -> path, chain file and its mtime, plus the mtime of
+every container directory walked. Adding or removing a reel changes its
+parent's mtime, so when all recorded mtimes match the index is returned
+as-is with a handful of stat calls. Reel.create refreshes an existing
+index; jeetlo-validate --index creates one.
+
+Usage:
+    reels = find_reels("reels")                  # scan
+    reels = find_reels("reels", use_index=True)  # index, rescan if stale
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from .manifest import MANIFEST_FILENAME, PROOF_CHAIN_FILENAME
+
+
+CATALOGUE_FILENAME = ".jeetlo_catalogue.json"
+CATALOGUE_VERSION = 2
+# Files that make a directory a reel, in order of preference
+CHAIN_FILENAMES = (MANIFEST_FILENAME, PROOF_CHAIN_FILENAME)
+MAX_DEPTH = 4
+
+# Never contain manifests; some hold thousands of files
+PRUNED_DIRS = frozenset({
+    ".git", ".github", "node_modules", "__pycache__", ".venv", "venv",
+    ".pytest_cache", ".mypy_cache", ".ruff_cache", ".tox",
+    "media", "audio", "frames", "partial_movie_files", "images", "videos",
+    "Tex", "texts", "qa_frames",
+})
+
+
+def _is_pruned(name: str) -> bool:
+    return name in PRUNED_DIRS or name.startswith(".")
+
+
+def scan_reels(
+    base_path: str,
+    max_depth: int = MAX_DEPTH,
+    markers: Tuple[str, ...] = CHAIN_FILENAMES
+) -> Tuple[List[Path], Dict[str, float]]:
+    """
+    Walk base_path for reel directories (holding any of ``markers``).
+
+    Returns:
+        Tuple of (reel paths, {container dir: mtime}) where container
+        dirs are the non-reel directories that were listed.
+    """
+    reels: List[Path] = []
+    containers: Dict[str, float] = {}
+    stack = [(str(Path(base_path)), 0)]
+
+    while stack:
+        directory, depth = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                subdirs = []
+                is_reel = False
+                for entry in entries:
+                    if entry.name in markers:
+                        is_reel = True
+                    elif depth < max_depth and not _is_pruned(entry.name) and entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+
+        if is_reel:
+            reels.append(Path(directory))
+            continue
+
+        containers[directory] = os.stat(directory).st_mtime
+        stack.extend((d, depth + 1) for d in subdirs)
+
+    return sorted(reels), containers
+
+
+class ReelCatalogue:
+    """Index of reels under a base directory, stored next to them."""
+
+    def __init__(self, base_path: str):
+        self.base_path = Path(base_path)
+        self.path = self.base_path / CATALOGUE_FILENAME
+        self.reels: Dict[str, Dict[str, Any]] = {}
+        self.containers: Dict[str, float] = {}
+
+    @classmethod
+    def load(cls, base_path: str) -> "ReelCatalogue":
+        catalogue = cls(base_path)
+        if catalogue.path.exists():
+            try:
+                with open(catalogue.path, "r") as f:
+                    data = json.load(f)
+                if data.get("version") == CATALOGUE_VERSION:
+                    catalogue.reels = data.get("reels", {})
+                    catalogue.containers = data.get("containers", {})
+            except (json.JSONDecodeError, OSError):
+                pass
+        return catalogue
+
+    def save(self):
+        created = not self.path.exists()
+        self._write()
+        if created and str(self.base_path) in self.containers:
+            # Creating the index file bumped the base directory's mtime;
+            # rewriting in place does not
+            self.containers[str(self.base_path)] = os.stat(self.base_path).st_mtime
+            self._write()
+
+    def _write(self):
+        with open(self.path, "w") as f:
+            json.dump({
+                "version": CATALOGUE_VERSION,
+                "reels": self.reels,
+                "containers": self.containers
+            }, f, indent=2, sort_keys=True)
+
+    def _entry(self, reel_path: Path) -> Dict[str, Any]:
+        chain = next(reel_path / name for name in CHAIN_FILENAMES if (reel_path / name).exists())
+        return {
+            "path": os.path.relpath(reel_path, self.base_path),
+            "chain": chain.name,
+            "chain_mtime": chain.stat().st_mtime
+        }
+
+    def rebuild(self, max_depth: int = MAX_DEPTH):
+        """Rescan the base directory and replace the index."""
+        reels, self.containers = scan_reels(str(self.base_path), max_depth)
+        self.reels = {reel.name: self._entry(reel) for reel in reels}
+
+    def is_fresh(self) -> bool:
+        """True if no container directory changed and every chain file still exists."""
+        if not self.containers:
+            return False
+        for directory, mtime in self.containers.items():
+            try:
+                if os.stat(directory).st_mtime != mtime:
+                    return False
+            except FileNotFoundError:
+                return False
+        return all(
+            (self.base_path / entry["path"] / entry["chain"]).exists()
+            for entry in self.reels.values()
+        )
+
+    def paths(self, include_proof_chains: bool = True) -> List[Path]:
+        return sorted(
+            self.base_path / entry["path"] for entry in self.reels.values()
+            if include_proof_chains or entry["chain"] == MANIFEST_FILENAME
+        )
+
+
+def find_reels(
+    base_path: str,
+    use_index: bool = False,
+    max_depth: int = MAX_DEPTH,
+    include_proof_chains: bool = False
+) -> List[Path]:
+    """
+    Find all reel directories under base_path: those with manifests, plus
+    shell-pipeline reels (only a .proof_chain.json) if ``include_proof_chains``.
+
+    With ``use_index``, the catalogue index is used when fresh and
+    rebuilt (and saved) when not.
+    """
+    if not use_index:
+        markers = CHAIN_FILENAMES if include_proof_chains else (MANIFEST_FILENAME,)
+        reels, _ = scan_reels(base_path, max_depth, markers)
+        return reels
+
+    catalogue = ReelCatalogue.load(base_path)
+    if not catalogue.is_fresh():
+        catalogue.rebuild(max_depth)
+        catalogue.save()
+    return catalogue.paths(include_proof_chains)
+
+
+def update_catalogue(base_path: str) -> bool:
+    """
+    Rebuild the catalogue index of base_path if it has one (called by Reel.create).
+
+    A full rescan rather than an insert, so reels added by the shell
+    pipeline since the last update are picked up too. Returns True if an
+    index was updated.
+    """
+    catalogue = ReelCatalogue.load(base_path)
+    if not catalogue.path.exists():
+        return False
+    catalogue.rebuild()
+    catalogue.save()
+    return True
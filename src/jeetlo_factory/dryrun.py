@@ -0,0 +1,278 @@
+"""
+Dry Run - Layout Pass Without Rendering
+=======================================
+
+Executes a reel's construct() with Manim's dry_run config and
+animation skipping, so no frame is rasterised and nothing is written
+except the layout log. Then validates what the pass recorded:
+
+1. The scene actually plays animations
+2. Scene duration matches audio/timings.json (same 1.0s rule as render)
+3. No overlapping or out-of-frame text (LayoutChecker)
+4. Mobject counts stay sane (nothing piling up on screen)
+
+This is the cheapest gate before spending minutes of CPU on a render.
+
+Usage:
+    python -m jeetlo_factory.dryrun reels/phy-01-gravity
+    python -m jeetlo_factory.dryrun reels/phy-01-gravity --class PhysicsReel
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .layout import LayoutChecker, LAYOUT_LOG_ENV
+
+
+DRY_RUN_LOG_FILENAME = ".layout_log.dryrun.jsonl"
+MAX_MOBJECTS = 250         # more than this on screen at once renders slowly
+MAX_FINAL_MOBJECTS = 25    # leftovers after the CTA mean segments don't clean up
+
+SCENE_CLASS_PATTERN = re.compile(r"^class\s+(\w+)\s*\(.*Scene.*\)\s*:", re.MULTILINE)
+
+
+def find_scene_class(reel_py: str) -> Optional[str]:
+    """First Scene subclass defined in reel.py (same rule as jeetlo.sh render)."""
+    with open(reel_py, "r") as f:
+        match = SCENE_CLASS_PATTERN.search(f.read())
+    return match.group(1) if match else None
+
+
+def execute_dry_run(reel_py: str, class_name: str, layout_log: str):
+    """
+    Run construct() in this process with rendering disabled.
+
+    Requires Manim. Reels that don't use jeetlo_factory.style get the
+    LayoutRecorderMixin mixed in so every reel produces a layout log.
+    """
+    import importlib.util
+
+    from manim import tempconfig
+    from manim.renderer.cairo_renderer import CairoRenderer
+
+    from .style import LayoutRecorderMixin
+
+    reel_py = Path(reel_py).resolve()
+    os.environ[LAYOUT_LOG_ENV] = str(Path(layout_log).resolve())
+    os.chdir(reel_py.parent)  # reels open audio/timings.json relatively
+    sys.path.insert(0, str(reel_py.parent))
+
+    with tempconfig({
+        "dry_run": True,
+        "disable_caching": True,
+        "progress_bar": "none",
+        "verbosity": "ERROR"
+    }):
+        spec = importlib.util.spec_from_file_location("reel", str(reel_py))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        scene_cls = getattr(module, class_name)
+        if not issubclass(scene_cls, LayoutRecorderMixin):
+            scene_cls = type(class_name, (LayoutRecorderMixin, scene_cls), {})
+
+        # skip_animations: play() computes durations and final states
+        # but never rasterises a frame
+        scene = scene_cls(renderer=CairoRenderer(skip_animations=True))
+        scene.render()
+
+
+def load_expected_duration(reel_path: Path) -> Optional[float]:
+    """Total audio duration from timings.json, if the reel has one."""
+    for timings_path in (reel_path / "audio" / "timings.json", reel_path / "timings.json"):
+        if timings_path.exists():
+            try:
+                with open(timings_path, "r") as f:
+                    timings = json.load(f)
+                return sum(float(s.get("duration", 0)) for s in timings)
+            except (json.JSONDecodeError, TypeError, ValueError):
+                return None
+    return None
+
+
+class DryRunValidator:
+    """Runs the dry-run pass for a reel and validates the results."""
+
+    def __init__(self, reel_path: str, class_name: Optional[str] = None, timeout: int = 300):
+        self.reel_path = Path(reel_path)
+        self.reel_py = self.reel_path / "reel.py"
+        self.class_name = class_name
+        self.timeout = timeout
+        self.layout_log = self.reel_path / DRY_RUN_LOG_FILENAME
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+        self.stats: Dict[str, Any] = {}
+
+    def validate(self) -> Tuple[bool, List[str], List[str]]:
+        """
+        Execute reel.py with rendering off and check the recorded scene.
+
+        Returns:
+            Tuple of (is_valid, errors, warnings)
+        """
+        self._execute()
+        if self.errors:
+            return False, self.errors, self.warnings
+
+        self._check_layout()
+        self._check_plays()
+        self._check_duration()
+        self._check_mobjects()
+
+        return len(self.errors) == 0, self.errors, self.warnings
+
+    def _execute(self):
+        """Run the dry pass in a fresh interpreter (reels mutate global Manim config)."""
+        if not self.reel_py.exists():
+            self.errors.append(f"DRY RUN ERROR: No reel.py found at {self.reel_py}")
+            return
+
+        self.class_name = self.class_name or find_scene_class(str(self.reel_py))
+        if not self.class_name:
+            self.errors.append("DRY RUN ERROR: No Scene subclass found in reel.py")
+            return
+
+        if self.layout_log.exists():
+            self.layout_log.unlink()
+
+        package_root = str(Path(__file__).resolve().parent.parent)
+        env = {
+            **os.environ,
+            "PYTHONPATH": os.pathsep.join(p for p in (package_root, os.environ.get("PYTHONPATH")) if p)
+        }
+
+        start = time.perf_counter()
+        try:
+            result = subprocess.run(
+                [
+                    sys.executable, "-m", "jeetlo_factory.dryrun",
+                    str(self.reel_path), "--class", self.class_name, "--execute-only"
+                ],
+                capture_output=True,
+                text=True,
+                timeout=self.timeout,
+                env=env
+            )
+        except subprocess.TimeoutExpired:
+            self.errors.append(f"DRY RUN ERROR: construct() did not finish within {self.timeout}s")
+            return
+        self.stats["seconds"] = round(time.perf_counter() - start, 3)
+        self.stats["scene"] = self.class_name
+
+        if result.returncode != 0:
+            tail = result.stderr.strip().splitlines()[-5:]
+            self.errors.append(
+                f"DRY RUN ERROR: {self.class_name}.construct() failed: " + " | ".join(tail)
+            )
+        elif not self.layout_log.exists():
+            self.errors.append("DRY RUN ERROR: Scene ran but recorded no play/wait calls")
+
+    def _check_layout(self):
+        checker = LayoutChecker(str(self.layout_log))
+        _, errors, warnings = checker.validate()
+        self.errors.extend(errors)
+        self.warnings.extend(warnings)
+        self.stats.update(checker.stats)
+
+    def _check_plays(self):
+        if not self.stats.get("plays"):
+            self.errors.append("DRY RUN ERROR: Scene plays no animations")
+
+    def _check_duration(self):
+        expected = load_expected_duration(self.reel_path)
+        actual = self.stats.get("duration", 0.0)
+        if expected is None:
+            self.warnings.append("WARNING: No timings.json - scene duration not checked against audio")
+            return
+
+        self.stats["audio_duration"] = round(expected, 3)
+        diff = abs(actual - expected)
+        if diff > 1.0:
+            self.errors.append(
+                f"DRY RUN ERROR: Scene runs {actual:.2f}s but audio is {expected:.2f}s "
+                f"(diff {diff:.2f}s, max allowed: 1.0s)"
+            )
+        elif diff > 0.5:
+            self.warnings.append(
+                f"WARNING: Scene/audio duration difference is {diff:.2f}s (consider tightening)"
+            )
+
+    def _check_mobjects(self):
+        if self.stats.get("max_mobjects", 0) > MAX_MOBJECTS:
+            self.warnings.append(
+                f"WARNING: {self.stats['max_mobjects']} mobjects on screen at once "
+                f"(>{MAX_MOBJECTS}) - render will be slow"
+            )
+        if self.stats.get("final_mobjects", 0) > MAX_FINAL_MOBJECTS:
+            self.warnings.append(
+                f"WARNING: {self.stats['final_mobjects']} mobjects still on screen at the end - "
+                f"segments may not be cleaning up"
+            )
+
+
+def validate_dry_run(reel_path: str, class_name: Optional[str] = None) -> Tuple[bool, List[str], List[str], Dict[str, Any]]:
+    """Dry-run a reel. Returns (is_valid, errors, warnings, stats)."""
+    validator = DryRunValidator(reel_path, class_name)
+    is_valid, errors, warnings = validator.validate()
+    return is_valid, errors, warnings, validator.stats
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="JeetLo Factory dry run (construct() with rendering disabled)"
+    )
+    parser.add_argument(
+        "reel_path",
+        help="Reel directory containing reel.py"
+    )
+    parser.add_argument(
+        "--class",
+        dest="class_name",
+        help="Scene class to run (default: first Scene subclass in reel.py)"
+    )
+    parser.add_argument(
+        "--execute-only",
+        action="store_true",
+        help=argparse.SUPPRESS  # Internal: the isolated interpreter run
+    )
+
+    args = parser.parse_args()
+
+    if args.execute_only:
+        reel_path = Path(args.reel_path).resolve()
+        execute_dry_run(
+            str(reel_path / "reel.py"),
+            args.class_name,
+            str(reel_path / DRY_RUN_LOG_FILENAME)
+        )
+        sys.exit(0)
+
+    is_valid, errors, warnings, stats = validate_dry_run(args.reel_path, args.class_name)
+
+    if stats.get("scene"):
+        print(f"Dry run: {stats['scene']} - {stats.get('plays', 0)} plays, "
+              f"{stats.get('waits', 0)} waits, {stats.get('duration', 0):.1f}s scene time, "
+              f"max {stats.get('max_mobjects', 0)} mobjects ({stats.get('seconds', 0):.1f}s)")
+
+    for w in warnings:
+        print(f"  ⚠ {w}")
+    for e in errors:
+        print(f"  ✗ {e}")
+
+    if not is_valid:
+        print(f"✗ Dry run FAILED: {len(errors)} error(s)")
+        sys.exit(1)
+
+    print("✓ Dry run PASSED")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""
+Incremental CI Validation
+=========================
+
+Lets jeetlo-validate do work proportional to the diff, not the catalogue:
+
+1. ``changed_paths(rev)`` - files changed since a base revision
+   (committed, staged, unstaged and untracked) via ``git diff --name-only``
+2. ``select_changed(reels, paths)`` - reels containing any changed file
+3. ``ResultsCache`` - previous pass/fail per reel keyed by content hash,
+   so untouched reels are reported without re-validating
+4. ``chain_leaves`` - current chain file ids for the catalogue Merkle tree
+   (merkle.py); with the tree last validated, kept in the results cache,
+   a no-op push is one root comparison
+
+Content keys come from git where possible: the tree id of a clean reel
+directory (one ``git ls-tree`` for all reels) is already a hash of its
+tracked contents. Reels with uncommitted changes, and modes that read
+untracked media, are hashed from disk.
+"""
+
+import hashlib
+import json
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from .manifest import find_chain_file, get_file_hash
+from .merkle import MerkleTree, file_blob_id
+
+
+CACHE_FILENAME = ".jeetlo_ci_cache.json"
+CACHE_VERSION = 1
+
+
+def _git(args: List[str], cwd: Path) -> Optional[str]:
+    """Run a git command, returning stdout or None if git fails."""
+    try:
+        result = subprocess.run(
+            ["git"] + args,
+            capture_output=True,
+            text=True,
+            cwd=str(cwd)
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout
+
+
+def git_toplevel(path: Path) -> Optional[Path]:
+    """Root of the git work tree containing path."""
+    out = _git(["rev-parse", "--show-toplevel"], path)
+    return Path(out.strip()).resolve() if out else None
+
+
+def changed_paths(rev: str, base_path: str) -> Optional[Set[Path]]:
+    """
+    Absolute paths changed between ``rev`` and the working tree.
+
+    Includes untracked files. Returns None if git can't answer (not a
+    repo, unknown revision), in which case callers validate everything.
+    """
+    base = Path(base_path).resolve()
+    top = git_toplevel(base)
+    if top is None:
+        return None
+
+    diff = _git(["diff", "--name-only", rev, "--", str(base)], top)
+    if diff is None:
+        return None
+    untracked = _git(["ls-files", "--others", "--exclude-standard", "--", str(base)], top) or ""
+
+    return {(top / line).resolve() for line in (diff + untracked).splitlines() if line.strip()}
+
+
+def dirty_paths(base_path: str) -> Set[Path]:
+    """Absolute paths with uncommitted changes (vs HEAD), including untracked."""
+    base = Path(base_path).resolve()
+    top = git_toplevel(base)
+    if top is None:
+        return set()
+    out = _git(["status", "--porcelain", "--untracked-files=all", "--", str(base)], top) or ""
+    paths = set()
+    for line in out.splitlines():
+        name = line[3:].split(" -> ")[-1].strip('"')
+        if name:
+            paths.add((top / name).resolve())
+    return paths
+
+
+def _touches(reel: Path, paths: Iterable[Path]) -> bool:
+    return any(p == reel or reel in p.parents for p in paths)
+
+
+def select_changed(reels: List[Path], paths: Set[Path]) -> List[Path]:
+    """Reels that contain at least one of the changed paths."""
+    return [reel for reel in reels if _touches(reel.resolve(), paths)]
+
+
+def reel_content_hash(reel_path: Path) -> str:
+    """SHA256 over relative path + content hash of every file in a reel."""
+    sha256 = hashlib.sha256()
+    reel_path = Path(reel_path)
+    for f in sorted(reel_path.rglob("*")):
+        if f.is_file():
+            sha256.update(str(f.relative_to(reel_path)).encode())
+            sha256.update(get_file_hash(str(f)).encode())
+    return sha256.hexdigest()
+
+
+def reel_cache_keys(reels: List[Path], base_path: str, use_git: bool = True) -> Dict[Path, str]:
+    """
+    Content key per reel.
+
+    With ``use_git``, clean reels use their git tree id at HEAD (one git
+    call for all). Dirty reels, and every reel when ``use_git`` is off
+    (validators that read ignored media files), are hashed from disk.
+    """
+    keys: Dict[Path, str] = {}
+    base = Path(base_path).resolve()
+    top = git_toplevel(base) if use_git else None
+    resolved = {reel: reel.resolve() for reel in reels}
+
+    if top is not None and reels:
+        dirty = dirty_paths(base_path)
+        rel = {str(path.relative_to(top)): reel for reel, path in resolved.items()
+               if top in path.parents and not _touches(path, dirty)}
+        out = _git(["ls-tree", "HEAD", "--"] + sorted(rel), top) or ""
+        for line in out.splitlines():
+            meta, _, name = line.partition("\t")
+            parts = meta.split()
+            if len(parts) == 3 and parts[1] == "tree" and name in rel:
+                keys[rel[name]] = "git:" + parts[2]
+
+    for reel in reels:
+        if reel not in keys:
+            keys[reel] = "sha256:" + reel_content_hash(reel)
+    return keys
+
+
+def chain_leaves(reels: List[Path], base_path: str, stored: Optional[MerkleTree] = None) -> Dict[str, str]:
+    """
+    reel id -> git blob id of each reel's chain file.
+
+    Clean tracked files take their id from the git index (one
+    ``git ls-files -s`` call); dirty ones are read. Outside git, ids come
+    from the ``stored`` tree where it has the reel, else from the file.
+    """
+    chains = {reel.name: find_chain_file(str(reel)) for reel in reels}
+    chains = {reel_id: path.resolve() for reel_id, path in chains.items() if path is not None}
+    base = Path(base_path).resolve()
+    top = git_toplevel(base)
+    leaves: Dict[str, str] = {}
+
+    if top is not None:
+        dirty = dirty_paths(base_path)
+        by_rel = {str(path.relative_to(top)): reel_id for reel_id, path in chains.items()
+                  if top in path.parents and path not in dirty}
+        out = _git(["ls-files", "-s", "--"] + sorted(by_rel), top) if by_rel else ""
+        for line in (out or "").splitlines():
+            meta, _, name = line.partition("\t")
+            parts = meta.split()
+            if len(parts) == 3 and name in by_rel:
+                leaves[by_rel[name]] = parts[1]
+    elif stored is not None:
+        leaves.update((r, stored.leaves[r]) for r in chains if r in stored.leaves)
+
+    for reel_id, path in chains.items():
+        if reel_id not in leaves:
+            leaves[reel_id] = file_blob_id(str(path))
+    return leaves
+
+
+class ResultsCache:
+    """
+    Previous validation results keyed by (mode, reel content key).
+
+    Stored as JSON; a cache written by another package version is ignored
+    because validators may have changed. ``trees`` holds, per mode, the
+    Merkle leaves of the catalogue as last validated.
+    """
+
+    def __init__(self, path: str, package_version: str):
+        self.path = Path(path)
+        self.package_version = package_version
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.trees: Dict[str, Dict[str, str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, path: str, package_version: str) -> "ResultsCache":
+        cache = cls(path, package_version)
+        if cache.path.exists():
+            try:
+                with open(cache.path, "r") as f:
+                    data = json.load(f)
+                if data.get("version") == CACHE_VERSION and data.get("package_version") == package_version:
+                    cache.entries = data.get("entries", {})
+                    cache.trees = data.get("trees", {})
+            except (json.JSONDecodeError, OSError):
+                pass
+        return cache
+
+    @staticmethod
+    def _key(mode: str, content_key: str) -> str:
+        return f"{mode}:{content_key}"
+
+    def get(self, mode: str, content_key: str) -> Optional[Dict[str, Any]]:
+        entry = self.entries.get(self._key(mode, content_key))
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def put(self, mode: str, content_key: str, result: Dict[str, Any]):
+        self.entries[self._key(mode, content_key)] = {
+            **result,
+            "cached_at": datetime.now(timezone.utc).isoformat()
+        }
+
+    def save(self):
+        with open(self.path, "w") as f:
+            json.dump({
+                "version": CACHE_VERSION,
+                "package_version": self.package_version,
+                "entries": self.entries,
+                "trees": self.trees
+            }, f, indent=2)
@@ -0,0 +1,133 @@
+"""
+Step Instrumentation
+====================
+
+Measures what a pipeline step costs so it can be recorded in the
+manifest next to its hashes:
+
+- wall_seconds: elapsed time
+- cpu_seconds: CPU time of this process (user + system)
+- child_cpu_seconds: CPU time of finished child processes (manim, ffmpeg, node)
+- child_max_rss_mb: peak RSS of the largest finished child process
+- io: bytes read/written by this process and its finished children
+  (Linux /proc/self/io), or block operations from getrusage elsewhere
+
+Python usage (Reel methods):
+    perf = measure().start()
+    subprocess.run(["manim", ...])
+    manifest.add_step(..., metadata={..., "perf": perf.stop()})
+
+or as a context manager:
+    with measure() as perf:
+        ...
+    perf.metrics
+
+Shell usage (jeetlo.sh wraps its heavy commands):
+    python -m jeetlo_factory.perf run --json perf.json -- ffmpeg -i ...
+
+getrusage only reports the largest child seen by the process so far, so
+child_max_rss_mb is exact for the first step in a process (every
+jeetlo.sh command) and whenever a step's child is the largest yet.
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+PROC_IO = Path("/proc/self/io")
+
+
+def _maxrss_mb(rusage) -> float:
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return rusage.ru_maxrss / divisor
+
+
+def _read_proc_io() -> Optional[Dict[str, int]]:
+    try:
+        with open(PROC_IO, "r") as f:
+            fields = dict(line.split(":", 1) for line in f if ":" in line)
+        return {
+            "read_bytes": int(fields["read_bytes"]),
+            "write_bytes": int(fields["write_bytes"])
+        }
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def snapshot() -> Dict[str, Any]:
+    """Current counters for this process and its finished children."""
+    snap: Dict[str, Any] = {
+        "wall": time.perf_counter(),
+        "cpu": time.process_time(),
+        "io": _read_proc_io()
+    }
+    if resource is not None:
+        self_usage = resource.getrusage(resource.RUSAGE_SELF)
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        snap["child_cpu"] = children.ru_utime + children.ru_stime
+        snap["child_max_rss_mb"] = _maxrss_mb(children)
+        snap["blocks"] = {
+            "read_blocks": self_usage.ru_inblock + children.ru_inblock,
+            "write_blocks": self_usage.ru_oublock + children.ru_oublock
+        }
+    return snap
+
+
+def diff_snapshots(start: Dict[str, Any], end: Dict[str, Any]) -> Dict[str, Any]:
+    """Metrics for the interval between two snapshots."""
+    metrics: Dict[str, Any] = {
+        "wall_seconds": round(end["wall"] - start["wall"], 3),
+        "cpu_seconds": round(end["cpu"] - start["cpu"], 3)
+    }
+    if "child_cpu" in end:
+        metrics["child_cpu_seconds"] = round(end["child_cpu"] - start["child_cpu"], 3)
+        metrics["child_max_rss_mb"] = round(end["child_max_rss_mb"], 1)
+
+    if start.get("io") and end.get("io"):
+        metrics["io"] = {k: end["io"][k] - start["io"][k] for k in end["io"]}
+    elif "blocks" in end:
+        metrics["io"] = {k: end["blocks"][k] - start["blocks"][k] for k in end["blocks"]}
+    return metrics
+
+
+class StepTimer:
+    """
+    Measures a step, via ``start()``/``stop()`` or as a context manager.
+
+    Call ``stop()`` just before ``Manifest.add_step`` so recording the
+    step isn't counted in it; later calls return the same metrics.
+    """
+
+    def __init__(self):
+        self._start: Optional[Dict[str, Any]] = None
+        self.metrics: Dict[str, Any] = {}
+
+    def start(self) -> "StepTimer":
+        self._start = snapshot()
+        self.metrics = {}
+        return self
+
+    def __enter__(self) -> "StepTimer":
+        return self.start()
+
+    def stop(self) -> Dict[str, Any]:
+        if not self.metrics:
+            self.metrics = diff_snapshots(self._start, snapshot())
+        return self.metrics
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+
+def measure() -> StepTimer:
+    """A new StepTimer (``measure().start()`` / ``with measure() as perf``)."""
+    return StepTimer()
@@ -0,0 +1,323 @@
+"""
+Request Intake
+==============
+
+Turns requests/*.json into an ordered work queue in one pass, so every
+request pushed is processed - not just the first file in a diff.
+
+1. Parse every request file once (``_template.json`` and README skipped)
+2. Validate against ``_template.json``: required fields present, fields the
+   template defines have the template's type, reel_id well-formed and
+   matching the file name and subject. A numeric created_at (epoch
+   seconds or milliseconds) is converted to an ISO string first
+3. Deduplicate: two files with the same reel_id, or the same subject and
+   topic slug (bio-06-blood-types vs bio-07-blood-types). The oldest
+   request wins; a duplicate of a completed reel is dropped, a retry of a
+   failed one is not
+4. Queue every pending request (no status, or "pending") by priority,
+   then created_at, then reel_id
+
+Priority is an optional request field: "high", "normal" (default), "low",
+or an integer (lower runs first).
+
+Usage:
+    python -m jeetlo_factory.intake requests/           # queue + problems
+    python -m jeetlo_factory.intake requests/ --ids     # one reel_id per line
+    python -m jeetlo_factory.intake requests/ --json
+"""
+
+import argparse
+import json
+import re
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+TEMPLATE_FILENAME = "_template.json"
+REQUIRED_FIELDS = ("reel_id", "subject", "topic", "hook")
+SUBJECT_PREFIXES = {
+    "biology": ("bio",),
+    "chemistry": ("che", "chem"),
+    "physics": ("phy",),
+    "mathematics": ("mat", "math"),
+}
+PRIORITIES = {"high": 0, "normal": 1, "low": 2}
+PENDING_STATUSES = ("pending",)
+
+REEL_ID_PATTERN = re.compile(r"^([a-z]+)-(\d{2,})-([a-z0-9]+(?:-[a-z0-9]+)*)$")
+
+
+def topic_slug(reel_id: str) -> str:
+    """``bio-06-blood-types`` -> ``blood-types``."""
+    match = REEL_ID_PATTERN.match(reel_id)
+    return match.group(3) if match else reel_id
+
+
+def priority_rank(value: Any) -> int:
+    if isinstance(value, bool):
+        return PRIORITIES["normal"]
+    if isinstance(value, int):
+        return value
+    return PRIORITIES.get(str(value).lower(), PRIORITIES["normal"]) if value is not None else PRIORITIES["normal"]
+
+
+def normalize_created_at(request: Dict[str, Any]) -> List[str]:
+    """
+    Convert a numeric ``created_at`` (epoch seconds, or milliseconds from
+    JavaScript's Date.now()) to an ISO string in place, so requests sort
+    together. Returns a warning when a value was converted.
+    """
+    created = request.get("created_at")
+    if isinstance(created, bool) or not isinstance(created, (int, float)):
+        return []
+    seconds = created / 1000 if created > 1e11 else created
+    try:
+        iso = datetime.fromtimestamp(seconds, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    except (OverflowError, OSError, ValueError):
+        return []
+    request["created_at"] = iso
+    return [f"WARNING: Numeric created_at {created} read as {iso}"]
+
+
+def load_template(requests_dir: str) -> Dict[str, Any]:
+    path = Path(requests_dir) / TEMPLATE_FILENAME
+    if not path.exists():
+        return {}
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def validate_request(
+    request: Dict[str, Any],
+    template: Dict[str, Any],
+    filename: Optional[str] = None
+) -> Tuple[bool, List[str], List[str]]:
+    """
+    Check one request against the template schema.
+
+    Returns:
+        Tuple of (is_valid, errors, warnings)
+    """
+    errors, warnings = [], []
+
+    for field in REQUIRED_FIELDS:
+        value = request.get(field)
+        if not isinstance(value, str) or not value.strip():
+            errors.append(f"REQUEST ERROR: Missing required field '{field}'")
+
+    for field, example in template.items():
+        if field in request and not isinstance(request[field], type(example)):
+            errors.append(
+                f"REQUEST ERROR: '{field}' must be {type(example).__name__}, "
+                f"got {type(request[field]).__name__}"
+            )
+
+    reel_id = request.get("reel_id")
+    subject = request.get("subject")
+    if isinstance(reel_id, str) and reel_id:
+        match = REEL_ID_PATTERN.match(reel_id)
+        if not match:
+            errors.append(f"REQUEST ERROR: reel_id '{reel_id}' must look like bio-06-topic-name")
+        elif subject in SUBJECT_PREFIXES and match.group(1) not in SUBJECT_PREFIXES[subject]:
+            errors.append(f"REQUEST ERROR: reel_id '{reel_id}' does not match subject '{subject}'")
+        if template and reel_id == template.get("reel_id"):
+            errors.append("REQUEST ERROR: reel_id is still the template placeholder")
+        if filename and Path(filename).stem != reel_id:
+            warnings.append(f"WARNING: File {filename} holds reel_id '{reel_id}'")
+
+    if isinstance(subject, str) and subject and subject not in SUBJECT_PREFIXES:
+        errors.append(f"REQUEST ERROR: Unknown subject '{subject}'")
+
+    created_at = request.get("created_at")
+    if created_at is not None and not isinstance(created_at, str):
+        errors.append(
+            f"REQUEST ERROR: created_at must be an ISO timestamp string, got {type(created_at).__name__}"
+        )
+
+    priority = request.get("priority")
+    if priority is not None and not (
+        (isinstance(priority, int) and not isinstance(priority, bool)) or str(priority).lower() in PRIORITIES
+    ):
+        warnings.append(f"WARNING: Unknown priority '{priority}', using normal")
+
+    return len(errors) == 0, errors, warnings
+
+
+def parse_requests(requests_dir: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Read and validate every request file.
+
+    Returns:
+        Tuple of (entries, template). Each entry has file, request (None if
+        unparseable), valid, errors and warnings.
+    """
+    template = load_template(requests_dir)
+    entries = []
+    for path in sorted(Path(requests_dir).glob("*.json")):
+        if path.name == TEMPLATE_FILENAME:
+            continue
+        entry: Dict[str, Any] = {"file": path.name, "request": None, "errors": [], "warnings": []}
+        try:
+            with open(path, "r") as f:
+                request = json.load(f)
+            if not isinstance(request, dict):
+                raise ValueError("not a JSON object")
+        except (OSError, ValueError) as e:
+            entry["errors"].append(f"REQUEST ERROR: Cannot parse {path.name}: {e}")
+            entry["valid"] = False
+            entries.append(entry)
+            continue
+
+        converted = normalize_created_at(request)
+        valid, errors, warnings = validate_request(request, template, path.name)
+        entry.update({"request": request, "valid": valid, "errors": errors, "warnings": converted + warnings})
+        entries.append(entry)
+    return entries, template
+
+
+def _age_key(request: Dict[str, Any]) -> Tuple[str, str]:
+    # Missing created_at sorts last; reel_id (and its number) breaks ties
+    return (request.get("created_at") or "~", request["reel_id"])
+
+
+def deduplicate(entries: List[Dict[str, Any]]):
+    """Mark duplicates in place (``duplicate_of``), keeping the oldest request."""
+    by_id: Dict[str, List[Dict[str, Any]]] = {}
+    for entry in entries:
+        if entry["valid"]:
+            by_id.setdefault(entry["request"]["reel_id"], []).append(entry)
+
+    for group in by_id.values():
+        group.sort(key=lambda e: _age_key(e["request"]))
+        for entry in group[1:]:
+            entry["duplicate_of"] = group[0]["file"]
+            entry["warnings"].append(f"WARNING: Same reel_id as {group[0]['file']}")
+
+    by_topic: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+    for entry in entries:
+        if entry["valid"] and "duplicate_of" not in entry:
+            request = entry["request"]
+            by_topic.setdefault((request["subject"], topic_slug(request["reel_id"])), []).append(entry)
+
+    for group in by_topic.values():
+        group.sort(key=lambda e: _age_key(e["request"]))
+        # A retry of a failed request is not a duplicate; anything else
+        # in flight or done with the same topic is
+        kept = [e for e in group if e["request"].get("status") != "failed"]
+        for entry in kept[1:]:
+            original = kept[0]["request"]["reel_id"]
+            entry["duplicate_of"] = original
+            entry["warnings"].append(f"WARNING: Duplicate of {original} (same subject and topic)")
+
+
+def is_pending(request: Dict[str, Any]) -> bool:
+    return request.get("status", "pending") in PENDING_STATUSES
+
+
+def build_queue(requests_dir: str) -> Dict[str, Any]:
+    """
+    Parse, validate and deduplicate all requests.
+
+    Returns:
+        {"queue": [pending requests in run order], "invalid": [...],
+         "duplicates": [...], "total": n}
+    """
+    entries, _ = parse_requests(requests_dir)
+    deduplicate(entries)
+
+    queue = [
+        e for e in entries
+        if e["valid"] and "duplicate_of" not in e and is_pending(e["request"])
+    ]
+    queue.sort(key=lambda e: (priority_rank(e["request"].get("priority")),) + _age_key(e["request"]))
+
+    def summary(entry: Dict[str, Any]) -> Dict[str, Any]:
+        request = entry["request"] or {}
+        item = {
+            "reel_id": request.get("reel_id"),
+            "file": entry["file"],
+            "subject": request.get("subject"),
+            "topic": request.get("topic"),
+            "status": request.get("status", "pending"),
+            "priority": priority_rank(request.get("priority")),
+            "errors": entry["errors"],
+            "warnings": entry["warnings"]
+        }
+        if "duplicate_of" in entry:
+            item["duplicate_of"] = entry["duplicate_of"]
+        return item
+
+    return {
+        "total": len(entries),
+        "queue": [summary(e) for e in queue],
+        "invalid": [summary(e) for e in entries if not e["valid"]],
+        "duplicates": [summary(e) for e in entries if "duplicate_of" in e and is_pending(e["request"])]
+    }
+
+
+def print_queue(result: Dict[str, Any]):
+    print(f"Requests: {result['total']} file(s), {len(result['queue'])} queued")
+    for i, item in enumerate(result["queue"], 1):
+        print(f"  {i:>2}. {item['reel_id']:<36} {item['subject']:<12} priority {item['priority']}")
+        for w in item["warnings"]:
+            print(f"      ⚠ {w}")
+    for item in result["duplicates"]:
+        print(f"  ⚠ Skipped {item['file']}: duplicate of {item['duplicate_of']}")
+    for item in result["invalid"]:
+        print(f"  ✗ {item['file']}")
+        for e in item["errors"]:
+            print(f"      {e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Validate all reel requests and list the pending ones in run order"
+    )
+    parser.add_argument(
+        "requests_dir",
+        nargs="?",
+        default="requests",
+        help="Directory of request JSON files (default: requests)"
+    )
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument(
+        "--ids",
+        action="store_true",
+        help="Print only the queued reel_ids, one per line"
+    )
+    output.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the queue, duplicates and invalid requests as JSON"
+    )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Exit 1 if any request is invalid"
+    )
+
+    args = parser.parse_args()
+
+    if not Path(args.requests_dir).is_dir():
+        print(f"✗ Not a directory: {args.requests_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    result = build_queue(args.requests_dir)
+
+    if args.ids:
+        for item in result["queue"]:
+            print(item["reel_id"])
+        for item in result["invalid"]:
+            print(f"✗ {item['file']}: {'; '.join(item['errors'])}", file=sys.stderr)
+    elif args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+    else:
+        print_queue(result)
+
+    sys.exit(1 if args.strict and result["invalid"] else 0)
+
+
+if __name__ == "__main__":
+    main()
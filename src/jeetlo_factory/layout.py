@@ -0,0 +1,328 @@
+"""
+Layout Log - Overlap Checks from the Manim Scene Graph
+======================================================
+
+JeetLoReelMixin records the bounding box of every Text and top-level
+VMobject on screen at each play/wait boundary into a compact JSONL log
+(``.layout_log.jsonl`` next to the manifest). This module reads that log
+and finds:
+
+1. Overlapping text boxes (interval tree on x, then a y test)
+2. Content outside the frame
+
+No frames are rendered or decoded, so it works on preview-quality or
+dry-run (rendering disabled) output and runs in milliseconds.
+
+Log format (one JSON object per line):
+    {"version": 1, "scene": "PhysicsReel", "frame": [8, 14.22]}
+    {"t": 1.5, "k": "play", "n": 6, "b": [["T", "Gravity!", x0, y0, x1, y1], ...]}
+    {"t": 4.5, "k": "wait", "n": 6, "b": null}      # null = unchanged
+
+Box kinds: "T" text, "S" shape.
+
+Usage:
+    python -m jeetlo_factory.layout reels/phy-01-gravity/.layout_log.jsonl
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .brand import FRAME_WIDTH, FRAME_HEIGHT
+
+
+LAYOUT_LOG_VERSION = 1
+LAYOUT_LOG_FILENAME = ".layout_log.jsonl"
+LAYOUT_LOG_ENV = "JEETLO_LAYOUT_LOG"
+
+TEXT = "T"
+SHAPE = "S"
+
+Box = Tuple[str, str, float, float, float, float]
+
+
+class LayoutLogWriter:
+    """Streams layout snapshots to a JSONL file as the scene plays."""
+
+    def __init__(self, path: str, scene: str, frame_width: float, frame_height: float):
+        self.path = Path(path)
+        self._file = open(self.path, "w")
+        self._last_boxes: Optional[List[list]] = None
+        self._write({
+            "version": LAYOUT_LOG_VERSION,
+            "scene": scene,
+            "frame": [round(frame_width, 3), round(frame_height, 3)]
+        })
+
+    def _write(self, entry: Dict[str, Any]):
+        self._file.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+        self._file.flush()
+
+    def record(self, time: float, kind: str, mobject_count: int, boxes: Sequence[Box]):
+        """Record one play/wait boundary. Unchanged layouts are stored as null."""
+        rounded = [[k, label] + [round(v, 3) for v in coords] for k, label, *coords in boxes]
+        self._write({
+            "t": round(time, 3),
+            "k": kind,
+            "n": mobject_count,
+            "b": None if rounded == self._last_boxes else rounded
+        })
+        self._last_boxes = rounded
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+def read_layout_log(path: str) -> Tuple[Dict[str, Any], Iterator[Dict[str, Any]]]:
+    """
+    Read a layout log.
+
+    Returns:
+        Tuple of (header, snapshots). Snapshots stream lazily and have
+        unchanged layouts ("b": null) filled in from the previous one.
+    """
+    f = open(path, "r")
+    first = f.readline()
+    header = json.loads(first) if first.strip() else {}
+
+    def snapshots():
+        boxes: List[list] = []
+        with f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                entry["changed"] = entry.get("b") is not None
+                if entry["changed"]:
+                    boxes = entry["b"]
+                entry["b"] = boxes
+                yield entry
+
+    return header, snapshots()
+
+
+class IntervalTree:
+    """
+    Static centered interval tree.
+
+    Built once per snapshot from (start, end, index) intervals; ``query``
+    returns indices of all intervals overlapping [lo, hi] in
+    O(log n + k).
+    """
+
+    def __init__(self, intervals: Sequence[Tuple[float, float, int]]):
+        self.root = self._build(list(intervals))
+
+    def _build(self, intervals):
+        if not intervals:
+            return None
+
+        endpoints = sorted(p for s, e, _ in intervals for p in (s, e))
+        center = endpoints[len(endpoints) // 2]
+
+        left, right, here = [], [], []
+        for interval in intervals:
+            if interval[1] < center:
+                left.append(interval)
+            elif interval[0] > center:
+                right.append(interval)
+            else:
+                here.append(interval)
+
+        return {
+            "center": center,
+            "by_start": sorted(here, key=lambda i: i[0]),
+            "by_end": sorted(here, key=lambda i: -i[1]),
+            "left": self._build(left),
+            "right": self._build(right)
+        }
+
+    def query(self, lo: float, hi: float) -> List[int]:
+        found = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            center = node["center"]
+            if hi < center:
+                for s, _, idx in node["by_start"]:
+                    if s > hi:
+                        break
+                    found.append(idx)
+                stack.append(node["left"])
+            elif lo > center:
+                for _, e, idx in node["by_end"]:
+                    if e < lo:
+                        break
+                    found.append(idx)
+                stack.append(node["right"])
+            else:
+                found.extend(idx for _, _, idx in node["by_start"])
+                stack.append(node["left"])
+                stack.append(node["right"])
+        return found
+
+
+def find_overlaps(boxes: Sequence[Sequence], tolerance: float = 0.0) -> List[Tuple[int, int]]:
+    """
+    Index pairs (i < j) of boxes whose interiors overlap.
+
+    Boxes are (kind, label, x0, y0, x1, y1); each is shrunk by
+    ``tolerance`` first so touching neighbours don't count.
+    """
+    shrunk = [(b[2] + tolerance, b[3] + tolerance, b[4] - tolerance, b[5] - tolerance) for b in boxes]
+    tree = IntervalTree([(x0, x1, i) for i, (x0, y0, x1, y1) in enumerate(shrunk) if x0 < x1 and y0 < y1])
+
+    pairs = []
+    for i, (x0, y0, x1, y1) in enumerate(shrunk):
+        if x0 >= x1 or y0 >= y1:
+            continue
+        for j in tree.query(x0, x1):
+            if j <= i:
+                continue
+            ox0, oy0, ox1, oy1 = shrunk[j]
+            if x0 < ox1 and ox0 < x1 and y0 < oy1 and oy0 < y1:
+                pairs.append((i, j))
+    return pairs
+
+
+class LayoutChecker:
+    """Validates a layout log: text overlaps and out-of-frame content."""
+
+    def __init__(self, log_path: str, overlap_tolerance: float = 0.05, frame_margin: float = 0.0):
+        self.log_path = Path(log_path)
+        self.overlap_tolerance = overlap_tolerance
+        self.frame_margin = frame_margin
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+        self.overlaps: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.out_of_frame: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.stats: Dict[str, Any] = {
+            "snapshots": 0, "checked": 0, "plays": 0, "waits": 0,
+            "max_mobjects": 0, "final_mobjects": 0, "duration": 0.0
+        }
+
+    def validate(self) -> Tuple[bool, List[str], List[str]]:
+        """
+        Check every changed snapshot in the log.
+
+        Returns:
+            Tuple of (is_valid, errors, warnings)
+        """
+        if not self.log_path.exists():
+            self.errors.append(f"LAYOUT ERROR: No layout log found at {self.log_path}")
+            return False, self.errors, self.warnings
+
+        header, snapshots = read_layout_log(str(self.log_path))
+        frame_width, frame_height = header.get("frame", [FRAME_WIDTH, FRAME_HEIGHT])
+        half_w = frame_width / 2 + self.frame_margin
+        half_h = frame_height / 2 + self.frame_margin
+
+        for snap in snapshots:
+            self.stats["snapshots"] += 1
+            self.stats["waits" if snap.get("k") == "wait" else "plays"] += 1
+            self.stats["max_mobjects"] = max(self.stats["max_mobjects"], snap.get("n", 0))
+            self.stats["final_mobjects"] = snap.get("n", 0)
+            self.stats["duration"] = snap.get("t", 0.0)
+            if not snap["changed"]:
+                continue
+            self.stats["checked"] += 1
+
+            boxes = snap["b"]
+            texts = [b for b in boxes if b[0] == TEXT]
+            for i, j in find_overlaps(texts, self.overlap_tolerance):
+                key = tuple(sorted((texts[i][1], texts[j][1])))
+                self._note(self.overlaps, key, snap["t"])
+
+            for kind, label, x0, y0, x1, y1 in boxes:
+                sides = [side for side, out in (
+                    ("left", x0 < -half_w), ("right", x1 > half_w),
+                    ("bottom", y0 < -half_h), ("top", y1 > half_h)
+                ) if out]
+                if sides:
+                    self._note(self.out_of_frame, (kind + ":" + label, "/".join(sides)), snap["t"])
+
+        for (a, b), seen in self.overlaps.items():
+            self.errors.append(
+                f"LAYOUT ERROR: Text '{a}' overlaps '{b}' at {seen['first']:.1f}s "
+                f"({seen['count']} snapshot(s))"
+            )
+
+        for (label, sides), seen in self.out_of_frame.items():
+            kind, _, name = label.partition(":")
+            message = f"'{name}' extends outside the frame ({sides}) at {seen['first']:.1f}s"
+            if kind == TEXT:
+                self.errors.append(f"LAYOUT ERROR: Text {message}")
+            else:
+                self.warnings.append(f"WARNING: Shape {message}")
+
+        return len(self.errors) == 0, self.errors, self.warnings
+
+    @staticmethod
+    def _note(table: Dict, key: Tuple[str, str], time: float):
+        if key not in table:
+            table[key] = {"first": time, "count": 0}
+        table[key]["count"] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "log": str(self.log_path),
+            "passed": len(self.errors) == 0,
+            "stats": self.stats,
+            "errors": self.errors,
+            "warnings": self.warnings
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="JeetLo Factory layout checker (overlaps from the Manim scene graph)"
+    )
+    parser.add_argument(
+        "log",
+        help=f"Layout log written during render (usually {LAYOUT_LOG_FILENAME})"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.05,
+        help="Shrink text boxes by this many scene units before testing overlap"
+    )
+    parser.add_argument(
+        "--json",
+        dest="json_path",
+        help="Write the result to this JSON file"
+    )
+
+    args = parser.parse_args()
+
+    checker = LayoutChecker(args.log, overlap_tolerance=args.tolerance)
+    is_valid, errors, warnings = checker.validate()
+    stats = checker.stats
+
+    print(f"Layout snapshots: {stats['snapshots']} ({stats['checked']} changed), "
+          f"max {stats['max_mobjects']} mobjects, {stats['duration']:.1f}s")
+
+    for w in warnings:
+        print(f"  ⚠ {w}")
+    for e in errors:
+        print(f"  ✗ {e}")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(checker.to_dict(), f, indent=2)
+
+    if not is_valid:
+        print(f"✗ Layout check FAILED: {len(errors)} error(s)")
+        sys.exit(1)
+
+    print("✓ Layout check PASSED")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,43 +14,152 @@ The chain is cryptographic:
 - External IDs can be verified against third-party logs
 
 CI validates this entire chain. If any link is broken, CI fails.
+
+The shell pipeline (jeetlo.sh) writes the same kind of chain in its own
+format, ``.proof_chain.json`` (``step`` names, a genesis_hash and
+"genesis" as the first input). ``read_chain`` reads either into one
+shape, so CI validates both.
 """
 
 import hashlib
 import json
+import mmap
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, List, Optional
 
 from .exceptions import ManifestError, ChainBrokenError
+from .merkle import record_chain
 
 
 MANIFEST_VERSION = "1.0.0"
 MANIFEST_FILENAME = ".jeetlo_manifest.json"
+PROOF_CHAIN_FILENAME = ".proof_chain.json"
+
+HASH_CHUNK_SIZE = 1 << 20      # 1 MiB reads
+MMAP_THRESHOLD = 64 << 20      # Files this large are hashed from a memory map
+HASH_WORKERS = min(8, os.cpu_count() or 1)
+
+FORMAT_MANIFEST = "manifest"
+FORMAT_PROOF_CHAIN = "proof_chain"
+# Newest schema this library reads, per format (proof chains without a
+# schema_version are version 1; manifests use the major of "version")
+CHAIN_SCHEMA_VERSIONS = {FORMAT_MANIFEST: 1, FORMAT_PROOF_CHAIN: 2}
+
+_FORMAT_RULES = {
+    # step name key, first step's input_hash, required top-level fields
+    FORMAT_MANIFEST: ("step_name", None, ("version", "reel_id", "subject", "steps")),
+    FORMAT_PROOF_CHAIN: ("step", "genesis", ("reel_id", "subject", "steps")),
+}
 
 
 def get_file_hash(filepath: str) -> str:
-    """Get SHA256 hash of a file."""
+    """
+    Get SHA256 hash of a file.
+
+    Large renders are hashed straight from a memory map (no copies into
+    Python); everything else is read into one reused 1 MiB buffer.
+    hashlib releases the GIL while hashing, so several files can be
+    hashed concurrently from threads.
+    """
     sha256 = hashlib.sha256()
     with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
+        if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    sha256.update(mapped)
+                return sha256.hexdigest()
+            except (OSError, ValueError):
+                # Not mappable (special file, some network filesystems)
+                f.seek(0)
+
+        buffer = bytearray(HASH_CHUNK_SIZE)
+        view = memoryview(buffer)
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            sha256.update(view[:n])
     return sha256.hexdigest()
 
 
-def get_directory_hash(dirpath: str, extensions: List[str] = None) -> str:
-    """Get combined hash of all files in a directory."""
+class HashingWriter:
+    """
+    Binary file writer that SHA256-hashes bytes as they are written, so an
+    output's hash is known without reading the file back.
+
+        with HashingWriter("final.mp4") as out:
+            out.write(data)
+        out.hexdigest()
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.size = 0
+        self._sha256 = hashlib.sha256()
+        self._file = open(self.path, "wb")
+
+    def write(self, data: bytes) -> int:
+        self._sha256.update(data)
+        self.size += len(data)
+        return self._file.write(data)
+
+    def hexdigest(self) -> str:
+        return self._sha256.hexdigest()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self) -> "HashingWriter":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def copy_and_hash(source: BinaryIO, path: str) -> str:
+    """
+    Stream ``source`` (e.g. a subprocess's stdout) into ``path`` and
+    return the SHA256 of what was written - the tee that lets a step
+    record its output hash without a second pass over the file.
+    """
+    buffer = bytearray(HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
+    with HashingWriter(path) as out:
+        while True:
+            n = source.readinto(buffer)
+            if not n:
+                break
+            out.write(view[:n])
+    return out.hexdigest()
+
+
+def get_directory_hash(dirpath: str, extensions: List[str] = None, workers: int = HASH_WORKERS) -> str:
+    """
+    Get combined hash of all files in a directory.
+
+    Files are hashed concurrently (``workers`` threads) and combined in
+    sorted path order, so the result doesn't depend on ``workers``.
+    """
     sha256 = hashlib.sha256()
     dirpath = Path(dirpath)
 
-    files = sorted(dirpath.rglob("*"))
-    for f in files:
-        if f.is_file():
-            if extensions is None or f.suffix in extensions:
-                sha256.update(f.name.encode())
-                sha256.update(get_file_hash(str(f)).encode())
+    files = [
+        f for f in sorted(dirpath.rglob("*"))
+        if f.is_file() and (extensions is None or f.suffix in extensions)
+    ]
+    if workers > 1 and len(files) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(files))) as pool:
+            digests = list(pool.map(lambda f: get_file_hash(str(f)), files))
+    else:
+        digests = [get_file_hash(str(f)) for f in files]
+
+    for f, digest in zip(files, digests):
+        sha256.update(f.name.encode())
+        sha256.update(digest.encode())
 
     return sha256.hexdigest()
 
@@ -90,6 +199,122 @@ def get_git_status() -> Dict[str, Any]:
         return {"commit": None, "has_uncommitted_changes": True}
 
 
+def detect_chain_format(data: Dict[str, Any], filename: Optional[str] = None) -> str:
+    """Which pipeline wrote a chain document."""
+    if filename == PROOF_CHAIN_FILENAME or "genesis_hash" in data or "schema_version" in data:
+        return FORMAT_PROOF_CHAIN
+    if filename == MANIFEST_FILENAME or "version" in data:
+        return FORMAT_MANIFEST
+    steps = data.get("steps") or [{}]
+    return FORMAT_PROOF_CHAIN if "step" in steps[0] else FORMAT_MANIFEST
+
+
+def chain_schema_version(data: Dict[str, Any], fmt: str) -> int:
+    if fmt == FORMAT_PROOF_CHAIN:
+        return int(data.get("schema_version", 1))
+    try:
+        return int(str(data.get("version", MANIFEST_VERSION)).split(".")[0])
+    except ValueError:
+        return 0
+
+
+def parse_chain(data: Dict[str, Any], filename: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Normalise a manifest or proof chain document, checking every link in
+    the same pass over the steps.
+
+    Returns:
+        {"format", "schema_version", "reel_id", "subject", "created_at",
+         "status", "steps": [{"name", "input_hash", "output_hash",
+         "timestamp"}], "errors": [...]}
+
+    Raises:
+        ManifestError: the document comes from a newer schema than this
+        library understands
+    """
+    fmt = detect_chain_format(data, filename)
+    version = chain_schema_version(data, fmt)
+    if version > CHAIN_SCHEMA_VERSIONS[fmt]:
+        raise ManifestError(
+            f"{fmt} schema version {version} is newer than supported "
+            f"({CHAIN_SCHEMA_VERSIONS[fmt]}); upgrade jeetlo-factory"
+        )
+
+    name_key, first_input, required = _FORMAT_RULES[fmt]
+    errors = [f"Missing field: {field}" for field in required if field not in data]
+
+    steps = []
+    prev_output = None
+    for i, raw in enumerate(data.get("steps") or []):
+        step = {
+            "name": raw.get(name_key),
+            "input_hash": raw.get("input_hash"),
+            "output_hash": raw.get("output_hash"),
+            "timestamp": raw.get("timestamp")
+        }
+        if i == 0:
+            if step["input_hash"] != first_input:
+                expected = "null" if first_input is None else f"'{first_input}'"
+                errors.append(f"First step must have {expected} input_hash")
+        elif step["input_hash"] != prev_output:
+            errors.append(
+                f"Chain broken at step '{step['name']}': "
+                f"input_hash doesn't match previous output_hash"
+            )
+        prev_output = step["output_hash"]
+        steps.append(step)
+
+    return {
+        "format": fmt,
+        "schema_version": version,
+        "reel_id": data.get("reel_id"),
+        "subject": data.get("subject"),
+        "created_at": data.get("created_at"),
+        "status": data.get("status", "in_progress"),
+        "steps": steps,
+        "errors": errors
+    }
+
+
+def default_signer():
+    """The step signer configured by JEETLO_SIGNING_KEY, or None."""
+    # Imported lazily: signing needs the optional cryptography package
+    from .signing import load_signer
+    return load_signer()
+
+
+def find_chain_file(reel_path: str) -> Optional[Path]:
+    """A reel's chain document: the library manifest, else the shell pipeline's proof chain."""
+    for name in (MANIFEST_FILENAME, PROOF_CHAIN_FILENAME):
+        path = Path(reel_path) / name
+        if path.exists():
+            return path
+    return None
+
+
+def read_chain(path: str) -> Dict[str, Any]:
+    """
+    Read a chain file (either format) with ``parse_chain``. The raw
+    document is kept under ``document`` for signature checks.
+
+    Raises:
+        ManifestError: missing file, invalid JSON or unsupported schema
+    """
+    path = Path(path)
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        raise ManifestError(f"No chain found at {path}")
+    except json.JSONDecodeError as e:
+        raise ManifestError(f"Invalid JSON: {e}")
+    if not isinstance(data, dict):
+        raise ManifestError(f"Invalid chain document: {path}")
+    chain = parse_chain(data, path.name)
+    chain["document"] = data
+    return chain
+
+
 class Manifest:
     """
     Cryptographic manifest for tracking reel creation steps.
@@ -101,17 +326,22 @@ class Manifest:
     - output_hash: Hash of outputs (becomes next step's input_hash)
     - git_commit: Current git commit SHA
     - metadata: Step-specific data (TTS request IDs, etc.)
+    - signature: Ed25519 signature of the step, when a signing key is set
+
+    ``signer`` defaults to the key named by JEETLO_SIGNING_KEY; pass
+    ``signer=False`` to never sign.
     """
 
-    def __init__(self, reel_path: str):
+    def __init__(self, reel_path: str, signer=None):
         self.reel_path = Path(reel_path)
         self.manifest_path = self.reel_path / MANIFEST_FILENAME
         self.data: Dict[str, Any] = {}
+        self.signer = signer
 
     @classmethod
-    def create(cls, reel_path: str, reel_id: str, subject: str) -> "Manifest":
+    def create(cls, reel_path: str, reel_id: str, subject: str, signer=None) -> "Manifest":
         """Create a new manifest for a reel."""
-        manifest = cls(reel_path)
+        manifest = cls(reel_path, signer)
         manifest.data = {
             "version": MANIFEST_VERSION,
             "reel_id": reel_id,
@@ -124,9 +354,9 @@ class Manifest:
         return manifest
 
     @classmethod
-    def load(cls, reel_path: str) -> "Manifest":
+    def load(cls, reel_path: str, signer=None) -> "Manifest":
         """Load existing manifest from a reel directory."""
-        manifest = cls(reel_path)
+        manifest = cls(reel_path, signer)
         if not manifest.manifest_path.exists():
             raise ManifestError(f"No manifest found at {manifest.manifest_path}")
 
@@ -139,9 +369,11 @@ class Manifest:
         return manifest
 
     def save(self):
-        """Save manifest to disk."""
-        with open(self.manifest_path, "w") as f:
-            json.dump(self.data, f, indent=2)
+        """Save manifest to disk and update the catalogue Merkle tree, if any."""
+        content = json.dumps(self.data, indent=2).encode()
+        with open(self.manifest_path, "wb") as f:
+            f.write(content)
+        record_chain(self.manifest_path, content)
 
     def get_last_output_hash(self) -> Optional[str]:
         """Get the output hash of the last completed step."""
@@ -183,6 +415,11 @@ class Manifest:
             "metadata": metadata or {}
         }
 
+        if self.signer is None:
+            self.signer = default_signer() or False
+        if self.signer:
+            step["signature"] = self.signer.sign(self.data["reel_id"], step)
+
         self.data["steps"].append(step)
         self.save()
 
@@ -224,10 +461,12 @@ class Manifest:
 
         return True
 
-    def mark_validated(self):
-        """Mark the manifest as validated."""
+    def mark_validated(self, perf: Optional[Dict[str, Any]] = None):
+        """Mark the manifest as validated (optionally recording what validation cost)."""
         self.data["status"] = "validated"
         self.data["validated_at"] = datetime.now(timezone.utc).isoformat()
+        if perf is not None:
+            self.data["validation_perf"] = perf
         self.save()
 
     def mark_posted(self, platform: str, post_id: str):
@@ -0,0 +1,157 @@
+"""
+Catalogue Merkle Tree
+=====================
+
+One hash over every reel's chain file, so CI can tell "nothing changed"
+by comparing two roots, and find what did change by descending only into
+the subtrees whose hashes differ.
+
+- Leaves map reel id -> git blob id of the reel's chain file
+  (``.jeetlo_manifest.json``, else ``.proof_chain.json``). That is the id
+  ``git ls-files -s`` reports, so CI checks the stored tree against the
+  checkout with one git call instead of reading every file.
+- Reels sit in a 16-way trie on the hex digits of sha256(reel id); adding
+  or changing a reel only changes the nodes on its own path, so a diff
+  costs O(changed reels x log N).
+
+The tree is stored in ``.jeetlo_merkle.json`` in the catalogue directory
+(committed with the reels). Manifest.save and the proof chain update an
+existing file; chains copied in from elsewhere (jeetlo.sh writes under
+/tmp) are added with ``python -m jeetlo_factory.chain record``.
+``jeetlo-validate --merkle --update-merkle`` creates or repairs it.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+
+MERKLE_FILENAME = ".jeetlo_merkle.json"
+MERKLE_VERSION = 1
+# How far above a reel to look for the catalogue's tree (matches discovery depth)
+MAX_DEPTH = 4
+
+EMPTY_ROOT = hashlib.sha256(b"").hexdigest()
+
+
+def blob_id(content: bytes) -> str:
+    """Git's object id for a file with this content."""
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+
+def file_blob_id(path: str) -> str:
+    with open(path, "rb") as f:
+        return blob_id(f.read())
+
+
+def _trie_key(reel_id: str) -> str:
+    return hashlib.sha256(reel_id.encode()).hexdigest()
+
+
+class MerkleTree:
+    """
+    Merkle trie over reel id -> chain file id.
+
+    Node hashes are kept per trie prefix, so two trees are compared top
+    down and only differing prefixes are visited.
+    """
+
+    def __init__(self, leaves: Dict[str, str]):
+        self.leaves = dict(leaves)
+        self._keys = {reel_id: _trie_key(reel_id) for reel_id in self.leaves}
+        self._nodes: Dict[str, str] = {}
+        self._children: Dict[str, List[str]] = {}
+        self._leaf_at: Dict[str, str] = {}
+        self.root = self._build("", sorted(self.leaves)) if self.leaves else EMPTY_ROOT
+
+    def _build(self, prefix: str, reel_ids: List[str]) -> str:
+        if len(reel_ids) == 1:
+            reel_id = reel_ids[0]
+            self._leaf_at[prefix] = reel_id
+            digest = hashlib.sha256(f"leaf:{reel_id}:{self.leaves[reel_id]}".encode()).hexdigest()
+        else:
+            groups: Dict[str, List[str]] = {}
+            for reel_id in reel_ids:
+                groups.setdefault(self._keys[reel_id][len(prefix)], []).append(reel_id)
+            self._children[prefix] = sorted(groups)
+            body = "".join(digit + self._build(prefix + digit, groups[digit]) for digit in self._children[prefix])
+            digest = hashlib.sha256(f"node:{body}".encode()).hexdigest()
+        self._nodes[prefix] = digest
+        return digest
+
+    def _reels_under(self, prefix: str) -> List[str]:
+        if prefix in self._leaf_at:
+            return [self._leaf_at[prefix]]
+        reel_ids = []
+        for digit in self._children.get(prefix, []):
+            reel_ids.extend(self._reels_under(prefix + digit))
+        return reel_ids
+
+    def diff(self, other: "MerkleTree") -> List[str]:
+        """Reel ids added, removed or changed between this tree and ``other``."""
+        if self.root == other.root:
+            return []
+        candidates: Set[str] = set()
+        self._diff("", other, candidates)
+        return sorted(r for r in candidates if self.leaves.get(r) != other.leaves.get(r))
+
+    def _diff(self, prefix: str, other: "MerkleTree", candidates: Set[str]):
+        if self._nodes.get(prefix) == other._nodes.get(prefix):
+            return
+        if prefix in self._children and prefix in other._children:
+            for digit in set(self._children[prefix]) | set(other._children[prefix]):
+                self._diff(prefix + digit, other, candidates)
+            return
+        # A leaf, or a prefix only one tree has: everything below differs
+        candidates.update(self._reels_under(prefix))
+        candidates.update(other._reels_under(prefix))
+
+    def to_dict(self) -> Dict[str, object]:
+        return {"version": MERKLE_VERSION, "root": self.root, "leaves": self.leaves}
+
+
+def load_tree(base_path: str) -> Optional[MerkleTree]:
+    """The stored tree for a catalogue directory, or None if it has none."""
+    path = Path(base_path) / MERKLE_FILENAME
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != MERKLE_VERSION:
+        return None
+    return MerkleTree(data.get("leaves", {}))
+
+
+def save_tree(base_path: str, tree: MerkleTree):
+    path = Path(base_path) / MERKLE_FILENAME
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(tree.to_dict(), f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+def record_chain(chain_path: Path, content: Optional[bytes] = None) -> bool:
+    """
+    Update the catalogue tree (if one exists above the reel) with a chain
+    file just written. Returns True if a tree was updated.
+    """
+    chain_path = Path(chain_path)
+    reel_path = chain_path.parent
+    for base in list(reel_path.parents)[:MAX_DEPTH]:
+        if (base / MERKLE_FILENAME).exists():
+            break
+    else:
+        return False
+
+    tree = load_tree(str(base))
+    if tree is None:
+        return False
+    leaf = blob_id(content) if content is not None else file_blob_id(str(chain_path))
+    if tree.leaves.get(reel_path.name) == leaf:
+        return True
+    save_tree(str(base), MerkleTree({**tree.leaves, reel_path.name: leaf}))
+    return True
@@ -0,0 +1,309 @@
+"""
+Pipeline Performance CLI
+========================
+
+1. ``run`` - run a command under measure() (used by jeetlo.sh)
+2. ``report`` - aggregate step timings across the catalogue
+
+The report reads every manifest (``metadata.perf``) and every
+``.proof_chain.json`` (``perf`` when recorded, otherwise the gap between
+step timestamps), then computes percentiles per step and per
+step/subject. Steps are also normalised by the reel's media duration
+(render seconds per second of video) and audio steps by segment count
+(TTS seconds per segment). With ``--baseline`` it flags steps whose
+median got slower than a previously saved report.
+
+Usage:
+    jeetlo-perf run --json perf.json -- manim render ...
+    jeetlo-perf report reels/
+    jeetlo-perf report reels/ --save-baseline perf_baseline.json
+    jeetlo-perf report reels/ --baseline perf_baseline.json
+
+Exit codes:
+    run    - the wrapped command's exit code
+    report - 0, or 1 if regressions were found against the baseline
+"""
+
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .discovery import find_reels
+from .instrument import measure
+from .manifest import MANIFEST_FILENAME, find_chain_file
+
+
+PERCENTILES = (50, 90, 95)
+REGRESSION_THRESHOLD = 0.25   # median more than 25% slower than baseline
+MIN_SAMPLES = 3               # fewer samples than this are never flagged
+
+# Steps whose cost scales with media length / segment count
+PER_MEDIA_SECOND_STEPS = {"video", "render_video", "combine", "combine_av", "frame_qa", "validate_sync"}
+PER_SEGMENT_STEPS = {"audio", "generate_audio"}
+
+
+def run_command(args) -> int:
+    """Run a command under measure() and write its metrics."""
+    command = args.command[1:] if args.command[:1] == ["--"] else args.command
+    if not command:
+        print("ERROR: No command given", file=sys.stderr)
+        return 2
+
+    with measure() as perf:
+        try:
+            returncode = subprocess.call(command)
+        except OSError as e:
+            print(f"ERROR: Could not run {command[0]}: {e}", file=sys.stderr)
+            returncode = 127
+
+    metrics = {**perf.metrics, "command": os.path.basename(command[0]), "returncode": returncode}
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(metrics, f, indent=2)
+    return returncode
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _media_info(reel_path: Path) -> Dict[str, Optional[float]]:
+    """Media duration and segment count from the reel's timings.json."""
+    for timings_path in (reel_path / "audio" / "timings.json", reel_path / "timings.json"):
+        if timings_path.exists():
+            try:
+                with open(timings_path, "r") as f:
+                    timings = json.load(f)
+                return {
+                    "duration": sum(float(t.get("duration", 0)) for t in timings),
+                    "segments": len(timings)
+                }
+            except (json.JSONDecodeError, OSError, TypeError, ValueError):
+                break
+    return {"duration": None, "segments": None}
+
+
+def _samples(steps: List[Dict[str, Any]], created_at: Optional[str], name_key: str) -> Iterator[Dict[str, Any]]:
+    """Per-step wall seconds: recorded perf if present, else timestamp gaps."""
+    previous = _parse_time(created_at)
+    for step in steps:
+        current = _parse_time(step.get("timestamp"))
+        perf = step.get("perf") or step.get("metadata", {}).get("perf") or {}
+        wall = perf.get("wall_seconds", perf.get("step_wall_seconds"))
+        source = "perf"
+        if perf.get("step_wall_seconds") is not None:
+            # jeetlo.sh: whole step; wall_seconds is just the wrapped command
+            wall = perf["step_wall_seconds"]
+        if wall is None and previous is not None and current is not None:
+            wall = (current - previous).total_seconds()
+            source = "timestamps"
+        if wall is not None:
+            yield {
+                "step": step.get(name_key, "?"),
+                "seconds": float(wall),
+                "source": source,
+                "perf": perf,
+                "metadata": step.get("metadata", {})
+            }
+        previous = current or previous
+
+
+def collect_samples(base_path: str) -> List[Dict[str, Any]]:
+    """Step timing samples from all manifests and proof chains under base_path."""
+    samples = []
+    for reel in find_reels(base_path, include_proof_chains=True):
+        path = find_chain_file(str(reel))
+        if path is None:
+            continue
+        name_key = "step_name" if path.name == MANIFEST_FILENAME else "step"
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            continue
+
+        reel_path = path.parent
+        media = _media_info(reel_path)
+        reel_id = data.get("reel_id", reel_path.name)
+        subject = data.get("subject", "unknown")
+
+        for sample in _samples(data.get("steps", []), data.get("created_at"), name_key):
+            duration = sample["metadata"].get("total_duration") or media["duration"]
+            segments = sample["metadata"].get("segment_count") or media["segments"]
+            sample.update({"reel_id": reel_id, "subject": subject})
+            if sample["step"] in PER_MEDIA_SECOND_STEPS and duration:
+                sample["per_media_second"] = sample["seconds"] / float(duration)
+            if sample["step"] in PER_SEGMENT_STEPS and segments:
+                sample["per_segment"] = sample["seconds"] / int(segments)
+            samples.append(sample)
+    return samples
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Linear-interpolated percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    stats = {"n": len(values), "mean": round(sum(values) / len(values), 3), "max": round(max(values), 3)}
+    for pct in PERCENTILES:
+        stats[f"p{pct}"] = round(percentile(values, pct), 3)
+    return stats
+
+
+def build_report(samples: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Percentiles per step and per step/subject, for seconds and normalised metrics."""
+    groups: Dict[str, Dict[str, List[float]]] = defaultdict(lambda: defaultdict(list))
+    for sample in samples:
+        for key in (sample["step"], f"{sample['step']}/{sample['subject']}"):
+            for metric in ("seconds", "per_media_second", "per_segment"):
+                if metric in sample:
+                    groups[key][metric].append(sample[metric])
+
+    return {
+        "reels": len({s["reel_id"] for s in samples}),
+        "samples": len(samples),
+        "steps": {
+            key: {metric: summarize(values) for metric, values in metrics.items()}
+            for key, metrics in sorted(groups.items())
+        }
+    }
+
+
+def find_regressions(report: Dict[str, Any], baseline: Dict[str, Any], threshold: float = REGRESSION_THRESHOLD) -> List[str]:
+    """Steps whose median is more than ``threshold`` slower than in the baseline."""
+    regressions = []
+    for key, metrics in report["steps"].items():
+        for metric, stats in metrics.items():
+            base = baseline.get("steps", {}).get(key, {}).get(metric)
+            if not base or stats["n"] < MIN_SAMPLES or not base.get("p50"):
+                continue
+            change = stats["p50"] / base["p50"] - 1.0
+            if change > threshold:
+                regressions.append(
+                    f"REGRESSION: {key} {metric} median {stats['p50']:.2f} vs baseline "
+                    f"{base['p50']:.2f} (+{change:.0%}, n={stats['n']})"
+                )
+    return regressions
+
+
+def print_report(report: Dict[str, Any]):
+    print(f"Reels: {report['reels']}  Step samples: {report['samples']}\n")
+    print(f"{'step':<36} {'n':>4} {'p50':>9} {'p90':>9} {'p95':>9} {'max':>9}  per media s / per segment")
+    print("-" * 100)
+    for key, metrics in report["steps"].items():
+        seconds = metrics.get("seconds")
+        if not seconds:
+            continue
+        normalised = ""
+        if "per_media_second" in metrics:
+            normalised = f"{metrics['per_media_second']['p50']:.2f} s/s"
+        elif "per_segment" in metrics:
+            normalised = f"{metrics['per_segment']['p50']:.2f} s/seg"
+        indent = "  " if "/" in key else ""
+        print(f"{indent + key:<36} {seconds['n']:>4} {seconds['p50']:>8.1f}s {seconds['p90']:>8.1f}s "
+              f"{seconds['p95']:>8.1f}s {seconds['max']:>8.1f}s  {normalised}")
+
+
+def report_command(args) -> int:
+    report = build_report(collect_samples(args.path))
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print_report(report)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n✓ Baseline saved: {args.save_baseline}", file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+        regressions = find_regressions(report, baseline, args.threshold)
+        for r in regressions:
+            print(f"  ✗ {r}", file=sys.stderr)
+        if regressions:
+            print(f"✗ {len(regressions)} regression(s) against {args.baseline}", file=sys.stderr)
+            return 1
+        print(f"✓ No regressions against {args.baseline}", file=sys.stderr)
+
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="JeetLo Factory pipeline performance tools"
+    )
+    subparsers = parser.add_subparsers(dest="action", required=True)
+
+    run_parser = subparsers.add_parser(
+        "run",
+        help="Run a command and record its wall/CPU time, child RSS and IO"
+    )
+    run_parser.add_argument(
+        "--json",
+        dest="json_path",
+        help="Write the metrics to this JSON file"
+    )
+    run_parser.add_argument(
+        "command",
+        nargs=argparse.REMAINDER,
+        help="Command to run (after --)"
+    )
+
+    report_parser = subparsers.add_parser(
+        "report",
+        help="Percentiles of step timings across all manifests and proof chains"
+    )
+    report_parser.add_argument(
+        "path",
+        help="Directory containing reels"
+    )
+    report_parser.add_argument(
+        "--json",
+        dest="json_path",
+        help="Write the report to this JSON file instead of printing a table"
+    )
+    report_parser.add_argument(
+        "--baseline",
+        help="Previously saved report to check for regressions against"
+    )
+    report_parser.add_argument(
+        "--save-baseline",
+        metavar="PATH",
+        help="Save this report as a baseline"
+    )
+    report_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=REGRESSION_THRESHOLD,
+        help=f"Median slowdown that counts as a regression (default: {REGRESSION_THRESHOLD})"
+    )
+
+    args = parser.parse_args()
+
+    if args.action == "run":
+        sys.exit(run_command(args))
+    sys.exit(report_command(args))
+
+
+if __name__ == "__main__":
+    main()
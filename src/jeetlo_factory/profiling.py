@@ -0,0 +1,269 @@
+"""
+Render Profiling
+================
+
+Runs a Manim render in-process under a sampling profiler to show where a
+slow render's time goes - Pango text, LaTeX, Cairo rasterization, the
+ffmpeg pipe, or the reel's own code - and which animations cost most.
+
+1. A SIGPROF timer samples the Python stack every few milliseconds of
+   CPU time (no tracing overhead, no extra dependencies). Time spent in
+   child processes (latex, ffmpeg) shows up in the play timings below,
+   not in the samples.
+2. ``Scene.play``/``Scene.wait`` are wrapped to time every call (wall
+   clock) and attribute it to the ``segment_*`` method and reel.py line
+   it came from
+
+Outputs, next to the manifest:
+    .render_profile.folded  collapsed stacks ("a;b;c count") for
+                            flamegraph.pl, speedscope or inferno
+    .render_profile.json    time by category, by segment and per play call
+
+Usage:
+    python -m jeetlo_factory.profiling --output reels/bio-05 -- render -qh reel.py BiologyReel
+
+Unix only (SIGPROF); elsewhere only the play/wait timings are recorded.
+"""
+
+import argparse
+import functools
+import json
+import signal
+import sys
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+PROFILE_FOLDED_FILENAME = ".render_profile.folded"
+PROFILE_JSON_FILENAME = ".render_profile.json"
+DEFAULT_INTERVAL = 0.005
+TOP_PLAYS = 25
+
+# First match walking from the leaf frame up decides a sample's category
+CATEGORIES = [
+    ("ffmpeg", ("scene_file_writer",)),
+    ("latex", ("tex_file_writing", "tex_mobject", "tex_templates")),
+    ("text", ("manimpango", "text_mobject")),
+    ("rasterize", ("cairo", "camera")),
+]
+
+
+def _frame_label(code) -> str:
+    return f"{Path(code.co_filename).stem}:{code.co_name}"
+
+
+class StackSampler:
+    """Collects collapsed Python stacks of the main thread on a SIGPROF timer."""
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.available = hasattr(signal, "setitimer") and hasattr(signal, "SIGPROF")
+
+    def _handler(self, signum, frame):
+        labels = []
+        while frame is not None:
+            labels.append(_frame_label(frame.f_code))
+            frame = frame.f_back
+        self.stacks[";".join(reversed(labels))] += 1
+        self.samples += 1
+
+    def start(self):
+        if not self.available:
+            return
+        signal.signal(signal.SIGPROF, self._handler)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self):
+        if not self.available:
+            return
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, signal.SIG_DFL)
+
+    def write_folded(self, path: str):
+        with open(path, "w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+    def categories(self) -> Dict[str, float]:
+        """Share of samples per category (leaf-most match wins)."""
+        totals: Counter = Counter()
+        for stack, count in self.stacks.items():
+            frames = stack.split(";")
+            category = "other"
+            for label in reversed(frames):
+                module = label.split(":", 1)[0]
+                match = next((name for name, keys in CATEGORIES if any(k in module for k in keys)), None)
+                if match:
+                    category = match
+                    break
+            totals[category] += count
+        total = sum(totals.values()) or 1
+        return {name: round(count / total, 4) for name, count in totals.most_common()}
+
+    def segments(self) -> Dict[str, float]:
+        """Sampled CPU seconds per segment_* method (innermost one on the stack)."""
+        totals: Dict[str, float] = defaultdict(float)
+        for stack, count in self.stacks.items():
+            segment = next(
+                (label.split(":", 1)[1] for label in reversed(stack.split(";"))
+                 if label.split(":", 1)[-1].startswith("segment_")),
+                None
+            )
+            if segment:
+                totals[segment] += count * self.interval
+        return {name: round(seconds, 3) for name, seconds in sorted(totals.items(), key=lambda kv: -kv[1])}
+
+
+class PlayTimer:
+    """Times every outermost Scene.play/Scene.wait and finds its call site in the reel."""
+
+    def __init__(self, reel_file: Optional[str] = None):
+        self.reel_file = str(Path(reel_file).resolve()) if reel_file else None
+        self.calls: List[Dict[str, Any]] = []
+        self._depth = 0
+
+    def _call_site(self) -> Dict[str, Any]:
+        frame = sys._getframe(2)
+        site = {"segment": None, "line": None}
+        while frame is not None:
+            code = frame.f_code
+            in_reel = self.reel_file and str(Path(code.co_filename).resolve()) == self.reel_file
+            if site["line"] is None and in_reel:
+                site["line"] = frame.f_lineno
+            if code.co_name.startswith("segment_") or (in_reel and code.co_name == "construct"):
+                site["segment"] = code.co_name
+                break
+            frame = frame.f_back
+        return site
+
+    def wrap(self, method, kind: str):
+        timer = self
+
+        @functools.wraps(method)
+        def timed(scene, *args, **kwargs):
+            if timer._depth:
+                return method(scene, *args, **kwargs)
+            site = timer._call_site()
+            timer._depth += 1
+            start = time.perf_counter()
+            try:
+                return method(scene, *args, **kwargs)
+            finally:
+                timer._depth -= 1
+                timer.calls.append({
+                    "index": len(timer.calls),
+                    "kind": kind,
+                    "animations": [type(a).__name__ for a in args if not isinstance(a, (int, float))][:5],
+                    "run_time": kwargs.get("run_time", args[0] if kind == "wait" and args else None),
+                    "seconds": round(time.perf_counter() - start, 4),
+                    **site
+                })
+        return timed
+
+    def by_segment(self) -> List[Dict[str, Any]]:
+        totals: Dict[str, Dict[str, Any]] = {}
+        for call in self.calls:
+            name = call["segment"] or "(unknown)"
+            entry = totals.setdefault(name, {"segment": name, "seconds": 0.0, "plays": 0, "waits": 0})
+            entry["seconds"] += call["seconds"]
+            entry["plays" if call["kind"] == "play" else "waits"] += 1
+        for entry in totals.values():
+            entry["seconds"] = round(entry["seconds"], 3)
+        return sorted(totals.values(), key=lambda e: -e["seconds"])
+
+
+def find_reel_file(manim_args: List[str]) -> Optional[str]:
+    return next((a for a in manim_args if a.endswith(".py")), None)
+
+
+def profile_render(manim_args: List[str], output_dir: str, interval: float = DEFAULT_INTERVAL) -> Dict[str, Any]:
+    """Run ``manim <manim_args>`` in this process under the profiler and write the outputs."""
+    from manim import Scene
+    from manim.__main__ import main as manim_main
+
+    timer = PlayTimer(find_reel_file(manim_args))
+    Scene.play = timer.wrap(Scene.play, "play")
+    Scene.wait = timer.wrap(Scene.wait, "wait")
+
+    sampler = StackSampler(interval)
+    start = time.perf_counter()
+    sampler.start()
+    try:
+        manim_main(args=manim_args, standalone_mode=False)
+    finally:
+        sampler.stop()
+    total = time.perf_counter() - start
+
+    output = Path(output_dir)
+    if sampler.available:
+        sampler.write_folded(str(output / PROFILE_FOLDED_FILENAME))
+
+    slowest = sorted(timer.calls, key=lambda c: -c["seconds"])[:TOP_PLAYS]
+    report = {
+        "command": ["manim"] + manim_args,
+        "total_seconds": round(total, 3),
+        "interval": interval,
+        "samples": sampler.samples,
+        "categories": sampler.categories() if sampler.available else {},
+        "segments": timer.by_segment(),
+        "segment_cpu_seconds": sampler.segments() if sampler.available else {},
+        "play_count": len(timer.calls),
+        "slowest_plays": slowest,
+        "folded": PROFILE_FOLDED_FILENAME if sampler.available else None
+    }
+    with open(output / PROFILE_JSON_FILENAME, "w") as f:
+        json.dump(report, f, indent=2)
+    return report
+
+
+def print_summary(report: Dict[str, Any]):
+    print(f"\nRender profile: {report['total_seconds']:.1f}s, {report['play_count']} play/wait calls, "
+          f"{report['samples']} samples")
+    if report["categories"]:
+        print("  Time by category: " + ", ".join(
+            f"{name} {share:.0%}" for name, share in report["categories"].items()))
+    for entry in report["segments"][:10]:
+        print(f"  {entry['segment']:<32} {entry['seconds']:>8.2f}s  ({entry['plays']} plays, {entry['waits']} waits)")
+    for call in report["slowest_plays"][:5]:
+        where = f"line {call['line']}" if call["line"] else "?"
+        print(f"  slow {call['kind']} #{call['index']} in {call['segment'] or '?'} ({where}): "
+              f"{call['seconds']:.2f}s {', '.join(call['animations'])}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Profile a Manim render (sampling profiler + per-play timings)"
+    )
+    parser.add_argument(
+        "--output",
+        default=".",
+        help="Directory for the profile files (default: current directory)"
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=DEFAULT_INTERVAL,
+        help=f"Sampling interval in seconds (default: {DEFAULT_INTERVAL})"
+    )
+    parser.add_argument(
+        "manim_args",
+        nargs=argparse.REMAINDER,
+        help="Arguments for manim, after -- (e.g. -- render -qh reel.py MyScene)"
+    )
+
+    args = parser.parse_args()
+    manim_args = args.manim_args[1:] if args.manim_args[:1] == ["--"] else args.manim_args
+    if not manim_args:
+        parser.error("no manim arguments given")
+
+    report = profile_render(manim_args, args.output, args.interval)
+    print_summary(report)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Frame QA for rendered reels.
+
+Decodes each video once into in-memory NumPy frames and runs every
+frame check from that single pass. The combined audio gets the same
+treatment: one PCM decode checks every segment boundary. Requires numpy
+(``pip install jeetlo-factory[qa]``) and ffmpeg on PATH.
+"""
+
+from .frames import FrameStream, probe_video
+from .checks import (
+    FrameCheck,
+    BackgroundModel,
+    BlankFrameCheck,
+    SafeZoneCheck,
+    EdgeCheck,
+    ContrastCheck,
+    WatermarkCheck,
+    default_checks
+)
+from .sampling import AdaptiveStream, adaptive_frame_numbers, plan_samples
+from .runner import FrameQA
+from .audio import SegmentTimingVerifier, decode_pcm, find_pauses
+
+__all__ = [
+    "FrameStream",
+    "FrameQA",
+    "FrameCheck",
+    "BackgroundModel",
+    "BlankFrameCheck",
+    "SafeZoneCheck",
+    "EdgeCheck",
+    "ContrastCheck",
+    "WatermarkCheck",
+    "default_checks",
+    "AdaptiveStream",
+    "adaptive_frame_numbers",
+    "plan_samples",
+    "probe_video",
+    "SegmentTimingVerifier",
+    "decode_pcm",
+    "find_pauses"
+]
@@ -0,0 +1,336 @@
+"""
+Segment Timing Verification
+===========================
+
+timings.json durations are probed per segment MP3, but the reel plays
+combined_audio.mp3 - a concat of those files, each with its own encoder
+padding. Comparing only the totals (within a second) hides per-segment
+drift, and animations cued on startTime slide out of sync.
+
+This decodes combined_audio.mp3 ONCE (ffmpeg -> 16 kHz mono PCM on a
+pipe -> NumPy), finds the pauses from per-frame energy, and checks that
+every segment boundary in timings.json lines up with a gap between segments:
+
+1. Frame RMS in dB over 20 ms analysis frames
+2. Silence = frames well below the reel's speaking level (or near
+   digital silence), at least two frames long
+3. The gap between two segment files (one's trailing silence plus the
+   next one's leading silence) is longer than a comma inside a segment,
+   so for N segments the N-1 widest pauses inside the audio are taken as
+   the gaps, and each boundary is anchored to the nearest of them within
+   ``SEARCH_WINDOW``
+4. Every segment file comes from the same TTS voice, so each one opens
+   with the same leading silence - measured from the first segment, the
+   pause at the very start of the audio. A segment therefore starts that
+   long before the speech that ends its gap, and drift is the distance
+   from the expected boundary to there. Because the position is measured
+   rather than fitted to the boundaries, a shift shared by every boundary
+   shows up as drift too
+
+Drift beyond one frame is a warning; beyond ``MAX_DRIFT`` it is an error,
+and so is a boundary with no gap within ``SEARCH_WINDOW`` (it is at least
+that far off). The total length
+(final endTime vs the decoded audio) is only ever a warning: AudioValidator
+already checks it against ``DURATION_TOLERANCE``, which allows for the
+encoder padding of every concatenated segment.
+
+Usage:
+    jeetlo-audio-sync reels/bio-05-topic/audio/combined_audio.mp3
+    jeetlo-audio-sync combined_audio.mp3 --timings timings.json --json audio_sync.json
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..exceptions import ExternalServiceError
+
+
+SAMPLE_RATE = 16000
+FRAME_SECONDS = 0.02
+SILENCE_BELOW_SPEECH_DB = 35.0   # quieter than the speaking level by this much
+SILENCE_FLOOR_DB = -55.0         # always silent below this (dBFS)
+MIN_SILENCE_FRAMES = 2
+MAX_DRIFT = 0.25                 # seconds; audibly out of sync with cues
+SEARCH_WINDOW = 0.75             # seconds either side of a boundary to look for its pause
+END_OF_AUDIO = "end of audio"
+
+
+def decode_pcm(audio_path: str, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """Decode an audio file to mono float32 samples in [-1, 1] with one ffmpeg call."""
+    try:
+        result = subprocess.run(
+            [
+                "ffmpeg", "-v", "error", "-i", str(audio_path),
+                "-ac", "1", "-ar", str(sample_rate),
+                "-f", "s16le", "pipe:1"
+            ],
+            capture_output=True
+        )
+    except FileNotFoundError:
+        raise ExternalServiceError("ffmpeg not found - install ffmpeg")
+    if result.returncode != 0:
+        raise ExternalServiceError(
+            f"ffmpeg could not decode {audio_path}: {result.stderr.decode(errors='replace').strip()}"
+        )
+    return np.frombuffer(result.stdout, dtype="<i2").astype(np.float32) / 32768.0
+
+
+def frame_levels(samples: np.ndarray, frame_length: int) -> np.ndarray:
+    """RMS level in dBFS of each complete analysis frame."""
+    count = len(samples) // frame_length
+    if count == 0:
+        return np.zeros(0, dtype=np.float64)
+    frames = samples[:count * frame_length].reshape(count, frame_length).astype(np.float64)
+    rms = np.sqrt(np.mean(frames * frames, axis=1))
+    return 20.0 * np.log10(np.maximum(rms, 1e-10))
+
+
+def find_pauses(
+    levels: np.ndarray,
+    frame_seconds: float = FRAME_SECONDS,
+    min_frames: int = MIN_SILENCE_FRAMES
+) -> List[Tuple[float, float]]:
+    """(start, end) seconds of each run of silent frames at least ``min_frames`` long."""
+    if len(levels) == 0:
+        return []
+    speech_level = float(np.percentile(levels, 95))
+    silent = (levels < speech_level - SILENCE_BELOW_SPEECH_DB) | (levels < SILENCE_FLOOR_DB)
+
+    edges = np.diff(np.concatenate(([0], silent.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return [
+        (start * frame_seconds, end * frame_seconds)
+        for start, end in zip(starts, ends)
+        if end - start >= min_frames
+    ]
+
+
+def expected_boundaries(timings: List[Dict[str, Any]]) -> List[Tuple[str, float]]:
+    """
+    (label, seconds) of every boundary to verify: the middle of the gap
+    between each segment and the previous one (previous endTime to this
+    startTime), then the end of the last segment. Uses startTime/endTime,
+    falling back to accumulated durations.
+    """
+    boundaries = []
+    current = 0.0
+    for i, segment in enumerate(timings):
+        start = float(segment.get("startTime", current))
+        end = float(segment.get("endTime", start + float(segment.get("duration", 0))))
+        if i > 0:
+            boundaries.append((f"start of segment '{segment.get('id', i)}'", (current + start) / 2))
+        current = end
+    if timings:
+        boundaries.append((END_OF_AUDIO, current))
+    return boundaries
+
+
+def segment_gaps(
+    pauses: List[Tuple[float, float]],
+    count: int,
+    duration: float
+) -> List[Tuple[float, float]]:
+    """
+    The ``count`` widest pauses strictly inside the audio (leading and
+    trailing silence can't separate two segments), in time order.
+    """
+    interior = [(start, end) for start, end in pauses if start > 0 and end < duration]
+    widest = sorted(interior, key=lambda p: p[1] - p[0], reverse=True)[:count]
+    return sorted(widest)
+
+
+def _distance(t: float, pause: Tuple[float, float]) -> float:
+    start, end = pause
+    return max(start - t, t - end, 0.0)
+
+
+def anchor_pause(
+    expected: float,
+    gaps: List[Tuple[float, float]],
+    window: float = SEARCH_WINDOW
+) -> Optional[Tuple[float, float]]:
+    """The gap nearest a boundary expected at ``expected``; None if none is within ``window``."""
+    nearest = min(gaps, key=lambda gap: _distance(expected, gap), default=None)
+    if nearest is None or _distance(expected, nearest) > window:
+        return None
+    return nearest
+
+
+def leading_silence(pauses: List[Tuple[float, float]]) -> float:
+    """
+    The voice's leading silence: the length of the pause the audio opens
+    with, i.e. the first segment's. 0 when the audio opens with speech
+    (or a pause shorter than MIN_SILENCE_FRAMES).
+    """
+    if pauses and pauses[0][0] == 0:
+        return pauses[0][1]
+    return 0.0
+
+
+def boundary_drift(expected: float, gap: Tuple[float, float], lead: float = 0.0) -> float:
+    """
+    Signed seconds from an expected boundary to where its segment starts
+    (positive if later): ``lead`` before the end of its gap, but never
+    before the gap itself.
+    """
+    start, end = gap
+    return max(start, end - lead) - expected
+
+
+class SegmentTimingVerifier:
+    """Checks timings.json boundaries against the pauses in one decode of the combined audio."""
+
+    def __init__(
+        self,
+        audio_path: str,
+        timings: List[Dict[str, Any]],
+        frame_seconds: float = FRAME_SECONDS,
+        max_drift: float = MAX_DRIFT
+    ):
+        self.audio_path = Path(audio_path)
+        if not self.audio_path.exists():
+            raise FileNotFoundError(f"No audio found at {self.audio_path}")
+        self.timings = timings
+        self.frame_seconds = frame_seconds
+        self.max_drift = max_drift
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+        self.duration = 0.0
+        self.pauses: List[Tuple[float, float]] = []
+        self.lead = 0.0
+        self.results: List[Dict[str, Any]] = []
+
+    def run(self, samples: Optional[np.ndarray] = None) -> Tuple[bool, List[str], List[str]]:
+        """
+        Decode (unless ``samples`` at SAMPLE_RATE are given) and verify every boundary.
+
+        Returns:
+            Tuple of (is_valid, errors, warnings)
+        """
+        if samples is None:
+            samples = decode_pcm(str(self.audio_path))
+        self.duration = len(samples) / SAMPLE_RATE
+        frame_length = max(1, int(round(self.frame_seconds * SAMPLE_RATE)))
+        self.pauses = find_pauses(frame_levels(samples, frame_length), frame_length / SAMPLE_RATE)
+
+        boundaries = expected_boundaries(self.timings)
+        gaps = segment_gaps(self.pauses, len(boundaries) - 1, self.duration)
+        self.lead = leading_silence(self.pauses)
+
+        for label, expected in boundaries:
+            gap = None if label == END_OF_AUDIO else anchor_pause(expected, gaps)
+            if label == END_OF_AUDIO:
+                self._report(label, expected, self.duration - expected)
+            elif gap is None:
+                # No gap between segments nearby: off by at least the window
+                self.results.append({"boundary": label, "expected": round(expected, 3), "drift": None})
+                self.errors.append(
+                    f"AUDIO ERROR: No gap between segments within {SEARCH_WINDOW}s of the {label} "
+                    f"({expected:.2f}s) in combined_audio.mp3"
+                )
+            else:
+                self._report(label, expected, boundary_drift(expected, gap, self.lead))
+
+        return len(self.errors) == 0, self.errors, self.warnings
+
+    def _report(self, label: str, expected: float, drift: float):
+        self.results.append({"boundary": label, "expected": round(expected, 3), "drift": round(float(drift), 3)})
+        if abs(drift) <= self.frame_seconds:
+            return
+        if label == END_OF_AUDIO:
+            # Total length is AudioValidator's DURATION_TOLERANCE check; here
+            # it is information only (concat padding adds up over segments)
+            if abs(drift) > self.max_drift:
+                self.warnings.append(
+                    f"WARNING: combined_audio.mp3 is {self.duration:.2f}s but timings.json ends at "
+                    f"{expected:.2f}s ({drift * 1000:+.0f} ms)"
+                )
+            return
+
+        message = (
+            f"The {label} is at {expected:.2f}s in timings.json but the segment starts "
+            f"{abs(drift) * 1000:.0f} ms {'later' if drift > 0 else 'earlier'} in combined_audio.mp3"
+        )
+        if abs(drift) > self.max_drift:
+            self.errors.append(f"AUDIO ERROR: {message}")
+        else:
+            self.warnings.append(f"WARNING: {message}")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "audio": str(self.audio_path),
+            "duration": round(self.duration, 3),
+            "frame_seconds": self.frame_seconds,
+            "pauses": len(self.pauses),
+            "leading_silence": round(self.lead, 3),
+            "passed": len(self.errors) == 0,
+            "boundaries": self.results
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Verify every timings.json segment boundary against the combined audio"
+    )
+    parser.add_argument(
+        "audio",
+        help="combined_audio.mp3"
+    )
+    parser.add_argument(
+        "--timings",
+        help="timings.json (default: next to the audio)"
+    )
+    parser.add_argument(
+        "--max-drift",
+        type=float,
+        default=MAX_DRIFT,
+        help=f"Drift in seconds that fails the check (default: {MAX_DRIFT})"
+    )
+    parser.add_argument(
+        "--json",
+        dest="json_path",
+        help="Write per-boundary results to this JSON file"
+    )
+
+    args = parser.parse_args()
+    timings_path = args.timings or str(Path(args.audio).parent / "timings.json")
+
+    try:
+        if not Path(args.audio).exists():
+            raise FileNotFoundError(f"No audio found at {args.audio}")
+        with open(timings_path, "r") as f:
+            timings = json.load(f)
+        verifier = SegmentTimingVerifier(args.audio, timings, max_drift=args.max_drift)
+        is_valid, errors, warnings = verifier.run()
+    except (OSError, ValueError, ExternalServiceError) as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+
+    for w in warnings:
+        print(f"  ⚠ {w}")
+    for e in errors:
+        print(f"  ✗ {e}")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(verifier.to_dict(), f, indent=2)
+
+    checked = sum(1 for r in verifier.results if r["drift"] is not None)
+    status = "✓" if is_valid else "✗"
+    print(
+        f"{status} Audio sync: {checked}/{len(verifier.results)} boundaries located, "
+        f"{len(errors)} error(s), {len(warnings)} warning(s) ({verifier.duration:.2f}s audio, "
+        f"{verifier.lead * 1000:.0f} ms leading silence)"
+    )
+    sys.exit(0 if is_valid else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,440 @@
+"""
+Frame Checks
+============
+
+Checks consume batches from a single FrameStream pass. Each check sees
+every batch as ``(timestamps, frames)`` arrays, accumulates what it needs,
+and reports at the end in the same (is_valid, errors, warnings) shape as
+the validators.
+
+Checks:
+1. BlankFrameCheck - hook/CTA frames must not be blank
+2. SafeZoneCheck - no content under platform UI margins
+3. EdgeCheck - no content touching the frame edges (text cut off)
+4. ContrastCheck - content readable against the subject background
+5. WatermarkCheck - brand watermark visible in the bottom-right
+
+Pixel checks work on whole batches at once: a foreground mask of shape
+(N, H, W) is computed once per batch by a shared BackgroundModel and
+every check slices it.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..brand import FRAME_WIDTH, FRAME_HEIGHT, SUBJECT_BACKGROUNDS
+
+
+# Platform UI overlays as fractions of the frame (top, bottom, left, right).
+# Reels/Shorts draw the header at the top, caption + buttons at the bottom
+# and the like/comment column on the right.
+SAFE_ZONE_MARGINS = (0.08, 0.15, 0.04, 0.10)
+
+# create_brand_watermark(): to_corner(DR, buff=0.3), ~1.4 x 0.4 units.
+# Box as fractions (x0, y0, x1, y1) with some slack for antialiasing.
+WATERMARK_BOX = (
+    1 - (0.3 + 1.6) / FRAME_WIDTH,
+    1 - (0.3 + 0.6) / FRAME_HEIGHT,
+    1.0,
+    1.0
+)
+
+# WCAG minimum contrast for large text
+MIN_CONTRAST_RATIO = 3.0
+
+
+def hex_to_rgb(color: str) -> np.ndarray:
+    """Convert '#RRGGBB' to a float32 RGB array."""
+    color = color.lstrip("#")
+    return np.array([int(color[i:i + 2], 16) for i in (0, 2, 4)], dtype=np.float32)
+
+
+def relative_luminance(rgb: np.ndarray) -> np.ndarray:
+    """WCAG relative luminance of 0-255 RGB values along the last axis."""
+    c = rgb.astype(np.float32) / 255.0
+    c = np.where(c <= 0.03928, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+    return c @ np.array([0.2126, 0.7152, 0.0722], dtype=np.float32)
+
+
+def box_slices(shape: Tuple[int, ...], box: Tuple[float, float, float, float]) -> Tuple[slice, slice]:
+    """Row/column slices for a fractional (x0, y0, x1, y1) box in an (..., H, W) array."""
+    height, width = shape[-2], shape[-1]
+    x0, y0, x1, y1 = box
+    return (
+        slice(int(y0 * height), int(round(y1 * height))),
+        slice(int(x0 * width), int(round(x1 * width)))
+    )
+
+
+class BackgroundModel:
+    """
+    Separates content from background for a batch of frames.
+
+    The background is estimated per frame from the median border pixel.
+    A known color - ``background``, else SUBJECT_BACKGROUNDS[subject] -
+    replaces the estimate only on frames whose border matches it, so a
+    reel rendered with another palette (jeetlo.sh's SUBJECT_CONFIG) isn't
+    masked as all foreground. The mask for the most recent batch is
+    memoised so all pixel checks share one computation.
+    """
+
+    def __init__(
+        self,
+        subject: Optional[str] = None,
+        tolerance: float = 28.0,
+        background: Optional[str] = None
+    ):
+        self.subject = subject
+        if background is None and subject in SUBJECT_BACKGROUNDS:
+            background = SUBJECT_BACKGROUNDS[subject]
+        self.fixed = hex_to_rgb(background) if background else None
+        self.tolerance = tolerance
+        self._frames = None
+        self._colors = None
+        self._mask = None
+
+    def colors(self, frames: np.ndarray) -> np.ndarray:
+        """Background color per frame, shape (N, 3)."""
+        self._update(frames)
+        return self._colors
+
+    def mask(self, frames: np.ndarray) -> np.ndarray:
+        """Boolean foreground mask, shape (N, H, W)."""
+        self._update(frames)
+        return self._mask
+
+    def _update(self, frames: np.ndarray):
+        if frames is self._frames:
+            return
+
+        border = np.concatenate(
+            [frames[:, :2].reshape(len(frames), -1, 3),
+             frames[:, -2:].reshape(len(frames), -1, 3)],
+            axis=1
+        )
+        colors = np.median(border, axis=1).astype(np.float32)
+        if self.fixed is not None:
+            fixed = np.asarray(self.fixed, dtype=np.float32)
+            matches = np.abs(colors - fixed).max(axis=1) <= self.tolerance
+            colors[matches] = fixed
+
+        diff = np.abs(frames.astype(np.int16) - colors[:, None, None, :].astype(np.int16))
+        self._frames = frames
+        self._colors = colors
+        self._mask = diff.max(axis=-1) > self.tolerance
+
+
+class FrameCheck:
+    """Base class for checks fed from one decode pass."""
+
+    name = "frame"
+
+    def __init__(self):
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+        self.frames_seen = 0
+
+    def process(self, timestamps: np.ndarray, frames: np.ndarray):
+        """Consume one batch of frames, shape (N, H, W, 3)."""
+        self.frames_seen += len(frames)
+        self._process(timestamps, frames)
+
+    def _process(self, timestamps: np.ndarray, frames: np.ndarray):
+        raise NotImplementedError
+
+    def finish(self) -> Tuple[bool, List[str], List[str]]:
+        """
+        Finalise after the last batch.
+
+        Returns:
+            Tuple of (is_valid, errors, warnings)
+        """
+        return len(self.errors) == 0, self.errors, self.warnings
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "passed": len(self.errors) == 0,
+            "frames_seen": self.frames_seen,
+            "errors": self.errors,
+            "warnings": self.warnings
+        }
+
+
+class BlankFrameCheck(FrameCheck):
+    """Flags blank (near-uniform) frames, which must never be the hook or the CTA."""
+
+    name = "blank_frames"
+
+    def __init__(self, min_std: float = 2.0):
+        super().__init__()
+        self.min_std = min_std
+        self.blank_times: List[float] = []
+        self.first_time = None
+        self.last_time = None
+        self.last_blank = False
+
+    def _process(self, timestamps: np.ndarray, frames: np.ndarray):
+        flat = frames.reshape(len(frames), -1).astype(np.float32)
+        blank = flat.std(axis=1) < self.min_std
+
+        if self.first_time is None:
+            self.first_time = float(timestamps[0])
+            if blank[0]:
+                self.errors.append(
+                    f"FRAME ERROR: Hook frame at {timestamps[0]:.1f}s is blank"
+                )
+
+        self.blank_times.extend(float(t) for t in timestamps[blank])
+        self.last_time = float(timestamps[-1])
+        self.last_blank = bool(blank[-1])
+
+    def finish(self) -> Tuple[bool, List[str], List[str]]:
+        if self.last_blank:
+            self.errors.append(
+                f"FRAME ERROR: Last frame at {self.last_time:.1f}s is blank (CTA should be visible)"
+            )
+
+        middle = [t for t in self.blank_times if t not in (self.first_time, self.last_time)]
+        if middle:
+            shown = ", ".join(f"{t:.1f}s" for t in middle[:5])
+            self.warnings.append(
+                f"WARNING: {len(middle)} blank frame(s) mid-reel at {shown}"
+            )
+
+        return super().finish()
+
+
+class PixelCheck(FrameCheck):
+    """Base for checks that look at the foreground mask."""
+
+    def __init__(self, background: Optional[BackgroundModel] = None):
+        super().__init__()
+        self.background = background or BackgroundModel()
+        self.flagged: List[float] = []
+
+    def _flag_summary(self) -> str:
+        shown = ", ".join(f"{t:.1f}s" for t in self.flagged[:5])
+        more = f" (+{len(self.flagged) - 5} more)" if len(self.flagged) > 5 else ""
+        return f"{shown}{more}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = super().to_dict()
+        result["flagged_times"] = [round(t, 2) for t in self.flagged]
+        return result
+
+
+class SafeZoneCheck(PixelCheck):
+    """Flags content inside the margins covered by Reels/Shorts UI."""
+
+    name = "safe_zone"
+
+    def __init__(
+        self,
+        background: Optional[BackgroundModel] = None,
+        margins: Tuple[float, float, float, float] = SAFE_ZONE_MARGINS,
+        min_fraction: float = 0.002
+    ):
+        super().__init__(background)
+        self.margins = margins
+        self.min_fraction = min_fraction
+
+    def _process(self, timestamps: np.ndarray, frames: np.ndarray):
+        mask = self.background.mask(frames)
+        n, height, width = mask.shape
+        top, bottom, left, right = self.margins
+
+        unsafe = np.ones((height, width), dtype=bool)
+        unsafe[int(top * height):height - int(bottom * height),
+               int(left * width):width - int(right * width)] = False
+        rows, cols = box_slices(mask.shape, WATERMARK_BOX)
+        unsafe[rows, cols] = False  # The watermark lives there on purpose
+
+        fraction = (mask & unsafe).sum(axis=(1, 2)) / unsafe.sum()
+        self.flagged.extend(float(t) for t in timestamps[fraction > self.min_fraction])
+
+    def finish(self) -> Tuple[bool, List[str], List[str]]:
+        if self.flagged:
+            self.warnings.append(
+                f"WARNING: Content inside platform UI margins in {len(self.flagged)} "
+                f"frame(s) at {self._flag_summary()} - may be hidden by Reels/Shorts overlays"
+            )
+        return super().finish()
+
+
+class EdgeCheck(PixelCheck):
+    """Flags content touching the frame edges, i.e. text or shapes cut off."""
+
+    name = "edges"
+
+    def __init__(
+        self,
+        background: Optional[BackgroundModel] = None,
+        edge_px: int = 2,
+        min_pixels: int = 6
+    ):
+        super().__init__(background)
+        self.edge_px = edge_px
+        self.min_pixels = min_pixels
+        self.sides: Dict[str, int] = {"top": 0, "bottom": 0, "left": 0, "right": 0}
+
+    def _process(self, timestamps: np.ndarray, frames: np.ndarray):
+        mask = self.background.mask(frames)
+        e = self.edge_px
+
+        per_side = {
+            "top": mask[:, :e, :].sum(axis=(1, 2)),
+            "bottom": mask[:, -e:, :].sum(axis=(1, 2)),
+            "left": mask[:, :, :e].sum(axis=(1, 2)),
+            "right": mask[:, :, -e:].sum(axis=(1, 2)),
+        }
+        touching = np.zeros(len(frames), dtype=bool)
+        for side, counts in per_side.items():
+            hit = counts >= self.min_pixels
+            self.sides[side] += int(hit.sum())
+            touching |= hit
+
+        self.flagged.extend(float(t) for t in timestamps[touching])
+
+    def finish(self) -> Tuple[bool, List[str], List[str]]:
+        if self.flagged:
+            sides = ", ".join(side for side, count in self.sides.items() if count)
+            self.errors.append(
+                f"FRAME ERROR: Content touches the frame edge ({sides}) in {len(self.flagged)} "
+                f"frame(s) at {self._flag_summary()} - text or shapes are cut off"
+            )
+        return super().finish()
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = super().to_dict()
+        result["sides"] = self.sides
+        return result
+
+
+class ContrastCheck(PixelCheck):
+    """
+    Flags frames whose content is too dim against the background.
+
+    Uses the 90th percentile WCAG contrast ratio of foreground pixels per
+    frame, so antialiased glyph edges and faint fills don't count, but a
+    frame whose brightest content is still low-contrast does.
+    """
+
+    name = "contrast"
+
+    def __init__(
+        self,
+        background: Optional[BackgroundModel] = None,
+        min_ratio: float = MIN_CONTRAST_RATIO,
+        min_pixels: int = 50
+    ):
+        super().__init__(background)
+        self.min_ratio = min_ratio
+        self.min_pixels = min_pixels
+        self.worst_ratio: Optional[float] = None
+
+    def _process(self, timestamps: np.ndarray, frames: np.ndarray):
+        mask = self.background.mask(frames)
+        bg_lum = relative_luminance(self.background.colors(frames))
+        lum = relative_luminance(frames)
+
+        hi = np.maximum(lum, bg_lum[:, None, None])
+        lo = np.minimum(lum, bg_lum[:, None, None])
+        ratio = np.where(mask, (hi + 0.05) / (lo + 0.05), np.nan)
+
+        counts = mask.sum(axis=(1, 2))
+        has_content = counts >= self.min_pixels
+        if not has_content.any():
+            return
+
+        p90 = np.nanpercentile(ratio[has_content].reshape(int(has_content.sum()), -1), 90, axis=1)
+        low = p90 < self.min_ratio
+        self.flagged.extend(float(t) for t in timestamps[has_content][low])
+
+        batch_worst = float(p90.min())
+        if self.worst_ratio is None or batch_worst < self.worst_ratio:
+            self.worst_ratio = batch_worst
+
+    def finish(self) -> Tuple[bool, List[str], List[str]]:
+        if self.flagged:
+            self.warnings.append(
+                f"WARNING: Low-contrast content (below {self.min_ratio:.1f}:1, worst "
+                f"{self.worst_ratio:.2f}:1) in {len(self.flagged)} frame(s) at {self._flag_summary()}"
+            )
+        return super().finish()
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = super().to_dict()
+        result["worst_ratio"] = round(self.worst_ratio, 2) if self.worst_ratio is not None else None
+        return result
+
+
+class WatermarkCheck(PixelCheck):
+    """
+    Checks the JeetLo watermark is visible in the bottom-right.
+
+    The flame (#FF6B35 / #FFD93D) stays warm even at 0.6 opacity over any
+    subject background, so we count warm pixels (R high, B low) in the box.
+    """
+
+    name = "watermark"
+
+    def __init__(
+        self,
+        background: Optional[BackgroundModel] = None,
+        min_coverage: float = 0.5,
+        min_warm_pixels: int = 8
+    ):
+        super().__init__(background)
+        self.min_coverage = min_coverage
+        self.min_warm_pixels = min_warm_pixels
+        self.present = 0
+
+    def _process(self, timestamps: np.ndarray, frames: np.ndarray):
+        rows, cols = box_slices(frames.shape[:3], WATERMARK_BOX)
+        box = frames[:, rows, cols].astype(np.int16)
+        r, g, b = box[..., 0], box[..., 1], box[..., 2]
+
+        warm = (r > 120) & (r - b > 60) & (r >= g)
+        # Scale the pixel threshold with the downscaled frame area
+        min_pixels = max(1, int(self.min_warm_pixels * (frames.shape[2] / 270) ** 2))
+        found = warm.sum(axis=(1, 2)) >= min_pixels
+
+        self.present += int(found.sum())
+        self.flagged.extend(float(t) for t in timestamps[~found])
+
+    def finish(self) -> Tuple[bool, List[str], List[str]]:
+        if self.frames_seen:
+            coverage = self.present / self.frames_seen
+            if coverage < self.min_coverage:
+                self.errors.append(
+                    f"FRAME ERROR: Watermark visible in only {coverage:.0%} of frames "
+                    f"(need {self.min_coverage:.0%}). Add create_brand_watermark() to each segment."
+                )
+            elif self.flagged:
+                self.warnings.append(
+                    f"WARNING: Watermark missing in {len(self.flagged)} frame(s) at {self._flag_summary()}"
+                )
+        return super().finish()
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = super().to_dict()
+        result["coverage"] = round(self.present / self.frames_seen, 3) if self.frames_seen else 0.0
+        return result
+
+
+def default_checks(subject: Optional[str] = None, background: Optional[str] = None) -> List[FrameCheck]:
+    """
+    The checks run by frame QA when none are given.
+
+    All pixel checks share one BackgroundModel, so the foreground mask is
+    computed once per batch.
+    """
+    background = BackgroundModel(subject, background=background)
+    return [
+        BlankFrameCheck(),
+        SafeZoneCheck(background),
+        EdgeCheck(background),
+        ContrastCheck(background),
+        WatermarkCheck(background),
+    ]
@@ -0,0 +1,153 @@
+"""
+Frame Stream
+============
+
+Decodes a rendered reel ONCE into an in-memory stream of downscaled
+raw frames. ffmpeg writes rgb24 rawvideo to a pipe and we wrap each
+batch as a NumPy array, so no PNGs ever touch the disk.
+
+Every frame check is fed from the same pass:
+
+    stream = FrameStream("final.mp4", fps=0.5)
+    for timestamps, frames in stream:
+        # frames: uint8 array of shape (N, height, width, 3)
+        ...
+"""
+
+import json
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..exceptions import ExternalServiceError
+
+
+DEFAULT_FPS = 0.5
+DEFAULT_WIDTH = 270   # 1080 / 4 - plenty for layout checks
+DEFAULT_BATCH_SIZE = 16
+
+
+def probe_video(filepath: str) -> Dict[str, Any]:
+    """Get width, height, fps and duration of a video using one ffprobe call."""
+    try:
+        result = subprocess.run(
+            [
+                "ffprobe", "-v", "error",
+                "-select_streams", "v:0",
+                "-show_entries", "stream=width,height,r_frame_rate:format=duration",
+                "-of", "json",
+                filepath
+            ],
+            capture_output=True,
+            text=True
+        )
+        info = json.loads(result.stdout)
+        stream = info["streams"][0]
+        num, _, den = stream.get("r_frame_rate", "30/1").partition("/")
+        fps = float(num) / float(den or 1)
+
+        return {
+            "width": int(stream["width"]),
+            "height": int(stream["height"]),
+            "fps": fps,
+            "duration": float(info.get("format", {}).get("duration", 0))
+        }
+    except (ValueError, KeyError, IndexError, ZeroDivisionError, subprocess.SubprocessError):
+        return {"width": 0, "height": 0, "fps": 0.0, "duration": 0.0}
+
+
+class FrameStream:
+    """
+    Single-pass decoder yielding batches of downscaled RGB frames.
+
+    Frames are selected either at a fixed rate (``fps``) or by exact
+    source frame numbers (``frame_numbers``), e.g. from adaptive sampling.
+    Iterating yields ``(timestamps, frames)`` where ``timestamps`` is a
+    float array of seconds and ``frames`` is ``(N, H, W, 3)`` uint8.
+    """
+
+    def __init__(
+        self,
+        video_path: str,
+        fps: float = DEFAULT_FPS,
+        width: int = DEFAULT_WIDTH,
+        frame_numbers: Optional[Sequence[int]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ):
+        self.video_path = Path(video_path)
+        if not self.video_path.exists():
+            raise FileNotFoundError(f"No video found at {self.video_path}")
+
+        self.info = probe_video(str(self.video_path))
+        if not self.info["width"] or not self.info["height"]:
+            raise ExternalServiceError(f"ffprobe could not read {self.video_path}")
+
+        self.fps = fps
+        self.frame_numbers = sorted(set(frame_numbers)) if frame_numbers is not None else None
+        self.batch_size = max(1, batch_size)
+
+        # Keep aspect ratio; rawvideo needs even dimensions for some scalers
+        self.width = min(width, self.info["width"]) // 2 * 2
+        self.height = round(self.width * self.info["height"] / self.info["width"] / 2) * 2
+        self.frame_bytes = self.width * self.height * 3
+        self.frames_decoded = 0
+
+    def _filter_graph(self) -> str:
+        """Build the ffmpeg -vf chain: frame selection then downscale."""
+        scale = f"scale={self.width}:{self.height}:flags=area"
+        if self.frame_numbers is None:
+            return f"fps={self.fps},{scale}"
+
+        terms = "+".join(f"eq(n\\,{n})" for n in self.frame_numbers) or "0"
+        return f"select='{terms}',{scale}"
+
+    def _command(self) -> List[str]:
+        cmd = ["ffmpeg", "-v", "error", "-i", str(self.video_path), "-vf", self._filter_graph()]
+        if self.frame_numbers is not None:
+            cmd += ["-vsync", "0"]
+        return cmd + ["-f", "rawvideo", "-pix_fmt", "rgb24", "pipe:1"]
+
+    def _timestamps(self, start: int, count: int) -> np.ndarray:
+        """Presentation times (seconds) of output frames start..start+count."""
+        if self.frame_numbers is None:
+            return np.arange(start, start + count, dtype=np.float64) / self.fps
+        source_fps = self.info["fps"] or 30.0
+        return np.asarray(self.frame_numbers[start:start + count], dtype=np.float64) / source_fps
+
+    def __iter__(self) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        if self.frame_numbers is not None and not self.frame_numbers:
+            return
+
+        proc = subprocess.Popen(
+            self._command(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        chunk = self.frame_bytes * self.batch_size
+
+        try:
+            while True:
+                data = proc.stdout.read(chunk)
+                count = len(data) // self.frame_bytes
+                if count == 0:
+                    break
+
+                frames = np.frombuffer(data[:count * self.frame_bytes], dtype=np.uint8)
+                frames = frames.reshape(count, self.height, self.width, 3)
+                timestamps = self._timestamps(self.frames_decoded, count)
+                self.frames_decoded += count
+
+                yield timestamps, frames
+
+                if count < self.batch_size:
+                    break
+        finally:
+            proc.stdout.close()
+            stderr = proc.stderr.read().decode(errors="replace")
+            proc.stderr.close()
+            returncode = proc.wait()
+
+        if returncode != 0:
+            raise ExternalServiceError(f"ffmpeg frame decode failed: {stderr.strip()}")
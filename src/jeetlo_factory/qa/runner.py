@@ -0,0 +1,210 @@
+"""
+Frame QA Runner
+===============
+
+Decodes a video once and feeds every frame check from that pass.
+Replaces the per-check PNG extraction in jeetlo.sh.
+
+Usage:
+    python -m jeetlo_factory.qa final.mp4
+    python -m jeetlo_factory.qa video.mp4 --subject physics --json frame_checks.json
+    python -m jeetlo_factory.qa video.mp4 --background "#0A1A3F"
+    python -m jeetlo_factory.qa video.mp4 --adaptive --budget 60
+
+Exit codes:
+    0 - All frame checks passed
+    1 - Frame check errors found
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..brand import SUBJECT_BACKGROUNDS
+from .checks import FrameCheck, default_checks
+from .frames import FrameStream, DEFAULT_FPS, DEFAULT_WIDTH
+from .sampling import (
+    DEFAULT_BUDGET, AdaptiveStream, adaptive_frame_numbers, describe_plan, find_timings,
+    load_segment_boundaries
+)
+
+
+class FrameQA:
+    """Runs a set of frame checks over one decode of a video."""
+
+    def __init__(
+        self,
+        video_path: str,
+        checks: Optional[List[FrameCheck]] = None,
+        subject: Optional[str] = None,
+        fps: float = DEFAULT_FPS,
+        width: int = DEFAULT_WIDTH,
+        frame_numbers: Optional[Sequence[int]] = None,
+        background: Optional[str] = None,
+        stream: Optional[AdaptiveStream] = None
+    ):
+        self.video_path = video_path
+        self.checks = checks if checks is not None else default_checks(subject, background)
+        self.stream = stream or FrameStream(video_path, fps=fps, width=width, frame_numbers=frame_numbers)
+        self.fps = fps
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+        self.decode_seconds = 0.0
+        self.frames_analysed = 0
+
+    def run(self) -> Tuple[bool, List[str], List[str]]:
+        """
+        Decode the video and run all checks.
+
+        Returns:
+            Tuple of (is_valid, errors, warnings)
+        """
+        start = time.perf_counter()
+        for timestamps, frames in self.stream:
+            self.frames_analysed += len(frames)
+            for check in self.checks:
+                check.process(timestamps, frames)
+        self.decode_seconds = time.perf_counter() - start
+
+        for check in self.checks:
+            _, errors, warnings = check.finish()
+            self.errors.extend(errors)
+            self.warnings.extend(warnings)
+
+        return len(self.errors) == 0, self.errors, self.warnings
+
+    @property
+    def sampling(self) -> Dict[str, Any]:
+        if self.stream.frame_numbers is None:
+            return {"mode": "fixed", "fps": self.fps}
+        plan = describe_plan(self.stream.frame_numbers, self.stream.info["fps"] or 30.0)
+        plan["frames_decoded"] = self.stream.frames_decoded
+        return plan
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "video": str(self.video_path),
+            "frame_count": self.frames_analysed,
+            "frame_size": [self.stream.width, self.stream.height],
+            "decode_seconds": round(self.decode_seconds, 3),
+            "sampling": self.sampling,
+            "passed": len(self.errors) == 0,
+            "checks": {check.name: check.to_dict() for check in self.checks}
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="JeetLo Factory single-pass frame QA"
+    )
+    parser.add_argument(
+        "video",
+        help="Path to the rendered video (video.mp4 or final.mp4)"
+    )
+    parser.add_argument(
+        "--subject",
+        choices=sorted(SUBJECT_BACKGROUNDS),
+        help="Subject whose background color to test contrast against "
+             "(default: estimate background from each frame's border)"
+    )
+    parser.add_argument(
+        "--background",
+        metavar="HEX",
+        help="The background color the reel was rendered with (overrides --subject's)"
+    )
+    parser.add_argument(
+        "--fps",
+        type=float,
+        default=DEFAULT_FPS,
+        help=f"Sampling rate in frames per second (default: {DEFAULT_FPS})"
+    )
+    parser.add_argument(
+        "--width",
+        type=int,
+        default=DEFAULT_WIDTH,
+        help=f"Downscaled frame width in pixels (default: {DEFAULT_WIDTH})"
+    )
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Sample densely around segment transitions and motion, sparsely during holds"
+    )
+    parser.add_argument(
+        "--budget",
+        type=int,
+        default=DEFAULT_BUDGET,
+        help=f"Maximum frames to decode in adaptive mode (default: {DEFAULT_BUDGET})"
+    )
+    parser.add_argument(
+        "--timings",
+        help="timings.json for segment boundaries (default: found next to the video)"
+    )
+    parser.add_argument(
+        "--no-motion",
+        action="store_true",
+        help="Adaptive mode without motion: decode only the frames planned from timings"
+    )
+    parser.add_argument(
+        "--json",
+        dest="json_path",
+        help="Write the full QA report to this JSON file"
+    )
+
+    args = parser.parse_args()
+    if args.background and not re.fullmatch(r"#?[0-9A-Fa-f]{6}", args.background):
+        parser.error(f"--background must be a #RRGGBB color, got {args.background!r}")
+
+    frame_numbers = None
+    stream = None
+    if args.adaptive:
+        timings_path = args.timings or find_timings(args.video)
+        if args.no_motion:
+            frame_numbers = adaptive_frame_numbers(
+                args.video, timings_path=timings_path, budget=args.budget, use_motion=False
+            )
+        else:
+            # Motion probe and checks share one decode
+            boundaries = None
+            if timings_path and Path(timings_path).exists():
+                boundaries = load_segment_boundaries(timings_path)
+            stream = AdaptiveStream(args.video, boundaries, budget=args.budget, width=args.width)
+
+    qa = FrameQA(
+        args.video,
+        subject=args.subject,
+        fps=args.fps,
+        width=args.width,
+        frame_numbers=frame_numbers,
+        background=args.background,
+        stream=stream
+    )
+    is_valid, errors, warnings = qa.run()
+    report = qa.to_dict()
+
+    print(f"Frames analysed: {report['frame_count']} "
+          f"({report['frame_size'][0]}x{report['frame_size'][1]}) "
+          f"in {report['decode_seconds']:.2f}s")
+
+    for w in warnings:
+        print(f"  ⚠ {w}")
+    for e in errors:
+        print(f"  ✗ {e}")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if not is_valid:
+        print(f"✗ Frame QA FAILED: {len(errors)} error(s)")
+        sys.exit(1)
+
+    print("✓ Frame QA PASSED")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
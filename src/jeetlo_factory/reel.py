@@ -10,6 +10,7 @@ Usage:
 
     reel = Reel.create("bio-05-topic", subject="biology")
     reel.generate_audio(segments=[...])
+    reel.dry_run("ReelClassName")      # optional: layout pass, no rendering
     reel.render_video("ReelClassName")
     reel.combine()
     reel.validate()
@@ -19,10 +20,15 @@ Usage:
 import json
 import os
 import subprocess
+import sys
+import tempfile
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
-from .manifest import Manifest, get_file_hash, get_directory_hash
+from .manifest import Manifest, copy_and_hash, get_file_hash, get_directory_hash
+from .discovery import update_catalogue
+from .instrument import measure
+from .layout import LAYOUT_LOG_ENV, LAYOUT_LOG_FILENAME
 from .exceptions import (
     StepNotCompletedError,
     ValidationError,
@@ -35,6 +41,7 @@ from .validators import (
     VideoValidator,
     PronunciationValidator
 )
+from .validators.audio_validator import COMBINED_AUDIO_FILENAME, audio_file_stamp
 
 
 # Subject configurations
@@ -90,6 +97,8 @@ class Reel:
         if subject not in SUBJECT_CONFIG:
             raise ValueError(f"Invalid subject: {subject}. Must be one of {list(SUBJECT_CONFIG.keys())}")
 
+        perf = measure().start()
+
         # Determine reel path
         if base_path:
             reel_path = Path(base_path) / reel_id
@@ -110,10 +119,14 @@ class Reel:
             output_hash=get_directory_hash(str(reel_path)),
             metadata={
                 "subject": subject,
-                "config": SUBJECT_CONFIG[subject]
+                "config": SUBJECT_CONFIG[subject],
+                "perf": perf.stop()
             }
         )
 
+        # Keep the catalogue index (if the reels directory has one) current
+        update_catalogue(str(reel_path.parent))
+
         # Create instance
         reel = cls(str(reel_path))
         reel.manifest = manifest
@@ -162,6 +175,8 @@ class Reel:
         voice = voice or config["voice"]
         speaking_rate = speaking_rate or config["speaking_rate"]
 
+        perf = measure().start()
+
         # Validate pronunciation before generating
         print("Validating pronunciation...")
         all_text = " ".join(s.get("text", "") for s in segments)
@@ -223,7 +238,10 @@ class Reel:
                 "voice": voice,
                 "speaking_rate": speaking_rate,
                 "segment_count": len(segments),
-                "total_duration": sum(t.get("duration", 0) for t in timings)
+                "total_duration": sum(t.get("duration", 0) for t in timings),
+                # Lets AudioValidator skip ffprobe while the file is unchanged
+                "combined_audio": audio_file_stamp(str(audio_dir / COMBINED_AUDIO_FILENAME)),
+                "perf": perf.stop()
             }
         )
 
@@ -319,16 +337,62 @@ async function main() {{
 main().catch(console.error);
 '''
 
-    def render_video(self, class_name: str) -> str:
+    def dry_run(self, class_name: str = None) -> Dict[str, Any]:
+        """
+        Execute reel.py with rendering disabled and validate the result.
+
+        Checks scene duration against the audio, text overlaps and
+        out-of-frame content from the layout log, and mobject counts.
+        Takes seconds instead of a full render's minutes.
+
+        Args:
+            class_name: Scene class to run (default: first Scene in reel.py)
+
+        Returns:
+            Dry-run stats (plays, waits, duration, mobject counts)
+        """
+        # Imported here so `python -m jeetlo_factory.dryrun` doesn't find
+        # itself already imported via the package __init__
+        from .dryrun import DryRunValidator
+
+        print("Dry run (rendering disabled)...")
+        validator = DryRunValidator(str(self.reel_path), class_name)
+        is_valid, errors, warnings = validator.validate()
+
+        if warnings:
+            print("⚠ Dry run warnings:")
+            for warning in warnings:
+                print(f"  - {warning}")
+
+        if errors:
+            print("✗ Dry run FAILED:")
+            for error in errors:
+                print(f"  - {error}")
+            raise ValidationError("Dry run failed. Fix reel.py before rendering.")
+
+        stats = validator.stats
+        print(f"✓ Dry run passed: {stats.get('plays', 0)} plays, "
+              f"{stats.get('duration', 0):.1f}s, max {stats.get('max_mobjects', 0)} mobjects")
+        return stats
+
+    def render_video(self, class_name: str, dry_run: bool = False, profile: bool = False) -> str:
         """
         Render video using Manim.
 
         Args:
             class_name: Name of the Manim Scene class to render
+            dry_run: Run the no-render layout pass first and stop on errors
+                (jeetlo.sh's render script always does)
+            profile: Render under the sampling profiler and write
+                .render_profile.json/.folded next to the manifest
 
         Returns:
             Path to rendered video file
         """
+        # Imported here so `python -m jeetlo_factory.profiling` doesn't find
+        # itself already imported via the package __init__
+        from .profiling import PROFILE_JSON_FILENAME
+
         if not self.manifest or not self.manifest.has_step("audio"):
             raise StepNotCompletedError("Audio must be generated before rendering video.")
 
@@ -336,6 +400,8 @@ main().catch(console.error);
         if not reel_py.exists():
             raise FileNotFoundError(f"No reel.py found at {reel_py}")
 
+        perf = measure().start()
+
         # Validate text in reel code
         print("Validating on-screen text...")
         video_validator = VideoValidator(str(self.reel_path))
@@ -347,22 +413,34 @@ main().catch(console.error);
                 print(f"  - {error}")
             raise ValidationError("On-screen text validation failed. Use English text on screen.")
 
+        if dry_run:
+            self.dry_run(class_name)
+
         # Render with Manim
-        print(f"Rendering {class_name}...")
+        print(f"Rendering {class_name}{' (profiling)' if profile else ''}...")
+        command = ["manim", "render", "-qh", str(reel_py), class_name]
+        env = {
+            **os.environ,
+            "PATH": f"{os.environ.get('PATH', '')}:/opt/homebrew/bin:/Library/TeX/texbin",
+            # JeetLoReelMixin records on-screen layout for overlap checks
+            LAYOUT_LOG_ENV: str(self.reel_path / LAYOUT_LOG_FILENAME)
+        }
+        if profile:
+            package_root = str(Path(__file__).resolve().parent.parent)
+            env["PYTHONPATH"] = os.pathsep.join(p for p in (package_root, os.environ.get("PYTHONPATH")) if p)
+            command = [
+                sys.executable, "-m", "jeetlo_factory.profiling",
+                "--output", str(self.reel_path), "--"
+            ] + command[1:]
+
         try:
             result = subprocess.run(
-                [
-                    "manim", "render", "-qh",
-                    str(reel_py), class_name
-                ],
+                command,
                 cwd=str(self.reel_path),
                 capture_output=True,
                 text=True,
-                timeout=600,
-                env={
-                    **os.environ,
-                    "PATH": f"{os.environ.get('PATH', '')}:/opt/homebrew/bin:/Library/TeX/texbin"
-                }
+                timeout=1800 if profile else 600,
+                env=env
             )
             if result.returncode != 0:
                 raise ExternalServiceError(f"Manim render failed: {result.stderr}")
@@ -380,25 +458,37 @@ main().catch(console.error);
 
         # Record step
         prev_hash = self.manifest.get_last_output_hash()
+        video_hash = get_file_hash(str(video_path))
+
+        metadata = {
+            "class_name": class_name,
+            "video_path": str(video_path),
+            "video_hash": video_hash,
+            "perf": perf.stop()
+        }
+        if profile:
+            metadata["profile"] = PROFILE_JSON_FILENAME
 
         self.manifest.add_step(
             step_name="video",
             input_hash=prev_hash,
-            output_hash=get_file_hash(str(video_path)),
-            metadata={
-                "class_name": class_name,
-                "video_path": str(video_path),
-                "video_hash": get_file_hash(str(video_path))
-            }
+            output_hash=video_hash,
+            metadata=metadata
         )
 
         print(f"✓ Video rendered: {video_path}")
         return str(video_path)
 
-    def combine(self) -> str:
+    def combine(self, stream: bool = False) -> str:
         """
         Combine video and audio into final.mp4.
 
+        Args:
+            stream: Have ffmpeg write to a pipe and hash final.mp4 while
+                saving it, instead of reading it back afterwards. The MP4
+                is then fragmented (its index is written first, since a
+                pipe can't be seeked back to)
+
         Returns:
             Path to final video file
         """
@@ -411,26 +501,41 @@ main().catch(console.error);
         final_path = self.reel_path / "final.mp4"
 
         print("Combining video and audio...")
+        perf = measure().start()
+
+        command = [
+            "ffmpeg", "-y",
+            "-i", video_path,
+            "-i", str(audio_path),
+            "-c:v", "libx264",
+            "-preset", "fast",
+            "-crf", "18",
+            "-c:a", "aac",
+            "-b:a", "192k",
+            "-shortest"
+        ]
+
+        if stream:
+            command += ["-movflags", "frag_keyframe+empty_moov+default_base_moof", "-f", "mp4", "pipe:1"]
+            # stderr goes to a file so a chatty ffmpeg can't block on a full pipe
+            with tempfile.TemporaryFile() as stderr:
+                with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr) as process:
+                    final_hash = copy_and_hash(process.stdout, str(final_path))
+                stderr.seek(0)
+                if process.returncode != 0:
+                    # Don't leave a truncated fragmented MP4 behind
+                    final_path.unlink(missing_ok=True)
+                    raise ExternalServiceError(f"FFmpeg failed: {stderr.read().decode(errors='replace')}")
+        else:
+            result = subprocess.run(
+                command + [str(final_path)],
+                capture_output=True,
+                text=True
+            )
 
-        result = subprocess.run(
-            [
-                "ffmpeg", "-y",
-                "-i", video_path,
-                "-i", str(audio_path),
-                "-c:v", "libx264",
-                "-preset", "fast",
-                "-crf", "18",
-                "-c:a", "aac",
-                "-b:a", "192k",
-                "-shortest",
-                str(final_path)
-            ],
-            capture_output=True,
-            text=True
-        )
-
-        if result.returncode != 0:
-            raise ExternalServiceError(f"FFmpeg failed: {result.stderr}")
+            if result.returncode != 0:
+                raise ExternalServiceError(f"FFmpeg failed: {result.stderr}")
+            final_hash = get_file_hash(str(final_path))
 
         # Record step
         prev_hash = self.manifest.get_last_output_hash()
@@ -438,10 +543,12 @@ main().catch(console.error);
         self.manifest.add_step(
             step_name="combine",
             input_hash=prev_hash,
-            output_hash=get_file_hash(str(final_path)),
+            output_hash=final_hash,
             metadata={
                 "final_path": str(final_path),
-                "final_hash": get_file_hash(str(final_path))
+                "final_hash": final_hash,
+                "streamed": stream,
+                "perf": perf.stop()
             }
         )
 
@@ -455,6 +562,7 @@ main().catch(console.error);
         This runs all validators and must pass before posting.
         """
         print("Running validation...")
+        perf = measure().start()
         all_errors = []
         all_warnings = []
 
@@ -489,7 +597,7 @@ main().catch(console.error);
             raise ValidationError(f"Validation failed with {len(all_errors)} errors")
 
         # Mark as validated
-        self.manifest.mark_validated()
+        self.manifest.mark_validated(perf=perf.stop())
         print("\n✓ Validation PASSED")
         return True
 
@@ -0,0 +1,112 @@
+"""
+Machine-Readable CI Results
+===========================
+
+Writers for jeetlo-validate ``--format``. Each result is written (and
+flushed) the moment its reel finishes, so a dashboard tailing the output
+sees progress on large runs without parsing the human log.
+
+Formats:
+    jsonl - one JSON object per reel, then a final {"summary": ...} line
+    json  - {"results": [...], "summary": {...}}, streamed element by element
+    junit - JUnit XML, one <testcase> per reel with its validation time
+
+Every result carries ``seconds`` (total) and ``timings`` (seconds per
+validator) so slow validators can be spotted per reel.
+"""
+
+import json
+from typing import Any, Dict, TextIO
+from xml.sax.saxutils import escape, quoteattr
+
+
+FORMATS = ("text", "json", "jsonl", "junit")
+
+
+class ResultWriter:
+    """Base writer: ``write`` per reel as it completes, ``close`` once."""
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self.count = 0
+
+    def write(self, result: Dict[str, Any]):
+        self._write(result)
+        self.count += 1
+        self.stream.flush()
+
+    def _write(self, result: Dict[str, Any]):
+        raise NotImplementedError
+
+    def close(self, summary: Dict[str, Any]):
+        self.stream.flush()
+
+
+class JsonlWriter(ResultWriter):
+    def _write(self, result: Dict[str, Any]):
+        self.stream.write(json.dumps(result, ensure_ascii=False) + "\n")
+
+    def close(self, summary: Dict[str, Any]):
+        self.stream.write(json.dumps({"summary": summary}, ensure_ascii=False) + "\n")
+        super().close(summary)
+
+
+class JsonWriter(ResultWriter):
+    def __init__(self, stream: TextIO):
+        super().__init__(stream)
+        self.stream.write('{"results": [')
+
+    def _write(self, result: Dict[str, Any]):
+        self.stream.write(("," if self.count else "") + "\n  " + json.dumps(result, ensure_ascii=False))
+
+    def close(self, summary: Dict[str, Any]):
+        self.stream.write('\n], "summary": ' + json.dumps(summary, ensure_ascii=False) + "}\n")
+        super().close(summary)
+
+
+class JUnitWriter(ResultWriter):
+    """
+    JUnit XML. The suite header is written before any reel has run, so
+    totals go in the suite's trailing ``<system-out>``; CI consumers count
+    testcases themselves.
+    """
+
+    def __init__(self, stream: TextIO, suite: str = "jeetlo-validate"):
+        super().__init__(stream)
+        self.stream.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        self.stream.write(f"<testsuites name={quoteattr(suite)}>\n")
+        self.stream.write(f"  <testsuite name={quoteattr(suite)}>\n")
+
+    def _write(self, result: Dict[str, Any]):
+        name = quoteattr(result["reel_id"])
+        mode = quoteattr(result.get("mode", "full"))
+        seconds = result.get("seconds", 0.0)
+        self.stream.write(f'    <testcase classname={mode} name={name} time="{seconds:.3f}">\n')
+
+        if not result["passed"]:
+            errors = result.get("errors", [])
+            message = quoteattr(f"{len(errors)} error(s)")
+            self.stream.write(f"      <failure message={message}>{escape(chr(10).join(errors))}</failure>\n")
+
+        lines = [f"WARNING: {w}" if not w.startswith("WARNING") else w for w in result.get("warnings", [])]
+        lines += [f"timing {validator}: {s:.3f}s" for validator, s in result.get("timings", {}).items()]
+        if result.get("cached"):
+            lines.append("result reported from cache")
+        if lines:
+            self.stream.write(f"      <system-out>{escape(chr(10).join(lines))}</system-out>\n")
+
+        self.stream.write("    </testcase>\n")
+
+    def close(self, summary: Dict[str, Any]):
+        totals = "\n".join(f"{key}: {value}" for key, value in summary.items())
+        self.stream.write(f"    <system-out>{escape(totals)}</system-out>\n")
+        self.stream.write("  </testsuite>\n</testsuites>\n")
+        super().close(summary)
+
+
+def make_writer(fmt: str, stream: TextIO) -> ResultWriter:
+    """Writer for a --format value other than "text"."""
+    writers = {"json": JsonWriter, "jsonl": JsonlWriter, "junit": JUnitWriter}
+    if fmt not in writers:
+        raise ValueError(f"Unknown format: {fmt}. Must be one of {list(writers)}")
+    return writers[fmt](stream)
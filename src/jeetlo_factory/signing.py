@@ -0,0 +1,277 @@
+"""
+Step Signing
+============
+
+A hash chain proves steps are linked, not who produced them: anyone can
+recompute it. With a local Ed25519 key, ``Manifest.add_step`` also signs
+each step, and CI checks the signatures against a list of trusted public
+keys committed to the repo.
+
+Signed payload: the step as canonical JSON (sorted keys, no whitespace,
+without its ``signature``) together with the reel_id, so a signed step
+can't be moved to another reel. Because each step carries its
+input_hash, signing every step also pins the order of the chain.
+
+Requires cryptography (``pip install jeetlo-factory[signing]``). Signing
+is on when ``JEETLO_SIGNING_KEY`` points to a private key file.
+
+Usage:
+    python -m jeetlo_factory.signing keygen ~/.jeetlo/signing_key.pem --trust .jeetlo_trusted_keys.json
+    export JEETLO_SIGNING_KEY=~/.jeetlo/signing_key.pem
+    python -m jeetlo_factory.signing verify reels/ --keys .jeetlo_trusted_keys.json
+    python -m jeetlo_factory.ci reels/ --chain-only --signatures
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+        Ed25519PrivateKey, Ed25519PublicKey
+    )
+except ImportError:
+    Ed25519PrivateKey = None
+
+from .discovery import find_reels
+from .exceptions import ManifestError
+from .manifest import find_chain_file
+
+
+SIGNING_KEY_ENV = "JEETLO_SIGNING_KEY"
+TRUSTED_KEYS_FILENAME = ".jeetlo_trusted_keys.json"
+ALGORITHM = "ed25519"
+
+
+def _require_cryptography():
+    if Ed25519PrivateKey is None:
+        raise ManifestError(
+            "Step signing requires cryptography (pip install jeetlo-factory[signing])"
+        )
+
+
+def signing_payload(reel_id: str, step: Dict[str, Any]) -> bytes:
+    """The bytes signed for a step: canonical JSON of reel_id + step minus its signature."""
+    body = {k: v for k, v in step.items() if k != "signature"}
+    return json.dumps(
+        {"reel_id": reel_id, "step": body},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False
+    ).encode()
+
+
+def key_id(public_key_hex: str) -> str:
+    """Short, stable name for a public key."""
+    return hashlib.sha256(bytes.fromhex(public_key_hex)).hexdigest()[:16]
+
+
+class StepSigner:
+    """Signs manifest steps with one Ed25519 private key."""
+
+    def __init__(self, private_key: "Ed25519PrivateKey"):
+        self.private_key = private_key
+        raw = private_key.public_key().public_bytes(
+            serialization.Encoding.Raw, serialization.PublicFormat.Raw
+        )
+        self.public_key_hex = raw.hex()
+        self.key_id = key_id(self.public_key_hex)
+
+    @classmethod
+    def from_file(cls, path: str) -> "StepSigner":
+        _require_cryptography()
+        try:
+            with open(os.path.expanduser(path), "rb") as f:
+                key = serialization.load_pem_private_key(f.read(), password=None)
+        except (OSError, ValueError) as e:
+            raise ManifestError(f"Cannot load signing key {path}: {e}")
+        if not isinstance(key, Ed25519PrivateKey):
+            raise ManifestError(f"Signing key {path} is not an Ed25519 key")
+        return cls(key)
+
+    @classmethod
+    def generate(cls, path: str) -> "StepSigner":
+        """Create a new key, written owner-readable only."""
+        _require_cryptography()
+        key = Ed25519PrivateKey.generate()
+        pem = key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption()
+        )
+        path = Path(os.path.expanduser(path))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(pem)
+        return cls(key)
+
+    def sign(self, reel_id: str, step: Dict[str, Any]) -> Dict[str, str]:
+        """The ``signature`` entry for a step."""
+        return {
+            "alg": ALGORITHM,
+            "key_id": self.key_id,
+            "sig": self.private_key.sign(signing_payload(reel_id, step)).hex()
+        }
+
+
+def load_signer() -> Optional[StepSigner]:
+    """The signer configured by ``JEETLO_SIGNING_KEY``, or None if signing is off."""
+    path = os.environ.get(SIGNING_KEY_ENV)
+    return StepSigner.from_file(path) if path else None
+
+
+def load_trusted_keys(path: str) -> Dict[str, str]:
+    """key_id -> public key hex from a trusted keys file (missing file: no keys)."""
+    if not Path(path).exists():
+        return {}
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except ValueError as e:
+        raise ManifestError(f"Invalid trusted keys file {path}: {e}")
+    keys = data.get("keys", data) if isinstance(data, dict) else {}
+    return {key_id(hex_key): hex_key for hex_key in keys.values()}
+
+
+class SignatureVerifier:
+    """
+    Checks step signatures against trusted keys.
+
+    One verifier is shared across every reel in a CI run, so each public
+    key is decoded once and each manifest is verified from the document
+    CI has already parsed.
+    """
+
+    def __init__(self, trusted_keys: Dict[str, str], require: bool = False):
+        _require_cryptography()
+        self.trusted_keys = trusted_keys
+        self.require = require
+        self._public_keys: Dict[str, "Ed25519PublicKey"] = {}
+        self.verified = 0
+
+    def _public_key(self, kid: str) -> Optional["Ed25519PublicKey"]:
+        if kid not in self._public_keys:
+            hex_key = self.trusted_keys.get(kid)
+            if hex_key is None:
+                return None
+            self._public_keys[kid] = Ed25519PublicKey.from_public_bytes(bytes.fromhex(hex_key))
+        return self._public_keys[kid]
+
+    def verify_document(self, data: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+        """
+        Verify every signed step of a chain document.
+
+        Returns:
+            Tuple of (errors, warnings)
+        """
+        errors, warnings = [], []
+        reel_id = data.get("reel_id", "")
+        unsigned = []
+
+        for i, step in enumerate(data.get("steps") or []):
+            name = step.get("step_name") or step.get("step") or f"#{i}"
+            signature = step.get("signature")
+            if not signature:
+                unsigned.append(name)
+                continue
+
+            kid = signature.get("key_id", "")
+            public_key = self._public_key(kid)
+            if signature.get("alg") != ALGORITHM:
+                errors.append(f"SIGNATURE ERROR: Step '{name}' uses unsupported algorithm {signature.get('alg')!r}")
+                continue
+            if public_key is None:
+                errors.append(f"SIGNATURE ERROR: Step '{name}' signed by untrusted key {kid}")
+                continue
+            try:
+                public_key.verify(bytes.fromhex(signature.get("sig", "")), signing_payload(reel_id, step))
+                self.verified += 1
+            except (InvalidSignature, ValueError):
+                errors.append(f"SIGNATURE ERROR: Step '{name}' has an invalid signature (modified after signing?)")
+
+        if unsigned:
+            message = f"{len(unsigned)} unsigned step(s): {', '.join(unsigned)}"
+            if self.require:
+                errors.append(f"SIGNATURE ERROR: {message}")
+            elif len(unsigned) < len(data.get("steps") or []):
+                warnings.append(f"WARNING: {message}")
+
+        return errors, warnings
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Create signing keys and verify signed manifests"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    keygen = sub.add_parser("keygen", help="Create an Ed25519 signing key")
+    keygen.add_argument("key", help="Private key file to create")
+    keygen.add_argument("--trust", metavar="PATH", help="Add the public key to this trusted keys file")
+
+    verify = sub.add_parser("verify", help="Verify step signatures of every reel under a path")
+    verify.add_argument("path")
+    verify.add_argument("--keys", default=TRUSTED_KEYS_FILENAME, help="Trusted keys file")
+    verify.add_argument("--require", action="store_true", help="Unsigned steps are errors")
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == "keygen":
+            signer = StepSigner.generate(args.key)
+            print(f"✓ Key {signer.key_id}: {signer.public_key_hex}")
+            if args.trust:
+                trusted = {}
+                if Path(args.trust).exists():
+                    with open(args.trust, "r") as f:
+                        trusted = json.load(f)
+                trusted.setdefault("keys", {})[signer.key_id] = signer.public_key_hex
+                with open(args.trust, "w") as f:
+                    json.dump(trusted, f, indent=2)
+                    f.write("\n")
+                print(f"✓ Trusted in {args.trust}")
+            print(f"  export {SIGNING_KEY_ENV}={args.key}")
+
+        elif args.command == "verify":
+            verifier = SignatureVerifier(load_trusted_keys(args.keys), require=args.require)
+            start = time.perf_counter()
+            reels = find_reels(args.path, include_proof_chains=True)
+            failed = 0
+            for reel in reels:
+                try:
+                    with open(find_chain_file(str(reel)), "r") as f:
+                        errors, warnings = verifier.verify_document(json.load(f))
+                except ValueError as e:
+                    errors, warnings = [f"Invalid JSON: {e}"], []
+                for w in warnings:
+                    print(f"  ⚠ {reel.name}: {w}")
+                for e in errors:
+                    print(f"  ✗ {reel.name}: {e}")
+                failed += bool(errors)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{len(reels)} reel(s), {verifier.verified} signature(s) verified, "
+                f"{failed} failed ({elapsed:.3f}s)"
+            )
+            sys.exit(1 if failed else 0)
+
+    except FileExistsError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    except ManifestError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
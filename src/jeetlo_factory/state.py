@@ -0,0 +1,427 @@
+"""
+Request State
+=============
+
+Where each request stands - pending, running, completed, failed (or
+invalid/duplicate, as decided by intake) - in a small SQLite store
+(``.jeetlo_requests.db`` next to requests/). Replaces the daemon's
+``.processed_requests`` list, which was grepped once per request per poll
+and only ever grew.
+
+- Lookups and the next-pending query use the primary key and a
+  (status, priority, created_at) index, so a poll costs the same with ten
+  processed requests or ten thousand
+- ``sync`` stats every request file and re-parses only those whose
+  mtime/size changed since the last sync. A file's status is adopted only
+  when it differs from what the file said last time, so an edit to a
+  completed request's topic doesn't re-run it but setting it back to
+  "pending" does
+- Transitions are single conditional UPDATEs (pending -> running ->
+  completed/failed), so two workers can't claim the same request
+
+Usage:
+    python -m jeetlo_factory.state sync               # --requests requests/ by default
+    python -m jeetlo_factory.state claim              # next pending -> running
+    python -m jeetlo_factory.state finish phy-01-gravity completed
+    python -m jeetlo_factory.state list --status failed
+    python -m jeetlo_factory.state show phy-01-gravity
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .exceptions import ValidationError
+from .intake import (
+    TEMPLATE_FILENAME,
+    load_template,
+    normalize_created_at,
+    priority_rank,
+    topic_slug,
+    validate_request,
+)
+
+
+STATE_FILENAME = ".jeetlo_requests.db"
+
+PENDING = "pending"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+INVALID = "invalid"
+DUPLICATE = "duplicate"
+STATES = (PENDING, RUNNING, COMPLETED, FAILED, INVALID, DUPLICATE)
+
+# Allowed transitions: new state -> states it may come from
+TRANSITIONS = {
+    RUNNING: (PENDING,),
+    COMPLETED: (RUNNING,),
+    FAILED: (RUNNING,),
+    PENDING: (FAILED,),
+}
+
+# Request-file status -> store state
+FILE_STATUSES = {
+    "pending": PENDING,
+    "running": RUNNING,
+    "completed": COMPLETED,
+    "ready_to_post": COMPLETED,
+    "posted": COMPLETED,
+    "failed": FAILED,
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS requests (
+    reel_id     TEXT PRIMARY KEY,
+    file        TEXT NOT NULL,
+    subject     TEXT,
+    topic       TEXT,
+    slug        TEXT,
+    priority    INTEGER NOT NULL DEFAULT 1,
+    created_at  TEXT,
+    status      TEXT NOT NULL,
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    updated_at  TEXT NOT NULL,
+    started_at  TEXT,
+    finished_at TEXT,
+    detail      TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_requests_queue ON requests(status, priority, created_at);
+CREATE INDEX IF NOT EXISTS idx_requests_topic ON requests(subject, slug);
+CREATE TABLE IF NOT EXISTS files (
+    name        TEXT PRIMARY KEY,
+    mtime_ns    INTEGER NOT NULL,
+    size        INTEGER NOT NULL,
+    reel_id     TEXT NOT NULL,
+    file_status TEXT
+);
+"""
+
+
+def now_iso() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _text(value: Any) -> Optional[str]:
+    # Invalid requests are stored too; a field of the wrong type is dropped
+    return value if isinstance(value, str) else None
+
+
+class RequestState:
+    """The request state store for one requests/ directory."""
+
+    def __init__(self, requests_dir: str, path: Optional[str] = None):
+        self.requests_dir = Path(requests_dir)
+        self.path = Path(path) if path else self.requests_dir.parent / STATE_FILENAME
+        # Autocommit; transactions are opened explicitly where needed
+        self.conn = sqlite3.connect(str(self.path), isolation_level=None, timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self) -> "RequestState":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    # ---------------------------------------------------------------- reads
+
+    def get(self, reel_id: str) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute("SELECT * FROM requests WHERE reel_id = ?", (reel_id,)).fetchone()
+        return dict(row) if row else None
+
+    def list(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        if status:
+            rows = self.conn.execute(
+                "SELECT * FROM requests WHERE status = ? ORDER BY priority, created_at, reel_id", (status,)
+            )
+        else:
+            rows = self.conn.execute("SELECT * FROM requests ORDER BY priority, created_at, reel_id")
+        return [dict(row) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        rows = self.conn.execute("SELECT status, COUNT(*) AS n FROM requests GROUP BY status")
+        return {row["status"]: row["n"] for row in rows}
+
+    # ----------------------------------------------------------------- sync
+
+    def sync(self) -> Dict[str, int]:
+        """
+        Bring the store up to date with the request files, parsing only
+        new or changed ones.
+
+        Returns:
+            {"scanned": n, "parsed": n}
+        """
+        known = {
+            row["name"]: (row["mtime_ns"], row["size"])
+            for row in self.conn.execute("SELECT name, mtime_ns, size FROM files")
+        }
+        template = None
+        scanned = parsed = 0
+
+        with os.scandir(self.requests_dir) as entries:
+            files = sorted(
+                (e for e in entries if e.name.endswith(".json") and e.name != TEMPLATE_FILENAME and e.is_file()),
+                key=lambda e: e.name
+            )
+
+        for entry in files:
+            scanned += 1
+            st = entry.stat()
+            if known.get(entry.name) == (st.st_mtime_ns, st.st_size):
+                continue
+            if template is None:
+                template = load_template(str(self.requests_dir))
+            self._load_file(entry.name, st, template)
+            parsed += 1
+
+        return {"scanned": scanned, "parsed": parsed}
+
+    def _load_file(self, name: str, st: os.stat_result, template: Dict[str, Any]):
+        try:
+            with open(self.requests_dir / name, "r") as f:
+                request = json.load(f)
+            if not isinstance(request, dict):
+                raise ValueError("not a JSON object")
+            normalize_created_at(request)
+            valid, errors, _ = validate_request(request, template, name)
+        except (OSError, ValueError) as e:
+            request, valid, errors = {}, False, [f"REQUEST ERROR: Cannot parse {name}: {e}"]
+
+        reel_id = request.get("reel_id") if valid else None
+        reel_id = reel_id or Path(name).stem
+        file_status = request.get("status", "pending")
+        file_state = FILE_STATUSES.get(file_status, PENDING)
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            current = self.get(reel_id)
+            previous = self.conn.execute("SELECT file_status FROM files WHERE name = ?", (name,)).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO files (name, mtime_ns, size, reel_id, file_status) VALUES (?, ?, ?, ?, ?)",
+                (name, st.st_mtime_ns, st.st_size, reel_id, file_status)
+            )
+
+            if current and current["file"] != name and (self.requests_dir / current["file"]).exists():
+                # Second file with the same reel_id; the first one owns the request
+                self.conn.execute("COMMIT")
+                return
+
+            detail = current["detail"] if current else None
+            if not valid:
+                state = INVALID
+                detail = "; ".join(errors)
+            elif current and current["status"] not in (INVALID, DUPLICATE) and previous \
+                    and previous["file_status"] == file_status:
+                # Content edit only; the store's state is newer than the file's
+                state = current["status"]
+            elif current and current["status"] == RUNNING and file_state == PENDING:
+                # The worker hasn't written its result back to the file yet
+                state = RUNNING
+            else:
+                state, detail = file_state, None
+                if state == PENDING:
+                    original = self._duplicate_of(reel_id, request)
+                    if original:
+                        state = DUPLICATE
+                        detail = f"duplicate of {original}"
+
+            self.conn.execute(
+                """
+                INSERT INTO requests (reel_id, file, subject, topic, slug, priority,
+                                      created_at, status, updated_at, detail)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(reel_id) DO UPDATE SET
+                    file = excluded.file, subject = excluded.subject, topic = excluded.topic,
+                    slug = excluded.slug, priority = excluded.priority, created_at = excluded.created_at,
+                    status = excluded.status, updated_at = excluded.updated_at, detail = excluded.detail
+                """,
+                (
+                    reel_id, name, _text(request.get("subject")), _text(request.get("topic")), topic_slug(reel_id),
+                    priority_rank(request.get("priority")), _text(request.get("created_at")),
+                    state, now_iso(), detail
+                )
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def _duplicate_of(self, reel_id: str, request: Dict[str, Any]) -> Optional[str]:
+        """An older live (not failed) request with the same subject and topic slug."""
+        row = self.conn.execute(
+            """
+            SELECT reel_id FROM requests
+            WHERE subject = ? AND slug = ? AND reel_id != ? AND status IN (?, ?, ?)
+              AND COALESCE(created_at, '~') <= COALESCE(?, '~')
+            ORDER BY created_at, reel_id LIMIT 1
+            """,
+            (request.get("subject"), topic_slug(reel_id), reel_id, PENDING, RUNNING, COMPLETED,
+             request.get("created_at"))
+        ).fetchone()
+        return row["reel_id"] if row else None
+
+    # ---------------------------------------------------------- transitions
+
+    def transition(self, reel_id: str, state: str, detail: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Move a request to ``state`` if its current state allows it
+        (running -> pending is ``requeue_running``).
+
+        Raises:
+            ValidationError: unknown request or disallowed transition
+        """
+        if state not in TRANSITIONS:
+            raise ValidationError(f"Cannot move a request to '{state}'")
+        sources = TRANSITIONS[state]
+        now = now_iso()
+        stamps = {
+            RUNNING: ", started_at = :now, finished_at = NULL, attempts = attempts + 1",
+            COMPLETED: ", finished_at = :now",
+            FAILED: ", finished_at = :now",
+            PENDING: "",
+        }[state]
+
+        params = {"state": state, "now": now, "detail": detail, "reel_id": reel_id}
+        params.update({f"from{i}": source for i, source in enumerate(sources)})
+        placeholders = ", ".join(f":from{i}" for i in range(len(sources)))
+        cursor = self.conn.execute(
+            f"UPDATE requests SET status = :state, updated_at = :now, detail = :detail{stamps} "
+            f"WHERE reel_id = :reel_id AND status IN ({placeholders})",
+            params
+        )
+        if cursor.rowcount == 0:
+            current = self.get(reel_id)
+            if current is None:
+                raise ValidationError(f"Unknown request: {reel_id}")
+            raise ValidationError(f"Cannot move {reel_id} from '{current['status']}' to '{state}'")
+        return self.get(reel_id)
+
+    def claim(self) -> Optional[Dict[str, Any]]:
+        """Atomically take the next pending request (priority, then age) and mark it running."""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self.conn.execute(
+                "SELECT reel_id FROM requests WHERE status = ? ORDER BY priority, created_at, reel_id LIMIT 1",
+                (PENDING,)
+            ).fetchone()
+            claimed = self.transition(row["reel_id"], RUNNING) if row else None
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return claimed
+
+    def requeue_running(self) -> int:
+        """Put requests left running by a worker that died back to pending."""
+        cursor = self.conn.execute(
+            "UPDATE requests SET status = ?, updated_at = ?, detail = 'requeued after interrupted run' "
+            "WHERE status = ?",
+            (PENDING, now_iso(), RUNNING)
+        )
+        return cursor.rowcount
+
+
+def _print_row(row: Dict[str, Any]):
+    detail = f"  ({row['detail']})" if row.get("detail") else ""
+    print(f"  {row['reel_id']:<36} {row['status']:<10} {row['subject'] or '?':<12} "
+          f"attempts {row['attempts']}{detail}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Request state store: sync request files, claim and finish requests"
+    )
+    parser.add_argument(
+        "--requests",
+        default="requests",
+        help="Requests directory (default: requests)"
+    )
+    parser.add_argument(
+        "--db",
+        help=f"State database (default: {STATE_FILENAME} next to the requests directory)"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("sync", help="Re-read new or changed request files")
+
+    claim = sub.add_parser("claim", help="Mark the next pending request running and print it")
+    claim.add_argument("--no-sync", action="store_true", help="Don't sync first")
+
+    finish = sub.add_parser("finish", help="Record the outcome of a running request")
+    finish.add_argument("reel_id")
+    finish.add_argument("outcome", choices=(COMPLETED, FAILED))
+    finish.add_argument("--detail", help="Note to store (e.g. exit code)")
+
+    retry = sub.add_parser("retry", help="Put a failed request back in the queue")
+    retry.add_argument("reel_id")
+
+    sub.add_parser("requeue", help="Return requests left running by a dead worker to pending")
+
+    show = sub.add_parser("show", help="Print one request's state as JSON")
+    show.add_argument("reel_id")
+
+    listing = sub.add_parser("list", help="List requests in queue order")
+    listing.add_argument("--status", choices=STATES)
+
+    args = parser.parse_args()
+
+    with RequestState(args.requests, args.db) as state:
+        try:
+            if args.command == "sync":
+                result = state.sync()
+                counts = ", ".join(f"{n} {s}" for s, n in sorted(state.counts().items()))
+                print(f"✓ Synced {result['scanned']} file(s), parsed {result['parsed']}: {counts or 'empty'}")
+
+            elif args.command == "claim":
+                if not args.no_sync:
+                    state.sync()
+                claimed = state.claim()
+                if claimed is None:
+                    sys.exit(1)
+                # Tab-separated for `IFS=$'\t' read -r id subject topic`
+                print(f"{claimed['reel_id']}\t{claimed['subject'] or ''}\t{claimed['topic'] or ''}")
+
+            elif args.command == "finish":
+                row = state.transition(args.reel_id, args.outcome, args.detail)
+                print(f"✓ {row['reel_id']}: {row['status']}")
+
+            elif args.command == "retry":
+                row = state.transition(args.reel_id, PENDING)
+                print(f"✓ {row['reel_id']}: {row['status']}")
+
+            elif args.command == "requeue":
+                print(f"✓ Requeued {state.requeue_running()} request(s)")
+
+            elif args.command == "show":
+                row = state.get(args.reel_id)
+                if row is None:
+                    print(f"✗ Unknown request: {args.reel_id}", file=sys.stderr)
+                    sys.exit(1)
+                print(json.dumps(row, indent=2))
+
+            elif args.command == "list":
+                rows = state.list(args.status)
+                for row in rows:
+                    _print_row(row)
+                print(f"{len(rows)} request(s)")
+
+        except ValidationError as e:
+            print(f"✗ {e}", file=sys.stderr)
+            sys.exit(1)
+
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -21,43 +21,16 @@ import json
 import os
 
 # ============================================
-# FRAME CONFIGURATION (9:16 Vertical)
+# FRAME CONFIGURATION & BRAND COLORS
 # ============================================
-FRAME_WIDTH = 8
-FRAME_HEIGHT = 14.22
-PIXEL_WIDTH = 1080
-PIXEL_HEIGHT = 1920
-
-# ============================================
-# BRAND COLORS
-# ============================================
-BG_COLOR = "#0D0D0D"  # Near black
-
-# Subject colors
-SUBJECT_COLORS = {
-    "physics": "#0066FF",      # Electric blue
-    "chemistry": "#00CC66",    # Emerald green
-    "biology": "#CC66FF",      # Violet purple
-    "mathematics": "#FF9900",  # Orange
-}
-
-# Subject backgrounds (darker versions)
-SUBJECT_BACKGROUNDS = {
-    "physics": "#0A1628",      # Dark blue
-    "chemistry": "#0A1F14",    # Dark green
-    "biology": "#1A0A2E",      # Dark purple
-    "mathematics": "#1F1408",  # Dark orange
-}
-
-# Common colors
-PRIMARY = "#FFFFFF"
-SECONDARY = "#B0B0B0"
-ACCENT = "#FFD700"       # Gold
-CORRECT = "#22C55E"      # Green
-WRONG = "#EF4444"        # Red
-CYAN = "#00FFFF"
-YELLOW = "#FCD34D"
-ORANGE = "#FF6B35"
+# Defined in brand.py so tooling can use them without Manim.
+# Imported after manim so our colors override Manim's of the same name.
+from .brand import (
+    FRAME_WIDTH, FRAME_HEIGHT, PIXEL_WIDTH, PIXEL_HEIGHT,
+    BG_COLOR, SUBJECT_COLORS, SUBJECT_BACKGROUNDS,
+    PRIMARY, SECONDARY, ACCENT, CORRECT, WRONG, CYAN, YELLOW, ORANGE,
+)
+from .layout import LayoutLogWriter, LAYOUT_LOG_ENV, TEXT, SHAPE
 
 # ============================================
 # TYPOGRAPHY
@@ -134,10 +107,105 @@ def create_flame_logo(scale: float = 1.0) -> VGroup:
     return flame
 
 
+# ============================================
+# LAYOUT LOGGING
+# ============================================
+TEXT_MOBJECTS = (Text, MarkupText, Tex, MathTex)
+
+
+def _is_visible(mob: Mobject) -> bool:
+    """True if any part of the mobject is drawn with non-zero opacity."""
+    for m in mob.family_members_with_points():
+        if isinstance(m, VMobject) and (m.get_fill_opacity() > 0 or m.get_stroke_opacity() > 0):
+            return True
+    return False
+
+
+def _box(kind: str, label: str, mob: Mobject) -> tuple:
+    return (kind, label, mob.get_left()[0], mob.get_bottom()[1], mob.get_right()[0], mob.get_top()[1])
+
+
+def collect_layout_boxes(mobjects: list) -> list:
+    """
+    Bounding boxes for the layout log.
+
+    Every visible Text/Tex anywhere in the scene is a text box; each
+    visible top-level VMobject is also recorded as a shape box.
+    """
+    boxes = []
+
+    def visit(mob):
+        if isinstance(mob, TEXT_MOBJECTS):
+            if _is_visible(mob):
+                label = getattr(mob, "text", None) or getattr(mob, "tex_string", None) or type(mob).__name__
+                boxes.append(_box(TEXT, label[:32], mob))
+            return
+        for sub in mob.submobjects:
+            visit(sub)
+
+    for mob in mobjects:
+        if isinstance(mob, VMobject) and not isinstance(mob, TEXT_MOBJECTS) and _is_visible(mob):
+            boxes.append(_box(SHAPE, type(mob).__name__, mob))
+        visit(mob)
+
+    return boxes
+
+
+class LayoutRecorderMixin:
+    """
+    Records on-screen layout at every play/wait boundary.
+
+    Enabled when JEETLO_LAYOUT_LOG names an output file (see
+    jeetlo_factory.layout). Part of JeetLoReelMixin; the dry run also
+    mixes it into reels that use an older style module.
+    """
+
+    def play(self, *args, **kwargs):
+        super().play(*args, **kwargs)
+        self._layout_plays = getattr(self, "_layout_plays", 0) + 1
+        kind = "wait" if getattr(self, "_layout_in_wait", False) else "play"
+        self._log_layout(kind, getattr(self, "duration", 0.0) or 0.0)
+
+    def wait(self, *args, **kwargs):
+        plays_before = getattr(self, "_layout_plays", 0)
+        self._layout_in_wait = True
+        try:
+            super().wait(*args, **kwargs)
+        finally:
+            self._layout_in_wait = False
+
+        if getattr(self, "_layout_plays", 0) == plays_before:
+            # This Manim version's wait() doesn't go through play()
+            duration = args[0] if args else kwargs.get("duration", DEFAULT_WAIT_TIME)
+            self._log_layout("wait", duration)
+
+    def tear_down(self):
+        super().tear_down()
+        writer = getattr(self, "_layout_writer", None)
+        if writer is not None:
+            writer.close()
+
+    def _log_layout(self, kind: str, duration: float):
+        """Record bounding boxes of everything on screen after a play/wait."""
+        if getattr(self, "_layout_writer", None) is None:
+            path = os.environ.get(LAYOUT_LOG_ENV)
+            if not path:
+                return
+            self._layout_writer = LayoutLogWriter(
+                path, type(self).__name__, config.frame_width, config.frame_height
+            )
+            self._layout_time = 0.0
+
+        self._layout_time += duration
+        self._layout_writer.record(
+            self._layout_time, kind, len(self.mobjects), collect_layout_boxes(self.mobjects)
+        )
+
+
 # ============================================
 # JEETLO REEL MIXIN
 # ============================================
-class JeetLoReelMixin:
+class JeetLoReelMixin(LayoutRecorderMixin):
     """Mixin class providing common JeetLo reel functionality."""
 
     subject = "physics"  # Override in subclass
@@ -233,7 +301,7 @@ __all__ = [
     # Frame
     "FRAME_WIDTH", "FRAME_HEIGHT", "PIXEL_WIDTH", "PIXEL_HEIGHT",
     # Functions
-    "create_brand_watermark", "create_flame_logo",
+    "create_brand_watermark", "create_flame_logo", "collect_layout_boxes",
     # Classes
-    "JeetLoReelMixin",
+    "JeetLoReelMixin", "LayoutRecorderMixin",
 ]
@@ -0,0 +1,205 @@
+"""
+Timings Engine
+==============
+
+Builds audio/timings.json from the audio script and the generated
+segment MP3s in one pass:
+
+1. Segment order comes from audio_script.json (not filename sorting)
+2. Durations are probed in parallel, one ffprobe per segment
+3. Start/end times accumulate as exact Fractions and are rounded once
+   on output, so 30 segments don't drift the way repeated ``bc`` sums do
+
+Also writes the ffmpeg concat list in the same order, so the combined
+audio and timings.json always agree.
+
+Usage:
+    python -m jeetlo_factory.timings audio_script.json audio/
+    python -m jeetlo_factory.timings audio_script.json audio/ --concat audio/concat.txt
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .exceptions import ExternalServiceError, ValidationError
+
+
+TIMINGS_FILENAME = "timings.json"
+COMBINED_AUDIO_FILENAME = "combined_audio.mp3"
+DECIMALS = 6
+PROBE_WORKERS = 8
+
+
+def probe_duration(filepath: str) -> Fraction:
+    """Exact duration of a media file as reported by ffprobe."""
+    try:
+        result = subprocess.run(
+            [
+                "ffprobe", "-v", "error",
+                "-show_entries", "format=duration",
+                "-of", "default=noprint_wrappers=1:nokey=1",
+                filepath
+            ],
+            capture_output=True,
+            text=True
+        )
+    except FileNotFoundError:
+        raise ExternalServiceError("ffprobe not found - install ffmpeg")
+
+    value = result.stdout.strip()
+    if result.returncode != 0 or not value or value == "N/A":
+        raise ExternalServiceError(f"ffprobe could not read duration of {filepath}: {result.stderr.strip()}")
+    return Fraction(value)
+
+
+def load_script(script_path: str) -> List[Dict[str, Any]]:
+    """Segments ({id, text}) from an audio script, in order."""
+    with open(script_path, "r") as f:
+        script = json.load(f)
+    if isinstance(script, dict):
+        script = script.get("segments", [])
+    if not isinstance(script, list):
+        raise ValidationError(f"Audio script {script_path} must be a list of segments")
+    return script
+
+
+def resolve_segment_files(script: List[Dict[str, Any]], audio_dir: str) -> Tuple[List[Path], List[str], List[str]]:
+    """
+    Map script segments to their MP3s.
+
+    Returns:
+        Tuple of (files in script order, errors, warnings)
+    """
+    audio_dir = Path(audio_dir)
+    files, errors, warnings = [], [], []
+    seen = set()
+
+    for i, segment in enumerate(script):
+        seg_id = segment.get("id")
+        if not seg_id:
+            errors.append(f"TIMINGS ERROR: Script segment {i} has no id")
+            continue
+        if seg_id in seen:
+            errors.append(f"TIMINGS ERROR: Duplicate segment id '{seg_id}' in script")
+            continue
+        seen.add(seg_id)
+
+        path = audio_dir / segment.get("file", f"{seg_id}.mp3")
+        if not path.exists():
+            errors.append(f"TIMINGS ERROR: Missing audio for segment '{seg_id}': {path.name}")
+        files.append(path)
+
+    expected = {p.name for p in files} | {COMBINED_AUDIO_FILENAME}
+    for mp3 in sorted(audio_dir.glob("*.mp3")):
+        if mp3.name not in expected:
+            warnings.append(f"WARNING: {mp3.name} is not in the audio script and will be ignored")
+
+    return files, errors, warnings
+
+
+def build_timings(
+    script: List[Dict[str, Any]],
+    durations: List[Fraction],
+    files: Optional[List[Path]] = None
+) -> List[Dict[str, Any]]:
+    """Timings entries with exact cumulative start/end times."""
+    timings = []
+    current = Fraction(0)
+    for i, (segment, duration) in enumerate(zip(script, durations)):
+        end = current + duration
+        entry = {"id": segment["id"]}
+        if files is not None:
+            entry["file"] = files[i].name
+        entry.update({
+            "text": segment.get("text", ""),
+            "duration": round(float(duration), DECIMALS),
+            "startTime": round(float(current), DECIMALS),
+            "endTime": round(float(end), DECIMALS)
+        })
+        timings.append(entry)
+        current = end
+    return timings
+
+
+def generate_timings(
+    script_path: str,
+    audio_dir: str,
+    output_path: Optional[str] = None,
+    concat_path: Optional[str] = None
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Probe segment durations and write timings.json (and a concat list).
+
+    Returns:
+        Tuple of (timings, warnings). Raises ValidationError on missing
+        or duplicate segments.
+    """
+    script = load_script(script_path)
+    files, errors, warnings = resolve_segment_files(script, audio_dir)
+    if errors:
+        raise ValidationError("\n".join(errors))
+
+    with ThreadPoolExecutor(max_workers=PROBE_WORKERS) as pool:
+        durations = list(pool.map(lambda p: probe_duration(str(p)), files))
+
+    timings = build_timings(script, durations, files)
+
+    output_path = output_path or str(Path(audio_dir) / TIMINGS_FILENAME)
+    with open(output_path, "w") as f:
+        json.dump(timings, f, indent=2, ensure_ascii=False)
+
+    if concat_path:
+        with open(concat_path, "w") as f:
+            for path in files:
+                escaped = str(path.resolve()).replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+
+    return timings, warnings
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build timings.json from the audio script and segment MP3s"
+    )
+    parser.add_argument(
+        "script",
+        help="audio_script.json (list of {id, text}); defines segment order"
+    )
+    parser.add_argument(
+        "audio_dir",
+        help="Directory containing <id>.mp3 for each segment"
+    )
+    parser.add_argument(
+        "--output",
+        help=f"Where to write timings (default: <audio_dir>/{TIMINGS_FILENAME})"
+    )
+    parser.add_argument(
+        "--concat",
+        help="Also write an ffmpeg concat list in script order"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        timings, warnings = generate_timings(args.script, args.audio_dir, args.output, args.concat)
+    except (ValidationError, ExternalServiceError) as e:
+        for line in str(e).splitlines():
+            print(f"  ✗ {line}")
+        sys.exit(1)
+
+    for w in warnings:
+        print(f"  ⚠ {w}")
+
+    total = timings[-1]["endTime"] if timings else 0.0
+    print(f"✓ Timings: {len(timings)} segments, {total:.2f}s total")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
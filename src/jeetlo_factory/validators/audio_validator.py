@@ -3,18 +3,39 @@ Audio Validator
 ===============
 
 Validates audio files and scripts:
-1. Audio duration matches timings.json
+1. Audio duration matches timings.json - in total, and per segment
+   boundary when numpy is installed (qa/audio.py)
 2. Combined audio exists
 3. All segment files exist
 4. Script follows pronunciation rules
+
+timings.json is read and parsed once; every check works from that model.
+Pronunciation is checked per segment over the spoken ``text`` only (not
+ids, file names or JSON keys), with results cached by text so a segment
+shared between the TTS script and timings.json - or between reels in one
+CI run - is checked once. The combined audio's duration comes from the
+manifest's audio step when the file is the one that step recorded (same
+size and SHA256), so ffprobe only runs for audio changed since.
 """
 
 import json
+import re
 import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from .pronunciation_validator import PronunciationValidator
+from ..exceptions import ExternalServiceError, ManifestError
+from ..manifest import Manifest, get_file_hash
+
+
+TIMINGS_FILENAME = "timings.json"
+COMBINED_AUDIO_FILENAME = "combined_audio.mp3"
+DURATION_TOLERANCE = 1.0
+
+# "text": "..." / text: '...' entries in a generated TTS script
+SCRIPT_TEXT_PATTERN = re.compile(r"""["']?text["']?\s*:\s*("(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')""")
 
 
 def get_audio_duration(filepath: str) -> float:
@@ -31,10 +52,44 @@ def get_audio_duration(filepath: str) -> float:
             text=True
         )
         return float(result.stdout.strip())
-    except (ValueError, subprocess.SubprocessError):
+    except (ValueError, OSError, subprocess.SubprocessError):
         return 0.0
 
 
+def audio_file_stamp(filepath: str) -> Dict[str, Any]:
+    """
+    Duration plus the size and SHA256 of the file it was measured on, for
+    the audio step's metadata. Content rather than mtime, so the stamp
+    still matches in a fresh clone or CI checkout.
+    """
+    return {
+        "duration": get_audio_duration(filepath),
+        "size": Path(filepath).stat().st_size,
+        "sha256": get_file_hash(filepath)
+    }
+
+
+@lru_cache(maxsize=4096)
+def check_segment_text(text: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Pronunciation (errors, warnings) for one segment's text, cached by text."""
+    _, errors, warnings = PronunciationValidator(text).validate()
+    return tuple(errors), tuple(warnings)
+
+
+def script_texts(content: str) -> List[str]:
+    """Spoken text of each segment in a TTS script (JS/JSON source)."""
+    texts = []
+    for match in SCRIPT_TEXT_PATTERN.finditer(content):
+        body = match.group(1)[1:-1]
+        if match.group(1).startswith("'"):
+            body = body.replace("\\'", "'").replace('"', '\\"')
+        try:
+            texts.append(json.loads(f'"{body}"'))
+        except ValueError:
+            texts.append(body)
+    return texts
+
+
 class AudioValidator:
     """Validates audio files and configuration."""
 
@@ -43,6 +98,7 @@ class AudioValidator:
         self.audio_dir = self.reel_path / "audio"
         self.errors: List[str] = []
         self.warnings: List[str] = []
+        self.timings: Optional[List[Dict[str, Any]]] = None
 
     def validate(self) -> Tuple[bool, List[str], List[str]]:
         """
@@ -55,7 +111,7 @@ class AudioValidator:
         if self.errors:
             return False, self.errors, self.warnings
 
-        self._check_timings_json()
+        self.timings = self._load_timings()
         self._check_combined_audio()
         self._check_segment_files()
         self._check_script_pronunciation()
@@ -69,101 +125,139 @@ class AudioValidator:
                 f"AUDIO ERROR: No audio directory found at {self.audio_dir}"
             )
 
-    def _check_timings_json(self):
-        """Check timings.json exists and is valid."""
-        timings_path = self.audio_dir / "timings.json"
+    def _load_timings(self) -> Optional[List[Dict[str, Any]]]:
+        """Read and check timings.json; None if it is missing or unusable."""
+        timings_path = self.audio_dir / TIMINGS_FILENAME
         if not timings_path.exists():
             self.errors.append("AUDIO ERROR: No timings.json found")
-            return
+            return None
 
         try:
             with open(timings_path, "r") as f:
                 timings = json.load(f)
-
-            if not isinstance(timings, list):
-                self.errors.append("AUDIO ERROR: timings.json must be a list")
-                return
-
-            for i, segment in enumerate(timings):
-                required = ["id", "file", "duration"]
-                for field in required:
-                    if field not in segment:
-                        self.errors.append(
-                            f"AUDIO ERROR: Segment {i} missing required field: {field}"
-                        )
-
         except json.JSONDecodeError as e:
             self.errors.append(f"AUDIO ERROR: Invalid timings.json: {e}")
+            return None
+
+        if not isinstance(timings, list):
+            self.errors.append("AUDIO ERROR: timings.json must be a list")
+            return None
+
+        for i, segment in enumerate(timings):
+            if not isinstance(segment, dict):
+                self.errors.append(f"AUDIO ERROR: Segment {i} is not an object")
+                return None
+            for field in ("id", "file", "duration"):
+                if field not in segment:
+                    self.errors.append(
+                        f"AUDIO ERROR: Segment {i} missing required field: {field}"
+                    )
+        return timings
+
+    def _audio_step_metadata(self) -> Dict[str, Any]:
+        """Metadata of the manifest's audio step, if there is one."""
+        try:
+            step = Manifest.load(str(self.reel_path)).get_step("audio")
+        except (ManifestError, KeyError):
+            return {}
+        return (step or {}).get("metadata") or {}
+
+    def _combined_duration(self, combined: Path, recorded: Dict[str, Any]) -> float:
+        """Duration recorded by the audio step if the file is unchanged, else ffprobe."""
+        stamp = recorded.get("combined_audio") or {}
+        if (
+            "duration" in stamp and "sha256" in stamp
+            and stamp.get("size") == combined.stat().st_size
+            and stamp["sha256"] == get_file_hash(str(combined))
+        ):
+            return float(stamp["duration"])
+        return get_audio_duration(str(combined))
 
     def _check_combined_audio(self):
         """Check combined audio exists and duration matches."""
-        combined = self.audio_dir / "combined_audio.mp3"
+        combined = self.audio_dir / COMBINED_AUDIO_FILENAME
         if not combined.exists():
             self.errors.append("AUDIO ERROR: No combined_audio.mp3 found")
             return
+        if self.timings is None:
+            return
 
-        timings_path = self.audio_dir / "timings.json"
-        if timings_path.exists():
-            try:
-                with open(timings_path, "r") as f:
-                    timings = json.load(f)
+        recorded = self._audio_step_metadata()
+        segment_count = recorded.get("segment_count")
+        if segment_count is not None and segment_count != len(self.timings):
+            self.warnings.append(
+                f"WARNING: timings.json has {len(self.timings)} segments, "
+                f"the audio step recorded {segment_count}"
+            )
 
-                expected_duration = sum(s.get("duration", 0) for s in timings)
-                actual_duration = get_audio_duration(str(combined))
+        try:
+            expected_duration = sum(float(s.get("duration", 0)) for s in self.timings)
+        except (TypeError, ValueError):
+            self.errors.append("AUDIO ERROR: timings.json has a non-numeric duration")
+            return
+        actual_duration = self._combined_duration(combined, recorded)
 
-                if abs(actual_duration - expected_duration) > 1.0:
-                    self.errors.append(
-                        f"AUDIO ERROR: Combined audio duration ({actual_duration:.2f}s) "
-                        f"doesn't match timings ({expected_duration:.2f}s)"
-                    )
-            except (json.JSONDecodeError, KeyError):
-                pass
+        if abs(actual_duration - expected_duration) > DURATION_TOLERANCE:
+            self.errors.append(
+                f"AUDIO ERROR: Combined audio duration ({actual_duration:.2f}s) "
+                f"doesn't match timings ({expected_duration:.2f}s)"
+            )
+            return
 
-    def _check_segment_files(self):
-        """Check all segment files exist."""
-        timings_path = self.audio_dir / "timings.json"
-        if not timings_path.exists():
+        self._check_segment_sync(combined)
+
+    def _check_segment_sync(self, combined: Path):
+        """Check each segment boundary against the pauses in the combined audio."""
+        try:
+            # Imported here: the per-segment check needs numpy (jeetlo-factory[qa])
+            from ..qa.audio import SegmentTimingVerifier
+        except ImportError:
             return
 
         try:
-            with open(timings_path, "r") as f:
-                timings = json.load(f)
+            _, errors, warnings = SegmentTimingVerifier(str(combined), self.timings).run()
+        except (ExternalServiceError, TypeError, ValueError) as e:
+            self.warnings.append(f"WARNING: Segment timings not verified: {e}")
+            return
+        self.errors.extend(errors)
+        self.warnings.extend(warnings)
 
-            for segment in timings:
-                segment_file = self.audio_dir / segment.get("file", "")
-                if not segment_file.exists():
-                    self.errors.append(
-                        f"AUDIO ERROR: Segment file missing: {segment.get('file')}"
-                    )
-        except json.JSONDecodeError:
-            pass
+    def _check_segment_files(self):
+        """Check all segment files exist."""
+        for segment in self.timings or []:
+            segment_file = self.audio_dir / str(segment.get("file", ""))
+            if not segment_file.is_file():
+                self.errors.append(
+                    f"AUDIO ERROR: Segment file missing: {segment.get('file')}"
+                )
 
     def _check_script_pronunciation(self):
-        """Validate pronunciation in the script."""
-        # Check generate-audio-sdk.js
-        script_files = list(self.reel_path.glob("generate-audio*.js"))
-
-        for script_file in script_files:
+        """Validate pronunciation of every segment's spoken text."""
+        segments: List[Tuple[str, str]] = []
+        for segment in self.timings or []:
+            if isinstance(segment.get("text"), str):
+                segments.append((f"segment '{segment.get('id', '?')}'", segment["text"]))
+
+        # The TTS script (generate-audio-sdk.js) may hold text timings.json lacks
+        seen = {text for _, text in segments}
+        for script_file in sorted(self.reel_path.glob("generate-audio*.js")):
             with open(script_file, "r") as f:
-                content = f.read()
-
-            validator = PronunciationValidator(content)
-            is_valid, errors, warnings = validator.validate()
-
-            self.errors.extend(errors)
-            self.warnings.extend(warnings)
-
-        # Also check timings.json for text content
-        timings_path = self.audio_dir / "timings.json"
-        if timings_path.exists():
-            with open(timings_path, "r") as f:
-                content = f.read()
-
-            validator = PronunciationValidator(content)
-            is_valid, errors, warnings = validator.validate()
-
-            self.errors.extend(errors)
-            self.warnings.extend(warnings)
+                for text in script_texts(f.read()):
+                    if text not in seen:
+                        seen.add(text)
+                        segments.append((script_file.name, text))
+
+        errors: Dict[str, None] = {}
+        warnings: Dict[str, None] = {}
+        for source, text in segments:
+            segment_errors, segment_warnings = check_segment_text(text)
+            for e in segment_errors:
+                errors[f"{e} ({source})"] = None
+            for w in segment_warnings:
+                warnings[f"{w} ({source})"] = None
+
+        self.errors.extend(errors)
+        self.warnings.extend(warnings)
 
 
 def validate_audio(reel_path: str) -> Tuple[bool, List[str], List[str]]:
@@ -7,6 +7,7 @@ Validates video files and reel code:
 2. Video resolution is correct (1080x1920)
 3. Reel code follows text language rules
 4. Final video exists
+5. No overlapping or out-of-frame text in the layout log
 """
 
 import subprocess
@@ -14,6 +15,7 @@ from pathlib import Path
 from typing import List, Tuple, Dict, Any
 
 from .text_validator import TextValidator
+from ..layout import LayoutChecker, LAYOUT_LOG_FILENAME
 
 
 def get_video_info(filepath: str) -> Dict[str, Any]:
@@ -74,6 +76,7 @@ class VideoValidator:
         self._check_video_resolution()
         self._check_duration_sync()
         self._check_reel_code()
+        self._check_layout_log()
 
         return len(self.errors) == 0, self.errors, self.warnings
 
@@ -152,6 +155,18 @@ class VideoValidator:
         self.errors.extend(errors)
         self.warnings.extend(warnings)
 
+    def _check_layout_log(self):
+        """Check recorded layout for overlapping or out-of-frame text."""
+        layout_log = self.reel_path / LAYOUT_LOG_FILENAME
+        if not layout_log.exists():
+            return  # Reels rendered before layout logging have none
+
+        checker = LayoutChecker(str(layout_log))
+        is_valid, errors, warnings = checker.validate()
+
+        self.errors.extend(errors)
+        self.warnings.extend(warnings)
+
 
 def validate_video(reel_path: str) -> Tuple[bool, List[str], List[str]]:
     """Validate video for a reel."""